@@ -10,10 +10,10 @@ from crispy_forms.templatetags.crispy_forms_filters import as_crispy_field
 from django.contrib.humanize.templatetags.humanize import intcomma, ordinal
 from django.templatetags.static import static
 from django.urls import reverse
-from jinja2 import Environment
+from jinja2 import Environment, Template
 from markupsafe import Markup
 
-from library.utils import oxford_comma, round_trunc
+from library.utils import metrics, oxford_comma, round_trunc
 
 V = TypeVar("V")
 
@@ -44,8 +44,15 @@ def groupby_date(
     ]
 
 
+class TimedTemplate(Template):
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        with metrics.timed("template"):
+            return super().render(*args, **kwargs)
+
+
 def environment(**options: Any) -> Environment:
     env = Environment(**options, trim_blocks=True, lstrip_blocks=True)  # noqa: S701
+    env.template_class = TimedTemplate
 
     env.globals.update(
         {
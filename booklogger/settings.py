@@ -53,6 +53,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "library.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -112,6 +113,20 @@ DATABASES = {
     },
 }
 
+# shared by every process, so what one invalidates is gone for all of them
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / "db/cache",
+    },
+}
+
+# responses from Goodreads, Google Books and Verso; see library/utils/http.py
+HTTP_CACHE_PATH = BASE_DIR / "db/http_cache.sqlite3"
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
+# throttle requests to each of those hosts; see http.RATES
+HTTP_RATE_LIMITS = True
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
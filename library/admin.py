@@ -5,6 +5,7 @@ from .models import (
     Author,
     Book,
     BookAuthor,
+    EnrichmentJob,
     LogEntry,
     ReadingList,
     ReadingListEntry,
@@ -68,6 +69,13 @@ class BookAdmin(admin.ModelAdmin[Book]):
     ]
 
 
+class EnrichmentJobAdmin(admin.ModelAdmin[EnrichmentJob]):
+    autocomplete_fields = ["book"]
+    list_display = ("book", "status", "attempts", "run_after", "modified_date")
+    list_filter = ("status",)
+    readonly_fields = ("created_date", "modified_date")
+
+
 class ReadingListEntryInline(admin.TabularInline[ReadingListEntry, Book]):
     model = ReadingListEntry
     autocomplete_fields = ("book",)
@@ -83,6 +91,7 @@ admin.site.register(ApiKey, ApiKeyAdmin)
 admin.site.register(Author, AuthorAdmin)
 admin.site.register(Book, BookAdmin)
 admin.site.register(BookAuthor)
+admin.site.register(EnrichmentJob, EnrichmentJobAdmin)
 admin.site.register(LogEntry, LogEntryAdmin)
 admin.site.register(Tag)
 admin.site.register(ReadingList, ReadingListAdmin)
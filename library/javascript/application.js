@@ -1,8 +1,10 @@
 import { Application } from '@hotwired/stimulus';
 
 import BookController from './controllers/book_controller';
+import ImportProgressController from './controllers/import_progress_controller';
 import InfiniteScrollController from './controllers/infinite_scroll_controller';
 
 window.Stimulus = Application.start();
 Stimulus.register('book', BookController);
+Stimulus.register('import-progress', ImportProgressController);
 Stimulus.register('infinite-scroll', InfiniteScrollController);
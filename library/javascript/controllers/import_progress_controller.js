@@ -0,0 +1,58 @@
+import { Controller } from '@hotwired/stimulus';
+
+export default class extends Controller {
+  static targets = ['bar', 'summary', 'errors'];
+  static values = {
+    url: String,
+    interval: { type: Number, default: 2000 }
+  };
+
+  connect() {
+    this.poll();
+  }
+
+  disconnect() {
+    clearTimeout(this.timeout);
+  }
+
+  async poll() {
+    const response = await fetch(this.urlValue);
+    if (!response.ok) {
+      this.schedule();
+      return;
+    }
+
+    const progress = await response.json();
+    const finished = progress.done + progress.failed;
+    this.barTarget.style.width = `${
+      (finished / Math.max(progress.total, 1)) * 100
+    }%`;
+
+    let summary = `Imported ${progress.done} of ${progress.total} books`;
+    if (progress.failed) {
+      summary += `, ${progress.failed} failed`;
+    }
+    if (progress.records_per_second) {
+      summary += ` (${progress.records_per_second} a second)`;
+    }
+    this.summaryTarget.textContent = summary;
+
+    this.errorsTarget.replaceChildren(
+      ...progress.errors.map((error) => {
+        const item = document.createElement('li');
+        item.textContent = `${error.title}: ${error.error}`;
+        return item;
+      })
+    );
+
+    if (progress.status === 'done') {
+      this.element.classList.replace('alert-info', 'alert-success');
+    } else {
+      this.schedule();
+    }
+  }
+
+  schedule() {
+    this.timeout = setTimeout(() => this.poll(), this.intervalValue);
+  }
+}
@@ -3,12 +3,16 @@ import { Controller } from '@hotwired/stimulus';
 export default class extends Controller {
   static values = {
     url: String,
-    year: Number
+    year: Number,
+    cursor: String
   };
 
   async connect() {
-    const year = this.yearValue;
-    const url = this.urlValue;
+    const url = new URL(this.urlValue, window.location.href);
+    if (this.cursorValue) {
+      // the rest of a year too long for one page
+      url.searchParams.set('after', this.cursorValue);
+    }
     const response = await fetch(url);
 
     if (response.ok) {
@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from library.utils import export
+
+
+class Command(BaseCommand):
+    help = "Write the whole library out as newline-delimited JSON"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "-o",
+            "--output",
+            help="file to write to, rather than stdout",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="gzip the output; implied by an output file ending in .gz",
+        )
+
+    def handle(self, *_args: str, **options: Any) -> None:
+        output = options["output"]
+        compress = options["gzip"] or bool(output and output.endswith(".gz"))
+
+        if not output:
+            for chunk in export.stream(compress):
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        with Path(output).open("wb") as stream:
+            for chunk in export.stream(compress):
+                stream.write(chunk)
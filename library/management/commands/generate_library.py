@@ -0,0 +1,38 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Fill the database with a synthetic library, for benchmarking"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "-n",
+            "--books",
+            type=int,
+            default=1000,
+            help="how many books to generate",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="random seed, so the same library can be generated again",
+        )
+
+    def handle(self, *_args: str, **options: int) -> None:
+        # faker is only in requirements-dev.txt
+        try:
+            from library.utils import synthetic
+        except ModuleNotFoundError as error:
+            if error.name != "faker":
+                raise
+            msg = "generating a library needs faker, from requirements-dev.txt"
+            raise CommandError(msg) from error
+
+        counts = synthetic.generate(options["books"], options["seed"])
+        for name, count in counts.items():
+            logger.warning("created %s %s", count, name.replace("_", " "))
@@ -0,0 +1,25 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from library.models import Book
+from library.utils import search_index
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for all books"  # noqa: A003
+
+    def handle(self, *_args: str, **_options: str) -> None:
+        if not search_index.fts5_supported():
+            logger.warning("full-text search is not supported by this database")
+            return
+
+        search_index.create_table()
+        search_index.rebuild(
+            Book.objects.select_related("first_author").prefetch_related(
+                "additional_authors", "tags"
+            )
+        )
+        logger.warning("indexed %s books", Book.objects.count())
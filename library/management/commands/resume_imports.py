@@ -0,0 +1,15 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from library.models import ImportJob
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Finish bulk imports which were interrupted, e.g. by a restart"  # noqa: A003
+
+    def handle(self, *_args: str, **_options: str) -> None:
+        count = ImportJob.objects.resume()
+        logger.warning("resumed %s imports", count)
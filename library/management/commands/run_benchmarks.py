@@ -0,0 +1,63 @@
+import json
+import logging
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from library.utils import benchmark
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Time the library's hot paths and save the results as JSON"  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "names",
+            nargs="*",
+            metavar="benchmark",
+            help=f"benchmarks to run (default all: {', '.join(benchmark.BENCHMARKS)})",
+        )
+        parser.add_argument(
+            "-r",
+            "--repeat",
+            type=int,
+            default=5,
+            help="how many times to run each benchmark",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            type=Path,
+            help="file to write the results to",
+        )
+        parser.add_argument(
+            "-c",
+            "--compare",
+            type=Path,
+            help="results of an earlier run to compare against",
+        )
+
+    def handle(self, *_args: str, **options: list[str] | int | Path | None) -> None:
+        names = options["names"] or list(benchmark.BENCHMARKS)
+        if unknown := set(names) - set(benchmark.BENCHMARKS):  # type: ignore[arg-type]
+            msg = f"unknown benchmarks: {', '.join(sorted(unknown))}"
+            raise CommandError(msg)
+
+        results = benchmark.run(names, options["repeat"])  # type: ignore[arg-type]
+        for name, result in results["results"].items():
+            logger.warning(
+                "%s: %sms median, %s queries",
+                name,
+                result["median_ms"],
+                result["queries"],
+            )
+
+        if isinstance(output := options["output"], Path):
+            output.write_text(json.dumps(results, indent=2))
+
+        if isinstance(previous := options["compare"], Path):
+            changes = benchmark.compare(json.loads(previous.read_text()), results)
+            for name, ratio in changes.items():
+                logger.warning("%s: %sx previous median", name, ratio)
@@ -0,0 +1,65 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from library.models import EnrichmentJob, ImportJob, StatisticsReport
+from library.utils import http, lookups
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (  # noqa: A003
+        "Fetch missing book metadata from Goodreads, Google Books and Verso, "
+        "regenerate out of date statistics reports and finish interrupted imports"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            default=False,
+            help="exit once there are no jobs ready to run",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=5.0,
+            help="seconds to wait when there are no jobs ready to run",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=lookups.WORKERS,
+            help="how many books to look up at once",
+        )
+        parser.add_argument(
+            "--status",
+            action="store_true",
+            default=False,
+            help="show how many jobs are in each state and exit",
+        )
+
+    def handle(self, *_args: str, **options: bool | float | int) -> None:
+        if options["status"]:
+            for status, count in sorted(EnrichmentJob.objects.counts().items()):
+                logger.warning("%s: %s", status, count)
+            return
+
+        while True:
+            # bulk imports run in the web process, which may have restarted
+            if count := ImportJob.objects.resume():
+                logger.info("resumed %s imports", count)
+            if years := StatisticsReport.objects.regenerate_dirty():
+                logger.info("regenerated statistics for %s", years)
+
+            if jobs := EnrichmentJob.objects.run_batch(int(options["workers"])):
+                for job in jobs:
+                    logger.info("enriched %s: %s", job.book, job.status)
+                continue
+
+            if options["once"]:
+                logger.info("http cache: %s", http.cache_stats())
+                return
+            time.sleep(float(options["sleep"]))
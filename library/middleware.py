@@ -0,0 +1,48 @@
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+
+from library.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def _time_query(
+    execute: Callable[..., Any],
+    sql: str,
+    params: Any,
+    many: bool,  # noqa: FBT001
+    context: dict[str, Any],
+) -> Any:
+    with metrics.timed("sql"):
+        return execute(sql, params, many, context)
+
+
+class RequestMetricsMiddleware:
+    # records query count and time spent in SQL, templates and outgoing HTTP
+    # for each request; library.views.metrics shows this worker's recent ones
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        metrics.start()
+        status = 500
+        try:
+            with connection.execute_wrapper(_time_query):
+                response = self.get_response(request)
+            status = response.status_code
+        finally:
+            match = request.resolver_match
+            sample = metrics.finish(
+                method=request.method,
+                path=request.path,
+                view=match.view_name if match else None,
+                status=status,
+            )
+            logger.info("request %s", json.dumps(sample))
+
+        return response
@@ -5,64 +5,130 @@ import django.db.models.deletion
 
 
 class Migration(migrations.Migration):
-
     initial = True
 
-    dependencies = [
-    ]
+    dependencies = []
 
     operations = [
         migrations.CreateModel(
-            name='Author',
+            name="Author",
             fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('surname', models.CharField(max_length=255)),
-                ('forenames', models.CharField(max_length=255)),
-                ('gender', models.IntegerField(choices=[(0, 'Unknown'), (1, 'Male'), (2, 'Female'), (3, 'Organization')], default=0)),
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("surname", models.CharField(max_length=255)),
+                ("forenames", models.CharField(max_length=255)),
+                (
+                    "gender",
+                    models.IntegerField(
+                        choices=[
+                            (0, "Unknown"),
+                            (1, "Male"),
+                            (2, "Female"),
+                            (3, "Organization"),
+                        ],
+                        default=0,
+                    ),
+                ),
             ],
         ),
         migrations.CreateModel(
-            name='Book',
+            name="Book",
             fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('title', models.CharField(max_length=255)),
-                ('subtitle', models.CharField(blank=True, max_length=255)),
-                ('first_published', models.PositiveSmallIntegerField(blank=True, null=True)),
-                ('language', models.CharField(default='en', max_length=2)),
-                ('edition_published', models.PositiveSmallIntegerField(blank=True, null=True)),
-                ('publisher', models.CharField(blank=True, max_length=255)),
-                ('edition_format', models.CharField(blank=True, choices=[(1, 'Paperback'), (2, 'Hardback'), (3, 'Ebook'), (4, 'Web')], max_length=255)),
-                ('edition_number', models.PositiveSmallIntegerField(blank=True, null=True)),
-                ('page_count', models.PositiveSmallIntegerField(blank=True, null=True)),
-                ('goodreads_id', models.CharField(blank=True, max_length=255)),
-                ('google_books_id', models.CharField(blank=True, max_length=255)),
-                ('isbn', models.CharField(blank=True, max_length=13)),
-                ('asin', models.CharField(blank=True, max_length=255)),
-                ('edition_language', models.CharField(blank=True, max_length=2)),
-                ('edition_title', models.CharField(blank=True, max_length=255)),
-                ('edition_subtitle', models.CharField(blank=True, max_length=255)),
-                ('owned', models.BooleanField(default=False)),
-                ('acquired_date', models.DateField(blank=True, null=True)),
-                ('alienated_date', models.DateField(blank=True, null=True)),
-                ('was_borrowed', models.BooleanField(default=False)),
-                ('borrowed_from', models.CharField(blank=True, max_length=255)),
-                ('image_url', models.URLField(blank=True)),
-                ('publisher_url', models.URLField(blank=True)),
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("subtitle", models.CharField(blank=True, max_length=255)),
+                (
+                    "first_published",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                ("language", models.CharField(default="en", max_length=2)),
+                (
+                    "edition_published",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                ("publisher", models.CharField(blank=True, max_length=255)),
+                (
+                    "edition_format",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            (1, "Paperback"),
+                            (2, "Hardback"),
+                            (3, "Ebook"),
+                            (4, "Web"),
+                        ],
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "edition_number",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                ("page_count", models.PositiveSmallIntegerField(blank=True, null=True)),
+                ("goodreads_id", models.CharField(blank=True, max_length=255)),
+                ("google_books_id", models.CharField(blank=True, max_length=255)),
+                ("isbn", models.CharField(blank=True, max_length=13)),
+                ("asin", models.CharField(blank=True, max_length=255)),
+                ("edition_language", models.CharField(blank=True, max_length=2)),
+                ("edition_title", models.CharField(blank=True, max_length=255)),
+                ("edition_subtitle", models.CharField(blank=True, max_length=255)),
+                ("owned", models.BooleanField(default=False)),
+                ("acquired_date", models.DateField(blank=True, null=True)),
+                ("alienated_date", models.DateField(blank=True, null=True)),
+                ("was_borrowed", models.BooleanField(default=False)),
+                ("borrowed_from", models.CharField(blank=True, max_length=255)),
+                ("image_url", models.URLField(blank=True)),
+                ("publisher_url", models.URLField(blank=True)),
             ],
         ),
         migrations.CreateModel(
-            name='BookAuthor',
+            name="BookAuthor",
             fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('role', models.CharField(max_length=255)),
-                ('order', models.PositiveSmallIntegerField(blank=True, null=True)),
-                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='library.Author')),
-                ('book', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='library.Book')),
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("role", models.CharField(max_length=255)),
+                ("order", models.PositiveSmallIntegerField(blank=True, null=True)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="library.Author"
+                    ),
+                ),
+                (
+                    "book",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="library.Book"
+                    ),
+                ),
             ],
         ),
         migrations.AddField(
-            model_name='book',
-            name='authors',
-            field=models.ManyToManyField(related_name='books', through='library.BookAuthor', to='library.Author'),
+            model_name="book",
+            name="authors",
+            field=models.ManyToManyField(
+                related_name="books", through="library.BookAuthor", to="library.Author"
+            ),
         ),
     ]
@@ -4,15 +4,18 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0001_initial'),
+        ("library", "0001_initial"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='book',
-            name='edition_format',
-            field=models.IntegerField(blank=True, choices=[(1, 'Paperback'), (2, 'Hardback'), (3, 'Ebook'), (4, 'Web')], max_length=255),
+            model_name="book",
+            name="edition_format",
+            field=models.IntegerField(
+                blank=True,
+                choices=[(1, "Paperback"), (2, "Hardback"), (3, "Ebook"), (4, "Web")],
+                max_length=255,
+            ),
         ),
     ]
@@ -5,14 +5,21 @@ import django.db.models.functions.text
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0003_auto_20200120_1743'),
+        ("library", "0003_auto_20200120_1743"),
     ]
 
     operations = [
         migrations.AlterModelOptions(
-            name='book',
-            options={'ordering': [django.db.models.functions.text.Lower('authors__surname'), django.db.models.functions.text.Lower('authors__forenames'), 'series', 'series_order', 'title']},
+            name="book",
+            options={
+                "ordering": [
+                    django.db.models.functions.text.Lower("authors__surname"),
+                    django.db.models.functions.text.Lower("authors__forenames"),
+                    "series",
+                    "series_order",
+                    "title",
+                ]
+            },
         ),
     ]
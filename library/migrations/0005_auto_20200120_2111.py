@@ -5,15 +5,18 @@ import django.db.models.functions.text
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0004_auto_20200120_2111'),
+        ("library", "0004_auto_20200120_2111"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='book',
-            name='edition_format',
-            field=models.IntegerField(blank=True, choices=[(1, 'Paperback'), (2, 'Hardback'), (3, 'Ebook'), (4, 'Web')], null=True),
+            model_name="book",
+            name="edition_format",
+            field=models.IntegerField(
+                blank=True,
+                choices=[(1, "Paperback"), (2, "Hardback"), (3, "Ebook"), (4, "Web")],
+                null=True,
+            ),
         ),
     ]
@@ -4,14 +4,13 @@ from django.db import migrations
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0005_auto_20200120_2111'),
+        ("library", "0005_auto_20200120_2111"),
     ]
 
     operations = [
         migrations.AlterUniqueTogether(
-            name='bookauthor',
-            unique_together={('author', 'book')},
+            name="bookauthor",
+            unique_together={("author", "book")},
         ),
     ]
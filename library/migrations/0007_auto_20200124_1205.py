@@ -4,15 +4,14 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0006_auto_20200123_1620'),
+        ("library", "0006_auto_20200123_1620"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='bookauthor',
-            name='role',
+            model_name="bookauthor",
+            name="role",
             field=models.CharField(blank=True, max_length=255, null=True),
         ),
     ]
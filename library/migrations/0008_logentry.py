@@ -6,21 +6,50 @@ import django.db.models.deletion
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0007_auto_20200124_1205'),
+        ("library", "0007_auto_20200124_1205"),
     ]
 
     operations = [
         migrations.CreateModel(
-            name='LogEntry',
+            name="LogEntry",
             fields=[
-                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('start_date', models.DateField(blank=True, default=datetime.date.today, null=True)),
-                ('end_date', models.DateField(blank=True, null=True)),
-                ('start_precision', models.PositiveSmallIntegerField(choices=[(0, 'Day'), (1, 'Month'), (2, 'Year')], default=0)),
-                ('end_precision', models.PositiveSmallIntegerField(choices=[(0, 'Day'), (1, 'Month'), (2, 'Year')], default=0)),
-                ('book', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='log_entries', to='library.Book')),
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "start_date",
+                    models.DateField(
+                        blank=True, default=datetime.date.today, null=True
+                    ),
+                ),
+                ("end_date", models.DateField(blank=True, null=True)),
+                (
+                    "start_precision",
+                    models.PositiveSmallIntegerField(
+                        choices=[(0, "Day"), (1, "Month"), (2, "Year")], default=0
+                    ),
+                ),
+                (
+                    "end_precision",
+                    models.PositiveSmallIntegerField(
+                        choices=[(0, "Day"), (1, "Month"), (2, "Year")], default=0
+                    ),
+                ),
+                (
+                    "book",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="log_entries",
+                        to="library.Book",
+                    ),
+                ),
             ],
         ),
     ]
@@ -4,15 +4,14 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0008_logentry'),
+        ("library", "0008_logentry"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='book',
-            name='want_to_read',
+            model_name="book",
+            name="want_to_read",
             field=models.BooleanField(default=True),
         ),
     ]
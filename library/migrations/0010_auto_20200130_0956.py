@@ -5,34 +5,38 @@ import django.db.models.functions.text
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0009_book_want_to_read'),
+        ("library", "0009_book_want_to_read"),
     ]
 
     operations = [
         migrations.AlterModelOptions(
-            name='author',
-            options={'ordering': [django.db.models.functions.text.Lower('surname'), django.db.models.functions.text.Lower('forenames')]},
+            name="author",
+            options={
+                "ordering": [
+                    django.db.models.functions.text.Lower("surname"),
+                    django.db.models.functions.text.Lower("forenames"),
+                ]
+            },
         ),
         migrations.AlterField(
-            model_name='author',
-            name='forenames',
+            model_name="author",
+            name="forenames",
             field=models.CharField(db_index=True, max_length=255),
         ),
         migrations.AlterField(
-            model_name='author',
-            name='surname',
+            model_name="author",
+            name="surname",
             field=models.CharField(db_index=True, max_length=255),
         ),
         migrations.AlterField(
-            model_name='book',
-            name='title',
+            model_name="book",
+            name="title",
             field=models.CharField(db_index=True, max_length=255),
         ),
         migrations.AlterField(
-            model_name='logentry',
-            name='end_date',
+            model_name="logentry",
+            name="end_date",
             field=models.DateField(blank=True, db_index=True, null=True),
         ),
     ]
@@ -4,14 +4,15 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0010_auto_20200130_0956'),
+        ("library", "0010_auto_20200130_0956"),
     ]
 
     operations = [
         migrations.AddIndex(
-            model_name='author',
-            index=models.Index(fields=['surname', 'forenames'], name='library_aut_surname_f2e10d_idx'),
+            model_name="author",
+            index=models.Index(
+                fields=["surname", "forenames"], name="library_aut_surname_f2e10d_idx"
+            ),
         ),
     ]
@@ -4,20 +4,19 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0011_auto_20200130_1005'),
+        ("library", "0011_auto_20200130_1005"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='book',
-            name='series',
+            model_name="book",
+            name="series",
             field=models.CharField(blank=True, db_index=True, max_length=255),
         ),
         migrations.AlterField(
-            model_name='book',
-            name='series_order',
+            model_name="book",
+            name="series_order",
             field=models.FloatField(blank=True, db_index=True, null=True),
         ),
     ]
@@ -4,14 +4,16 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0013_auto_20200130_1056'),
+        ("library", "0013_auto_20200130_1056"),
     ]
 
     operations = [
         migrations.AddIndex(
-            model_name='book',
-            index=models.Index(fields=['series', 'series_order', 'title'], name='library_boo_series_d99f02_idx'),
+            model_name="book",
+            index=models.Index(
+                fields=["series", "series_order", "title"],
+                name="library_boo_series_d99f02_idx",
+            ),
         ),
     ]
@@ -4,13 +4,13 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
         ("library", "0014_auto_20200130_1446"),
     ]
 
     operations = [
         migrations.AlterModelOptions(
-            name="bookauthor", options={"ordering": ["order"]},
+            name="bookauthor",
+            options={"ordering": ["order"]},
         ),
     ]
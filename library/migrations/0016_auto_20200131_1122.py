@@ -4,20 +4,23 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0015_auto_20200131_1122'),
+        ("library", "0015_auto_20200131_1122"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='bookauthor',
-            name='order',
-            field=models.PositiveSmallIntegerField(blank=True, db_index=True, null=True),
+            model_name="bookauthor",
+            name="order",
+            field=models.PositiveSmallIntegerField(
+                blank=True, db_index=True, null=True
+            ),
         ),
         migrations.AlterField(
-            model_name='bookauthor',
-            name='role',
-            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+            model_name="bookauthor",
+            name="role",
+            field=models.CharField(
+                blank=True, db_index=True, max_length=255, null=True
+            ),
         ),
     ]
@@ -5,20 +5,19 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0016_auto_20200131_1122'),
+        ("library", "0016_auto_20200131_1122"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='logentry',
-            name='progress',
+            model_name="logentry",
+            name="progress",
             field=models.PositiveSmallIntegerField(default=0),
         ),
         migrations.AddField(
-            model_name='logentry',
-            name='progress_date',
+            model_name="logentry",
+            name="progress_date",
             field=models.DateField(db_index=True, default=datetime.date.today),
         ),
     ]
@@ -29,7 +29,6 @@ def move_first_author_to_book_author(apps, schema_editor):
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
         ("library", "0018_pgext_20200202_0845"),
     ]
@@ -48,7 +47,9 @@ class Migration(migrations.Migration):
             },
         ),
         migrations.RenameField(
-            model_name="book", old_name="authors", new_name="additional_authors",
+            model_name="book",
+            old_name="authors",
+            new_name="additional_authors",
         ),
         migrations.AddField(
             model_name="book",
@@ -4,15 +4,14 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0024_auto_20200208_1145'),
+        ("library", "0024_auto_20200208_1145"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='author',
-            name='poc',
+            model_name="author",
+            name="poc",
             field=models.BooleanField(default=False),
         ),
     ]
@@ -2,45 +2,62 @@
 
 from django.db import migrations, models
 
+
 def set_not_null(apps, schema_editor):
     Book = apps.get_model("library", "Book")
     BookAuthor = apps.get_model("library", "BookAuthor")
 
     for book in Book.objects.all():
         if not book.first_author_role:
-            book.first_author_role = ''
+            book.first_author_role = ""
         if not book.edition_format:
             book.edition_format = 0
         book.save()
     for book_author in BookAuthor.objects.all():
         if not book_author.role:
-            book_author.role = ''
+            book_author.role = ""
             book_author.save()
 
+
 def noop_reverse(apps, schema_editor):
     return
 
-class Migration(migrations.Migration):
 
+class Migration(migrations.Migration):
     dependencies = [
-        ('library', '0025_author_poc'),
+        ("library", "0025_author_poc"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='book',
-            name='edition_format',
-            field=models.IntegerField(choices=[(0, 'Unknown'), (1, 'Paperback'), (2, 'Hardback'), (3, 'Ebook'), (4, 'Web')], db_index=True, default=0, null=True),
+            model_name="book",
+            name="edition_format",
+            field=models.IntegerField(
+                choices=[
+                    (0, "Unknown"),
+                    (1, "Paperback"),
+                    (2, "Hardback"),
+                    (3, "Ebook"),
+                    (4, "Web"),
+                ],
+                db_index=True,
+                default=0,
+                null=True,
+            ),
         ),
         migrations.AlterField(
-            model_name='book',
-            name='first_author_role',
-            field=models.CharField(blank=True, db_index=True, default='', max_length=255, null=True),
+            model_name="book",
+            name="first_author_role",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=255, null=True
+            ),
         ),
         migrations.AlterField(
-            model_name='bookauthor',
-            name='role',
-            field=models.CharField(blank=True, db_index=True, default='', max_length=255, null=True),
+            model_name="bookauthor",
+            name="role",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=255, null=True
+            ),
         ),
         migrations.RunPython(set_not_null, noop_reverse),
     ]
@@ -4,25 +4,38 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0027_auto_20200210_0745'),
+        ("library", "0027_auto_20200210_0745"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='book',
-            name='edition_format',
-            field=models.IntegerField(choices=[(0, 'Unknown'), (1, 'Paperback'), (2, 'Hardback'), (3, 'Ebook'), (4, 'Web')], db_index=True, default=0),
+            model_name="book",
+            name="edition_format",
+            field=models.IntegerField(
+                choices=[
+                    (0, "Unknown"),
+                    (1, "Paperback"),
+                    (2, "Hardback"),
+                    (3, "Ebook"),
+                    (4, "Web"),
+                ],
+                db_index=True,
+                default=0,
+            ),
         ),
         migrations.AlterField(
-            model_name='book',
-            name='first_author_role',
-            field=models.CharField(blank=True, db_index=True, default='', max_length=255),
+            model_name="book",
+            name="first_author_role",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=255
+            ),
         ),
         migrations.AlterField(
-            model_name='bookauthor',
-            name='role',
-            field=models.CharField(blank=True, db_index=True, default='', max_length=255),
+            model_name="bookauthor",
+            name="role",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=255
+            ),
         ),
     ]
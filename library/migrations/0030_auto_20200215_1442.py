@@ -4,29 +4,43 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0029_auto_20200213_1228'),
+        ("library", "0029_auto_20200213_1228"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='author',
-            name='single_name',
+            model_name="author",
+            name="single_name",
             field=models.CharField(blank=True, db_index=True, max_length=255),
         ),
         migrations.AlterField(
-            model_name='author',
-            name='forenames',
+            model_name="author",
+            name="forenames",
             field=models.CharField(blank=True, db_index=True, max_length=255),
         ),
         migrations.AlterField(
-            model_name='author',
-            name='surname',
+            model_name="author",
+            name="surname",
             field=models.CharField(blank=True, db_index=True, max_length=255),
         ),
         migrations.AddConstraint(
-            model_name='author',
-            constraint=models.CheckConstraint(check=models.Q(models.Q(('surname', ''), ('forenames', ''), models.Q(_negated=True, single_name='')), models.Q(models.Q(_negated=True, surname=''), models.Q(_negated=True, forenames=''), ('single_name', '')), _connector='OR'), name='surname_and_forenames_or_single_name'),
+            model_name="author",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(
+                        ("surname", ""),
+                        ("forenames", ""),
+                        models.Q(_negated=True, single_name=""),
+                    ),
+                    models.Q(
+                        models.Q(_negated=True, surname=""),
+                        models.Q(_negated=True, forenames=""),
+                        ("single_name", ""),
+                    ),
+                    _connector="OR",
+                ),
+                name="surname_and_forenames_or_single_name",
+            ),
         ),
     ]
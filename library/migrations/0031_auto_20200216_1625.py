@@ -5,18 +5,32 @@ import django.db.models.functions.text
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0030_auto_20200215_1442'),
+        ("library", "0030_auto_20200215_1442"),
     ]
 
     operations = [
         migrations.AlterModelOptions(
-            name='author',
-            options={'ordering': [django.db.models.functions.text.Lower('single_name'), django.db.models.functions.text.Lower('surname'), django.db.models.functions.text.Lower('forenames')]},
+            name="author",
+            options={
+                "ordering": [
+                    django.db.models.functions.text.Lower("single_name"),
+                    django.db.models.functions.text.Lower("surname"),
+                    django.db.models.functions.text.Lower("forenames"),
+                ]
+            },
         ),
         migrations.AlterModelOptions(
-            name='book',
-            options={'ordering': [django.db.models.functions.text.Lower('first_author__single_name'), django.db.models.functions.text.Lower('first_author__surname'), django.db.models.functions.text.Lower('first_author__forenames'), 'series', 'series_order', 'title']},
+            name="book",
+            options={
+                "ordering": [
+                    django.db.models.functions.text.Lower("first_author__single_name"),
+                    django.db.models.functions.text.Lower("first_author__surname"),
+                    django.db.models.functions.text.Lower("first_author__forenames"),
+                    "series",
+                    "series_order",
+                    "title",
+                ]
+            },
         ),
     ]
@@ -4,15 +4,16 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0031_auto_20200216_1625'),
+        ("library", "0031_auto_20200216_1625"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='book',
-            name='editions',
-            field=models.ManyToManyField(related_name='_book_editions_+', to='library.Book'),
+            model_name="book",
+            name="editions",
+            field=models.ManyToManyField(
+                related_name="_book_editions_+", to="library.Book"
+            ),
         ),
     ]
@@ -4,15 +4,16 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0032_book_editions'),
+        ("library", "0032_book_editions"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='book',
-            name='editions',
-            field=models.ManyToManyField(blank=True, related_name='_book_editions_+', to='library.Book'),
+            model_name="book",
+            name="editions",
+            field=models.ManyToManyField(
+                blank=True, related_name="_book_editions_+", to="library.Book"
+            ),
         ),
     ]
@@ -23,7 +23,6 @@ def surname_to_single_name(apps, schema_editor):
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
         ("library", "0033_auto_20200222_1819"),
     ]
@@ -39,10 +38,14 @@ class Migration(migrations.Migration):
             },
         ),
         migrations.RemoveConstraint(
-            model_name="author", name="surname_and_forenames_or_single_name",
+            model_name="author",
+            name="surname_and_forenames_or_single_name",
         ),
         migrations.RunPython(single_name_to_surname, surname_to_single_name),
-        migrations.RemoveField(model_name="author", name="single_name",),
+        migrations.RemoveField(
+            model_name="author",
+            name="single_name",
+        ),
         migrations.AddField(
             model_name="author",
             name="surname_first",
@@ -6,19 +6,28 @@ import django.utils.timezone
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0034_auto_20200223_1219'),
+        ("library", "0034_auto_20200223_1219"),
     ]
 
     operations = [
         migrations.AlterModelOptions(
-            name='book',
-            options={'ordering': [django.db.models.functions.text.Lower('first_author__surname'), django.db.models.functions.text.Lower('first_author__forenames'), 'series', 'series_order', 'title']},
+            name="book",
+            options={
+                "ordering": [
+                    django.db.models.functions.text.Lower("first_author__surname"),
+                    django.db.models.functions.text.Lower("first_author__forenames"),
+                    "series",
+                    "series_order",
+                    "title",
+                ]
+            },
         ),
         migrations.AddField(
-            model_name='book',
-            name='created_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="book",
+            name="created_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
     ]
@@ -4,13 +4,14 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
         ("library", "0035_auto_20200628_1543"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name="book", name="slug", field=models.SlugField(null=True),
+            model_name="book",
+            name="slug",
+            field=models.SlugField(null=True),
         ),
     ]
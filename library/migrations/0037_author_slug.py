@@ -4,15 +4,14 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0036_book_slug'),
+        ("library", "0036_book_slug"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='author',
-            name='slug',
+            model_name="author",
+            name="slug",
             field=models.SlugField(null=True),
         ),
     ]
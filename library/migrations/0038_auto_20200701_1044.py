@@ -4,20 +4,19 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0037_author_slug'),
+        ("library", "0037_author_slug"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='author',
-            name='slug',
-            field=models.SlugField(blank=True, default=''),
+            model_name="author",
+            name="slug",
+            field=models.SlugField(blank=True, default=""),
         ),
         migrations.AlterField(
-            model_name='book',
-            name='slug',
-            field=models.SlugField(blank=True, default=''),
+            model_name="book",
+            name="slug",
+            field=models.SlugField(blank=True, default=""),
         ),
     ]
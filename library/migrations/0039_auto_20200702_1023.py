@@ -4,15 +4,19 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0038_auto_20200701_1044'),
+        ("library", "0038_auto_20200701_1044"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='book',
-            name='additional_authors',
-            field=models.ManyToManyField(blank=True, related_name='additional_authored_books', through='library.BookAuthor', to='library.Author'),
+            model_name="book",
+            name="additional_authors",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="additional_authored_books",
+                through="library.BookAuthor",
+                to="library.Author",
+            ),
         ),
     ]
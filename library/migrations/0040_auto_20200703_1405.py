@@ -4,30 +4,29 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0039_auto_20200702_1023'),
+        ("library", "0039_auto_20200702_1023"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='book',
-            name='ebook_acquired_date',
+            model_name="book",
+            name="ebook_acquired_date",
             field=models.DateField(blank=True, null=True),
         ),
         migrations.AddField(
-            model_name='book',
-            name='ebook_asin',
+            model_name="book",
+            name="ebook_asin",
             field=models.CharField(blank=True, max_length=255),
         ),
         migrations.AddField(
-            model_name='book',
-            name='ebook_isbn',
+            model_name="book",
+            name="ebook_isbn",
             field=models.CharField(blank=True, max_length=13),
         ),
         migrations.AddField(
-            model_name='book',
-            name='has_ebook_edition',
+            model_name="book",
+            name="has_ebook_edition",
             field=models.BooleanField(default=False),
         ),
     ]
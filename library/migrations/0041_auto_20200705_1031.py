@@ -43,7 +43,6 @@ def migrate_backwards(apps, schema_editor):
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
         migrations.swappable_dependency(settings.AUTH_USER_MODEL),
         ("library", "0040_auto_20200703_1405"),
@@ -62,5 +61,8 @@ class Migration(migrations.Migration):
             ),
         ),
         migrations.RunPython(migrate_forwards, migrate_backwards),
-        migrations.RemoveField(model_name="book", name="owned",),
+        migrations.RemoveField(
+            model_name="book",
+            name="owned",
+        ),
     ]
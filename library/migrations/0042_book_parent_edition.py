@@ -5,15 +5,20 @@ import django.db.models.deletion
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0041_auto_20200705_1031'),
+        ("library", "0041_auto_20200705_1031"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='book',
-            name='parent_edition',
-            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='subeditions', to='library.Book'),
+            model_name="book",
+            name="parent_edition",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="subeditions",
+                to="library.Book",
+            ),
         ),
     ]
@@ -4,15 +4,94 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0042_book_parent_edition'),
+        ("library", "0042_book_parent_edition"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='author',
-            name='primary_language',
-            field=models.CharField(choices=[('af', 'Afrikaans'), ('ar', 'Arabic'), ('az', 'Azerbaijani'), ('be', 'Belarusian'), ('bg', 'Bulgarian'), ('bn', 'Bengali'), ('br', 'Breton'), ('bs', 'Bosnian'), ('ca', 'Catalan'), ('cs', 'Czech'), ('cy', 'Welsh'), ('da', 'Danish'), ('de', 'German'), ('el', 'Greek'), ('en', 'English'), ('eo', 'Esperanto'), ('es', 'Spanish'), ('et', 'Estonian'), ('eu', 'Basque'), ('fa', 'Persian'), ('fi', 'Finnish'), ('fr', 'French'), ('fy', 'Frisian'), ('ga', 'Irish'), ('gd', 'Scottish Gaelic'), ('gl', 'Galician'), ('he', 'Hebrew'), ('hi', 'Hindi'), ('hr', 'Croatian'), ('hu', 'Hungarian'), ('hy', 'Armenian'), ('ia', 'Interlingua'), ('id', 'Indonesian'), ('io', 'Ido'), ('is', 'Icelandic'), ('it', 'Italian'), ('ja', 'Japanese'), ('ka', 'Georgian'), ('kk', 'Kazakh'), ('km', 'Khmer'), ('kn', 'Kannada'), ('ko', 'Korean'), ('lb', 'Luxembourgish'), ('lt', 'Lithuanian'), ('lv', 'Latvian'), ('mk', 'Macedonian'), ('ml', 'Malayalam'), ('mn', 'Mongolian'), ('mr', 'Marathi'), ('my', 'Burmese'), ('nb', 'Norwegian Bokmål'), ('ne', 'Nepali'), ('nl', 'Dutch'), ('nn', 'Norwegian Nynorsk'), ('os', 'Ossetic'), ('pa', 'Punjabi'), ('pl', 'Polish'), ('pt', 'Portuguese'), ('ro', 'Romanian'), ('ru', 'Russian'), ('sk', 'Slovak'), ('sl', 'Slovenian'), ('sq', 'Albanian'), ('sr', 'Serbian'), ('sv', 'Swedish'), ('sw', 'Swahili'), ('ta', 'Tamil'), ('te', 'Telugu'), ('th', 'Thai'), ('tr', 'Turkish'), ('tt', 'Tatar'), ('uk', 'Ukrainian'), ('ur', 'Urdu'), ('uz', 'Uzbek'), ('vi', 'Vietnamese')], default='en', max_length=2),
+            model_name="author",
+            name="primary_language",
+            field=models.CharField(
+                choices=[
+                    ("af", "Afrikaans"),
+                    ("ar", "Arabic"),
+                    ("az", "Azerbaijani"),
+                    ("be", "Belarusian"),
+                    ("bg", "Bulgarian"),
+                    ("bn", "Bengali"),
+                    ("br", "Breton"),
+                    ("bs", "Bosnian"),
+                    ("ca", "Catalan"),
+                    ("cs", "Czech"),
+                    ("cy", "Welsh"),
+                    ("da", "Danish"),
+                    ("de", "German"),
+                    ("el", "Greek"),
+                    ("en", "English"),
+                    ("eo", "Esperanto"),
+                    ("es", "Spanish"),
+                    ("et", "Estonian"),
+                    ("eu", "Basque"),
+                    ("fa", "Persian"),
+                    ("fi", "Finnish"),
+                    ("fr", "French"),
+                    ("fy", "Frisian"),
+                    ("ga", "Irish"),
+                    ("gd", "Scottish Gaelic"),
+                    ("gl", "Galician"),
+                    ("he", "Hebrew"),
+                    ("hi", "Hindi"),
+                    ("hr", "Croatian"),
+                    ("hu", "Hungarian"),
+                    ("hy", "Armenian"),
+                    ("ia", "Interlingua"),
+                    ("id", "Indonesian"),
+                    ("io", "Ido"),
+                    ("is", "Icelandic"),
+                    ("it", "Italian"),
+                    ("ja", "Japanese"),
+                    ("ka", "Georgian"),
+                    ("kk", "Kazakh"),
+                    ("km", "Khmer"),
+                    ("kn", "Kannada"),
+                    ("ko", "Korean"),
+                    ("lb", "Luxembourgish"),
+                    ("lt", "Lithuanian"),
+                    ("lv", "Latvian"),
+                    ("mk", "Macedonian"),
+                    ("ml", "Malayalam"),
+                    ("mn", "Mongolian"),
+                    ("mr", "Marathi"),
+                    ("my", "Burmese"),
+                    ("nb", "Norwegian Bokmål"),
+                    ("ne", "Nepali"),
+                    ("nl", "Dutch"),
+                    ("nn", "Norwegian Nynorsk"),
+                    ("os", "Ossetic"),
+                    ("pa", "Punjabi"),
+                    ("pl", "Polish"),
+                    ("pt", "Portuguese"),
+                    ("ro", "Romanian"),
+                    ("ru", "Russian"),
+                    ("sk", "Slovak"),
+                    ("sl", "Slovenian"),
+                    ("sq", "Albanian"),
+                    ("sr", "Serbian"),
+                    ("sv", "Swedish"),
+                    ("sw", "Swahili"),
+                    ("ta", "Tamil"),
+                    ("te", "Telugu"),
+                    ("th", "Thai"),
+                    ("tr", "Turkish"),
+                    ("tt", "Tatar"),
+                    ("uk", "Ukrainian"),
+                    ("ur", "Urdu"),
+                    ("uz", "Uzbek"),
+                    ("vi", "Vietnamese"),
+                ],
+                default="en",
+                max_length=2,
+            ),
         ),
     ]
@@ -4,25 +4,267 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0044_auto_20200710_1517'),
+        ("library", "0044_auto_20200710_1517"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='author',
-            name='primary_language',
-            field=models.CharField(choices=[('af', 'Afrikaans'), ('sq', 'Albanian'), ('ar', 'Arabic'), ('hy', 'Armenian'), ('az', 'Azerbaijani'), ('eu', 'Basque'), ('be', 'Belarusian'), ('bn', 'Bengali'), ('bs', 'Bosnian'), ('br', 'Breton'), ('bg', 'Bulgarian'), ('my', 'Burmese'), ('ca', 'Catalan'), ('zh', 'Chinese'), ('hr', 'Croatian'), ('cs', 'Czech'), ('da', 'Danish'), ('nl', 'Dutch'), ('en', 'English'), ('eo', 'Esperanto'), ('et', 'Estonian'), ('fi', 'Finnish'), ('fr', 'French'), ('fy', 'Frisian'), ('gd', 'Gaelic'), ('gl', 'Galician'), ('ka', 'Georgian'), ('de', 'German'), ('el', 'Greek'), ('he', 'Hebrew'), ('hi', 'Hindi'), ('hu', 'Hungarian'), ('is', 'Icelandic'), ('io', 'Ido'), ('id', 'Indonesian'), ('ia', 'Interlingua'), ('ga', 'Irish'), ('it', 'Italian'), ('ja', 'Japanese'), ('kn', 'Kannada'), ('kk', 'Kazakh'), ('km', 'Khmer'), ('ko', 'Korean'), ('lv', 'Latvian'), ('lt', 'Lithuanian'), ('lb', 'Luxembourgish'), ('mk', 'Macedonian'), ('ml', 'Malayalam'), ('mr', 'Marathi'), ('mn', 'Mongolian'), ('ne', 'Nepali'), ('nb', 'Norwegian'), ('nn', 'Nynorsk'), ('os', 'Ossetic'), ('fa', 'Persian'), ('pl', 'Polish'), ('pt', 'Portuguese'), ('pa', 'Punjabi'), ('ro', 'Romanian'), ('ru', 'Russian'), ('sr', 'Serbian'), ('sk', 'Slovak'), ('sl', 'Slovenian'), ('es', 'Spanish'), ('sw', 'Swahili'), ('sv', 'Swedish'), ('ta', 'Tamil'), ('tt', 'Tatar'), ('te', 'Telugu'), ('th', 'Thai'), ('tr', 'Turkish'), ('uk', 'Ukrainian'), ('ur', 'Urdu'), ('uz', 'Uzbek'), ('vi', 'Vietnamese'), ('cy', 'Welsh')], default='en', max_length=2),
+            model_name="author",
+            name="primary_language",
+            field=models.CharField(
+                choices=[
+                    ("af", "Afrikaans"),
+                    ("sq", "Albanian"),
+                    ("ar", "Arabic"),
+                    ("hy", "Armenian"),
+                    ("az", "Azerbaijani"),
+                    ("eu", "Basque"),
+                    ("be", "Belarusian"),
+                    ("bn", "Bengali"),
+                    ("bs", "Bosnian"),
+                    ("br", "Breton"),
+                    ("bg", "Bulgarian"),
+                    ("my", "Burmese"),
+                    ("ca", "Catalan"),
+                    ("zh", "Chinese"),
+                    ("hr", "Croatian"),
+                    ("cs", "Czech"),
+                    ("da", "Danish"),
+                    ("nl", "Dutch"),
+                    ("en", "English"),
+                    ("eo", "Esperanto"),
+                    ("et", "Estonian"),
+                    ("fi", "Finnish"),
+                    ("fr", "French"),
+                    ("fy", "Frisian"),
+                    ("gd", "Gaelic"),
+                    ("gl", "Galician"),
+                    ("ka", "Georgian"),
+                    ("de", "German"),
+                    ("el", "Greek"),
+                    ("he", "Hebrew"),
+                    ("hi", "Hindi"),
+                    ("hu", "Hungarian"),
+                    ("is", "Icelandic"),
+                    ("io", "Ido"),
+                    ("id", "Indonesian"),
+                    ("ia", "Interlingua"),
+                    ("ga", "Irish"),
+                    ("it", "Italian"),
+                    ("ja", "Japanese"),
+                    ("kn", "Kannada"),
+                    ("kk", "Kazakh"),
+                    ("km", "Khmer"),
+                    ("ko", "Korean"),
+                    ("lv", "Latvian"),
+                    ("lt", "Lithuanian"),
+                    ("lb", "Luxembourgish"),
+                    ("mk", "Macedonian"),
+                    ("ml", "Malayalam"),
+                    ("mr", "Marathi"),
+                    ("mn", "Mongolian"),
+                    ("ne", "Nepali"),
+                    ("nb", "Norwegian"),
+                    ("nn", "Nynorsk"),
+                    ("os", "Ossetic"),
+                    ("fa", "Persian"),
+                    ("pl", "Polish"),
+                    ("pt", "Portuguese"),
+                    ("pa", "Punjabi"),
+                    ("ro", "Romanian"),
+                    ("ru", "Russian"),
+                    ("sr", "Serbian"),
+                    ("sk", "Slovak"),
+                    ("sl", "Slovenian"),
+                    ("es", "Spanish"),
+                    ("sw", "Swahili"),
+                    ("sv", "Swedish"),
+                    ("ta", "Tamil"),
+                    ("tt", "Tatar"),
+                    ("te", "Telugu"),
+                    ("th", "Thai"),
+                    ("tr", "Turkish"),
+                    ("uk", "Ukrainian"),
+                    ("ur", "Urdu"),
+                    ("uz", "Uzbek"),
+                    ("vi", "Vietnamese"),
+                    ("cy", "Welsh"),
+                ],
+                default="en",
+                max_length=2,
+            ),
         ),
         migrations.AlterField(
-            model_name='book',
-            name='edition_language',
-            field=models.CharField(blank=True, choices=[('af', 'Afrikaans'), ('sq', 'Albanian'), ('ar', 'Arabic'), ('hy', 'Armenian'), ('az', 'Azerbaijani'), ('eu', 'Basque'), ('be', 'Belarusian'), ('bn', 'Bengali'), ('bs', 'Bosnian'), ('br', 'Breton'), ('bg', 'Bulgarian'), ('my', 'Burmese'), ('ca', 'Catalan'), ('zh', 'Chinese'), ('hr', 'Croatian'), ('cs', 'Czech'), ('da', 'Danish'), ('nl', 'Dutch'), ('en', 'English'), ('eo', 'Esperanto'), ('et', 'Estonian'), ('fi', 'Finnish'), ('fr', 'French'), ('fy', 'Frisian'), ('gd', 'Gaelic'), ('gl', 'Galician'), ('ka', 'Georgian'), ('de', 'German'), ('el', 'Greek'), ('he', 'Hebrew'), ('hi', 'Hindi'), ('hu', 'Hungarian'), ('is', 'Icelandic'), ('io', 'Ido'), ('id', 'Indonesian'), ('ia', 'Interlingua'), ('ga', 'Irish'), ('it', 'Italian'), ('ja', 'Japanese'), ('kn', 'Kannada'), ('kk', 'Kazakh'), ('km', 'Khmer'), ('ko', 'Korean'), ('lv', 'Latvian'), ('lt', 'Lithuanian'), ('lb', 'Luxembourgish'), ('mk', 'Macedonian'), ('ml', 'Malayalam'), ('mr', 'Marathi'), ('mn', 'Mongolian'), ('ne', 'Nepali'), ('nb', 'Norwegian'), ('nn', 'Nynorsk'), ('os', 'Ossetic'), ('fa', 'Persian'), ('pl', 'Polish'), ('pt', 'Portuguese'), ('pa', 'Punjabi'), ('ro', 'Romanian'), ('ru', 'Russian'), ('sr', 'Serbian'), ('sk', 'Slovak'), ('sl', 'Slovenian'), ('es', 'Spanish'), ('sw', 'Swahili'), ('sv', 'Swedish'), ('ta', 'Tamil'), ('tt', 'Tatar'), ('te', 'Telugu'), ('th', 'Thai'), ('tr', 'Turkish'), ('uk', 'Ukrainian'), ('ur', 'Urdu'), ('uz', 'Uzbek'), ('vi', 'Vietnamese'), ('cy', 'Welsh')], max_length=2),
+            model_name="book",
+            name="edition_language",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("af", "Afrikaans"),
+                    ("sq", "Albanian"),
+                    ("ar", "Arabic"),
+                    ("hy", "Armenian"),
+                    ("az", "Azerbaijani"),
+                    ("eu", "Basque"),
+                    ("be", "Belarusian"),
+                    ("bn", "Bengali"),
+                    ("bs", "Bosnian"),
+                    ("br", "Breton"),
+                    ("bg", "Bulgarian"),
+                    ("my", "Burmese"),
+                    ("ca", "Catalan"),
+                    ("zh", "Chinese"),
+                    ("hr", "Croatian"),
+                    ("cs", "Czech"),
+                    ("da", "Danish"),
+                    ("nl", "Dutch"),
+                    ("en", "English"),
+                    ("eo", "Esperanto"),
+                    ("et", "Estonian"),
+                    ("fi", "Finnish"),
+                    ("fr", "French"),
+                    ("fy", "Frisian"),
+                    ("gd", "Gaelic"),
+                    ("gl", "Galician"),
+                    ("ka", "Georgian"),
+                    ("de", "German"),
+                    ("el", "Greek"),
+                    ("he", "Hebrew"),
+                    ("hi", "Hindi"),
+                    ("hu", "Hungarian"),
+                    ("is", "Icelandic"),
+                    ("io", "Ido"),
+                    ("id", "Indonesian"),
+                    ("ia", "Interlingua"),
+                    ("ga", "Irish"),
+                    ("it", "Italian"),
+                    ("ja", "Japanese"),
+                    ("kn", "Kannada"),
+                    ("kk", "Kazakh"),
+                    ("km", "Khmer"),
+                    ("ko", "Korean"),
+                    ("lv", "Latvian"),
+                    ("lt", "Lithuanian"),
+                    ("lb", "Luxembourgish"),
+                    ("mk", "Macedonian"),
+                    ("ml", "Malayalam"),
+                    ("mr", "Marathi"),
+                    ("mn", "Mongolian"),
+                    ("ne", "Nepali"),
+                    ("nb", "Norwegian"),
+                    ("nn", "Nynorsk"),
+                    ("os", "Ossetic"),
+                    ("fa", "Persian"),
+                    ("pl", "Polish"),
+                    ("pt", "Portuguese"),
+                    ("pa", "Punjabi"),
+                    ("ro", "Romanian"),
+                    ("ru", "Russian"),
+                    ("sr", "Serbian"),
+                    ("sk", "Slovak"),
+                    ("sl", "Slovenian"),
+                    ("es", "Spanish"),
+                    ("sw", "Swahili"),
+                    ("sv", "Swedish"),
+                    ("ta", "Tamil"),
+                    ("tt", "Tatar"),
+                    ("te", "Telugu"),
+                    ("th", "Thai"),
+                    ("tr", "Turkish"),
+                    ("uk", "Ukrainian"),
+                    ("ur", "Urdu"),
+                    ("uz", "Uzbek"),
+                    ("vi", "Vietnamese"),
+                    ("cy", "Welsh"),
+                ],
+                max_length=2,
+            ),
         ),
         migrations.AlterField(
-            model_name='book',
-            name='language',
-            field=models.CharField(choices=[('af', 'Afrikaans'), ('sq', 'Albanian'), ('ar', 'Arabic'), ('hy', 'Armenian'), ('az', 'Azerbaijani'), ('eu', 'Basque'), ('be', 'Belarusian'), ('bn', 'Bengali'), ('bs', 'Bosnian'), ('br', 'Breton'), ('bg', 'Bulgarian'), ('my', 'Burmese'), ('ca', 'Catalan'), ('zh', 'Chinese'), ('hr', 'Croatian'), ('cs', 'Czech'), ('da', 'Danish'), ('nl', 'Dutch'), ('en', 'English'), ('eo', 'Esperanto'), ('et', 'Estonian'), ('fi', 'Finnish'), ('fr', 'French'), ('fy', 'Frisian'), ('gd', 'Gaelic'), ('gl', 'Galician'), ('ka', 'Georgian'), ('de', 'German'), ('el', 'Greek'), ('he', 'Hebrew'), ('hi', 'Hindi'), ('hu', 'Hungarian'), ('is', 'Icelandic'), ('io', 'Ido'), ('id', 'Indonesian'), ('ia', 'Interlingua'), ('ga', 'Irish'), ('it', 'Italian'), ('ja', 'Japanese'), ('kn', 'Kannada'), ('kk', 'Kazakh'), ('km', 'Khmer'), ('ko', 'Korean'), ('lv', 'Latvian'), ('lt', 'Lithuanian'), ('lb', 'Luxembourgish'), ('mk', 'Macedonian'), ('ml', 'Malayalam'), ('mr', 'Marathi'), ('mn', 'Mongolian'), ('ne', 'Nepali'), ('nb', 'Norwegian'), ('nn', 'Nynorsk'), ('os', 'Ossetic'), ('fa', 'Persian'), ('pl', 'Polish'), ('pt', 'Portuguese'), ('pa', 'Punjabi'), ('ro', 'Romanian'), ('ru', 'Russian'), ('sr', 'Serbian'), ('sk', 'Slovak'), ('sl', 'Slovenian'), ('es', 'Spanish'), ('sw', 'Swahili'), ('sv', 'Swedish'), ('ta', 'Tamil'), ('tt', 'Tatar'), ('te', 'Telugu'), ('th', 'Thai'), ('tr', 'Turkish'), ('uk', 'Ukrainian'), ('ur', 'Urdu'), ('uz', 'Uzbek'), ('vi', 'Vietnamese'), ('cy', 'Welsh')], default='en', max_length=2),
+            model_name="book",
+            name="language",
+            field=models.CharField(
+                choices=[
+                    ("af", "Afrikaans"),
+                    ("sq", "Albanian"),
+                    ("ar", "Arabic"),
+                    ("hy", "Armenian"),
+                    ("az", "Azerbaijani"),
+                    ("eu", "Basque"),
+                    ("be", "Belarusian"),
+                    ("bn", "Bengali"),
+                    ("bs", "Bosnian"),
+                    ("br", "Breton"),
+                    ("bg", "Bulgarian"),
+                    ("my", "Burmese"),
+                    ("ca", "Catalan"),
+                    ("zh", "Chinese"),
+                    ("hr", "Croatian"),
+                    ("cs", "Czech"),
+                    ("da", "Danish"),
+                    ("nl", "Dutch"),
+                    ("en", "English"),
+                    ("eo", "Esperanto"),
+                    ("et", "Estonian"),
+                    ("fi", "Finnish"),
+                    ("fr", "French"),
+                    ("fy", "Frisian"),
+                    ("gd", "Gaelic"),
+                    ("gl", "Galician"),
+                    ("ka", "Georgian"),
+                    ("de", "German"),
+                    ("el", "Greek"),
+                    ("he", "Hebrew"),
+                    ("hi", "Hindi"),
+                    ("hu", "Hungarian"),
+                    ("is", "Icelandic"),
+                    ("io", "Ido"),
+                    ("id", "Indonesian"),
+                    ("ia", "Interlingua"),
+                    ("ga", "Irish"),
+                    ("it", "Italian"),
+                    ("ja", "Japanese"),
+                    ("kn", "Kannada"),
+                    ("kk", "Kazakh"),
+                    ("km", "Khmer"),
+                    ("ko", "Korean"),
+                    ("lv", "Latvian"),
+                    ("lt", "Lithuanian"),
+                    ("lb", "Luxembourgish"),
+                    ("mk", "Macedonian"),
+                    ("ml", "Malayalam"),
+                    ("mr", "Marathi"),
+                    ("mn", "Mongolian"),
+                    ("ne", "Nepali"),
+                    ("nb", "Norwegian"),
+                    ("nn", "Nynorsk"),
+                    ("os", "Ossetic"),
+                    ("fa", "Persian"),
+                    ("pl", "Polish"),
+                    ("pt", "Portuguese"),
+                    ("pa", "Punjabi"),
+                    ("ro", "Romanian"),
+                    ("ru", "Russian"),
+                    ("sr", "Serbian"),
+                    ("sk", "Slovak"),
+                    ("sl", "Slovenian"),
+                    ("es", "Spanish"),
+                    ("sw", "Swahili"),
+                    ("sv", "Swedish"),
+                    ("ta", "Tamil"),
+                    ("tt", "Tatar"),
+                    ("te", "Telugu"),
+                    ("th", "Thai"),
+                    ("tr", "Turkish"),
+                    ("uk", "Ukrainian"),
+                    ("ur", "Urdu"),
+                    ("uz", "Uzbek"),
+                    ("vi", "Vietnamese"),
+                    ("cy", "Welsh"),
+                ],
+                default="en",
+                max_length=2,
+            ),
         ),
     ]
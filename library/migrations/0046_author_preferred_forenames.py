@@ -4,15 +4,14 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0045_auto_20200712_1214'),
+        ("library", "0045_auto_20200712_1214"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='author',
-            name='preferred_forenames',
+            model_name="author",
+            name="preferred_forenames",
             field=models.CharField(blank=True, db_index=True, max_length=255),
         ),
     ]
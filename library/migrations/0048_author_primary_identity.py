@@ -5,15 +5,20 @@ import django.db.models.deletion
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0047_auto_20200716_0953'),
+        ("library", "0047_auto_20200716_0953"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='author',
-            name='primary_identity',
-            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pseudonyms', to='library.Author'),
+            model_name="author",
+            name="primary_identity",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="pseudonyms",
+                to="library.Author",
+            ),
         ),
     ]
@@ -4,20 +4,19 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0048_author_primary_identity'),
+        ("library", "0048_author_primary_identity"),
     ]
 
     operations = [
         migrations.RenameField(
-            model_name='logentry',
-            old_name='progress',
-            new_name='progress_percentage',
+            model_name="logentry",
+            old_name="progress",
+            new_name="progress_percentage",
         ),
         migrations.AddField(
-            model_name='logentry',
-            name='progress_page',
+            model_name="logentry",
+            name="progress_page",
             field=models.PositiveSmallIntegerField(default=0),
         ),
     ]
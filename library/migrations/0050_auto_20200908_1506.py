@@ -4,15 +4,14 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0049_auto_20200725_0956'),
+        ("library", "0049_auto_20200725_0956"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='logentry',
-            name='progress_percentage',
+            model_name="logentry",
+            name="progress_percentage",
             field=models.FloatField(default=0),
         ),
     ]
@@ -15,7 +15,6 @@ def migrate_forwards(apps, schema_editor):
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
         ("library", "0050_auto_20200908_1506"),
     ]
@@ -4,15 +4,23 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0051_tag'),
+        ("library", "0051_tag"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='author',
-            name='gender',
-            field=models.IntegerField(choices=[(0, 'Unknown'), (1, 'Male'), (2, 'Female'), (3, 'Organization'), (4, 'Nonbinary')], default=0),
+            model_name="author",
+            name="gender",
+            field=models.IntegerField(
+                choices=[
+                    (0, "Unknown"),
+                    (1, "Male"),
+                    (2, "Female"),
+                    (3, "Organization"),
+                    (4, "Nonbinary"),
+                ],
+                default=0,
+            ),
         ),
     ]
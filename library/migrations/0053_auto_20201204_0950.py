@@ -5,55 +5,72 @@ import django.utils.timezone
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0052_auto_20201118_0946'),
+        ("library", "0052_auto_20201118_0946"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='author',
-            name='created_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="author",
+            name="created_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
         migrations.AddField(
-            model_name='author',
-            name='modified_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="author",
+            name="modified_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
         migrations.AddField(
-            model_name='book',
-            name='modified_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="book",
+            name="modified_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
         migrations.AddField(
-            model_name='bookauthor',
-            name='created_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="bookauthor",
+            name="created_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
         migrations.AddField(
-            model_name='bookauthor',
-            name='modified_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="bookauthor",
+            name="modified_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
         migrations.AddField(
-            model_name='logentry',
-            name='created_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="logentry",
+            name="created_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
         migrations.AddField(
-            model_name='logentry',
-            name='modified_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="logentry",
+            name="modified_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
         migrations.AddField(
-            model_name='tag',
-            name='created_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="tag",
+            name="created_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
         migrations.AddField(
-            model_name='tag',
-            name='modified_date',
-            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+            model_name="tag",
+            name="modified_date",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
         ),
     ]
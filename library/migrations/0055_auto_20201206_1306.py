@@ -4,15 +4,32 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0054_auto_20201206_0845'),
+        ("library", "0054_auto_20201206_0845"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='book',
-            name='rating',
-            field=models.DecimalField(blank=True, choices=[(0.0, 0.0), (0.5, 0.5), (1.0, 1.0), (1.5, 1.5), (2.0, 2.0), (2.5, 2.5), (3.0, 3.0), (3.5, 3.5), (4.0, 4.0), (4.5, 4.5), (5.0, 5.0)], decimal_places=1, default=0, max_digits=2),
+            model_name="book",
+            name="rating",
+            field=models.DecimalField(
+                blank=True,
+                choices=[
+                    (0.0, 0.0),
+                    (0.5, 0.5),
+                    (1.0, 1.0),
+                    (1.5, 1.5),
+                    (2.0, 2.0),
+                    (2.5, 2.5),
+                    (3.0, 3.0),
+                    (3.5, 3.5),
+                    (4.0, 4.0),
+                    (4.5, 4.5),
+                    (5.0, 5.0),
+                ],
+                decimal_places=1,
+                default=0,
+                max_digits=2,
+            ),
         ),
     ]
@@ -4,15 +4,14 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0056_auto_20201210_1730'),
+        ("library", "0056_auto_20201210_1730"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='logentry',
-            name='exclude_from_stats',
+            model_name="logentry",
+            name="exclude_from_stats",
             field=models.BooleanField(default=False),
         ),
     ]
@@ -4,15 +4,14 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0057_logentry_exclude_from_stats'),
+        ("library", "0057_logentry_exclude_from_stats"),
     ]
 
     operations = [
         migrations.AddField(
-            model_name='book',
-            name='private',
+            model_name="book",
+            name="private",
             field=models.BooleanField(db_index=True, default=False),
         ),
     ]
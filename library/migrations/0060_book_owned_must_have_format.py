@@ -4,14 +4,20 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0059_book_owned_dates_requires_owner'),
+        ("library", "0059_book_owned_dates_requires_owner"),
     ]
 
     operations = [
         migrations.AddConstraint(
-            model_name='book',
-            constraint=models.CheckConstraint(check=models.Q(models.Q(('edition_format__ne', 0), ('owned_by__isnull', False)), models.Q(('edition_format__gte', 0), ('owned_by__isnull', True)), _connector='OR'), name='owned_must_have_format'),
+            model_name="book",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(("edition_format__ne", 0), ("owned_by__isnull", False)),
+                    models.Q(("edition_format__gte", 0), ("owned_by__isnull", True)),
+                    _connector="OR",
+                ),
+                name="owned_must_have_format",
+            ),
         ),
     ]
@@ -26,7 +26,6 @@ def reverse_func(apps, schema_editor):
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
         ("library", "0063_remove_book_owned_dates_requires_owner_and_more"),
     ]
@@ -2,8 +2,8 @@
 
 from django.db import migrations, models
 
-class Migration(migrations.Migration):
 
+class Migration(migrations.Migration):
     dependencies = [
         ("library", "0064_remove_nulls"),
     ]
@@ -6,36 +6,64 @@ import django.utils.timezone
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0067_alter_book_edition_number_and_more'),
+        ("library", "0067_alter_book_edition_number_and_more"),
     ]
 
     operations = [
         migrations.CreateModel(
-            name='StatisticsReport',
+            name="StatisticsReport",
             fields=[
-                ('created_date', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
-                ('modified_date', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
-                ('year', models.PositiveSmallIntegerField(primary_key=True, serialize=False)),
-                ('count', models.PositiveSmallIntegerField()),
-                ('page_count', models.PositiveIntegerField()),
-                ('average_pages', models.FloatField()),
-                ('by_men', models.JSONField()),
-                ('by_women', models.JSONField()),
-                ('by_multiple', models.JSONField()),
-                ('by_organisations', models.JSONField()),
-                ('by_nonbinary', models.JSONField()),
-                ('by_poc', models.JSONField()),
-                ('fiction', models.JSONField()),
-                ('nonfiction', models.JSONField()),
-                ('gender_breakdowns', models.JSONField()),
-                ('genre_breakdowns', models.JSONField()),
-                ('longest', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='longest_in_year', to='library.book')),
-                ('shortest', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='shortest_in_year', to='library.book')),
+                (
+                    "created_date",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+                (
+                    "modified_date",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+                (
+                    "year",
+                    models.PositiveSmallIntegerField(primary_key=True, serialize=False),
+                ),
+                ("count", models.PositiveSmallIntegerField()),
+                ("page_count", models.PositiveIntegerField()),
+                ("average_pages", models.FloatField()),
+                ("by_men", models.JSONField()),
+                ("by_women", models.JSONField()),
+                ("by_multiple", models.JSONField()),
+                ("by_organisations", models.JSONField()),
+                ("by_nonbinary", models.JSONField()),
+                ("by_poc", models.JSONField()),
+                ("fiction", models.JSONField()),
+                ("nonfiction", models.JSONField()),
+                ("gender_breakdowns", models.JSONField()),
+                ("genre_breakdowns", models.JSONField()),
+                (
+                    "longest",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="longest_in_year",
+                        to="library.book",
+                    ),
+                ),
+                (
+                    "shortest",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="shortest_in_year",
+                        to="library.book",
+                    ),
+                ),
             ],
             options={
-                'abstract': False,
+                "abstract": False,
             },
         ),
     ]
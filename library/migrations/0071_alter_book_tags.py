@@ -4,15 +4,16 @@ from django.db import migrations, models
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
-        ('library', '0070_tag_books'),
+        ("library", "0070_tag_books"),
     ]
 
     operations = [
         migrations.AlterField(
-            model_name='book',
-            name='tags',
-            field=models.ManyToManyField(blank=True, related_name='books', to='library.tag'),
+            model_name="book",
+            name="tags",
+            field=models.ManyToManyField(
+                blank=True, related_name="books", to="library.tag"
+            ),
         ),
     ]
@@ -0,0 +1,79 @@
+# Generated by Django 4.2.3 on 2026-10-18 04:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_closure(apps, *schema_editor):
+    Tag = apps.get_model("library", "Tag")
+    TagClosure = apps.get_model("library", "TagClosure")
+
+    parents = {}
+    for child, parent in Tag.parents.through.objects.values_list("from_tag", "to_tag"):
+        parents.setdefault(child, set()).add(parent)
+
+    rows = []
+    for tag in Tag.objects.values_list("name", flat=True):
+        depths = {tag: 0}
+        queue = [tag]
+        while queue:
+            current = queue.pop(0)
+            for parent in parents.get(current, ()):
+                if parent not in depths:
+                    depths[parent] = depths[current] + 1
+                    queue.append(parent)
+        rows += [
+            TagClosure(ancestor_id=ancestor, descendant_id=tag, depth=depth)
+            for ancestor, depth in depths.items()
+        ]
+    TagClosure.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0074_delete_queue"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagClosure",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("depth", models.PositiveSmallIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_links",
+                        to="library.tag",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_links",
+                        to="library.tag",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["descendant", "depth"],
+                        name="library_tag_descend_b13119_idx",
+                    )
+                ],
+                "unique_together": {("ancestor", "descendant")},
+            },
+        ),
+        migrations.RunPython(build_closure, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 4.2.3 on 2026-10-18 04:41
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+import django.db.models.deletion
+
+
+def build_read_states(apps, *schema_editor):
+    Book = apps.get_model("library", "Book")
+    LogEntry = apps.get_model("library", "LogEntry")
+    ReadState = apps.get_model("library", "ReadState")
+
+    parents = dict(Book.objects.values_list("id", "parent_edition"))
+    finished = {
+        row["book"]: (row["count"], row["last"])
+        for row in LogEntry.objects.filter(end_date__isnull=False, abandoned=False)
+        .values("book")
+        .annotate(count=Count("id"), last=Max("end_date"))
+    }
+    reading = set(
+        LogEntry.objects.filter(
+            start_date__isnull=False, end_date__isnull=True
+        ).values_list("book", flat=True)
+    )
+
+    states = []
+    for book_id in parents:
+        state = ReadState(book_id=book_id, is_currently_reading=book_id in reading)
+        current, seen = book_id, set()
+        while current and current not in seen:
+            seen.add(current)
+            count, last = finished.get(current, (0, None))
+            state.read_count += count
+            if last and (not state.last_read_date or last > state.last_read_date):
+                state.last_read_date = last
+            current = parents[current]
+        state.is_read = state.read_count > 0
+        states.append(state)
+    ReadState.objects.bulk_create(states)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0075_tagclosure"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReadState",
+            fields=[
+                (
+                    "book",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="read_state",
+                        serialize=False,
+                        to="library.book",
+                    ),
+                ),
+                ("is_read", models.BooleanField(db_index=True, default=False)),
+                (
+                    "is_currently_reading",
+                    models.BooleanField(db_index=True, default=False),
+                ),
+                (
+                    "last_read_date",
+                    models.DateTimeField(blank=True, db_index=True, null=True),
+                ),
+                ("read_count", models.PositiveSmallIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(build_read_states, migrations.RunPython.noop),
+    ]
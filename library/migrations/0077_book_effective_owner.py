@@ -0,0 +1,46 @@
+# Generated by Django 4.2.3 on 2026-10-18 04:48
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def set_effective_owners(apps, *schema_editor):
+    Book = apps.get_model("library", "Book")
+
+    books = {
+        book_id: (owner, parent)
+        for book_id, owner, parent in Book.objects.values_list(
+            "id", "owned_by", "parent_edition"
+        )
+    }
+    for book_id, (owner, parent) in books.items():
+        seen = {book_id}
+        while not owner and parent and parent not in seen:
+            seen.add(parent)
+            owner, parent = books[parent]
+        if owner:
+            Book.objects.filter(id=book_id).update(effective_owner=owner)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("library", "0076_readstate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="book",
+            name="effective_owner",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="effectively_owned_books",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(set_effective_owners, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.3 on 2026-10-18 05:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0077_book_effective_owner"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="statisticsreport",
+            name="by_unknown",
+            field=models.JSONField(default=dict),
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 4.2.3 on 2026-10-18 06:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+import re
+
+from text_unidecode import unidecode
+
+
+def tokenise_name(*names):
+    return re.findall(r"\w+", unidecode(" ".join(names)).lower())
+
+
+def index_author_names(apps, *schema_editor):
+    Author = apps.get_model("library", "Author")
+    AuthorNameToken = apps.get_model("library", "AuthorNameToken")
+
+    authors = list(Author.objects.all())
+    tokens = []
+    for author in authors:
+        author.name_key = " ".join(tokenise_name(author.forenames, author.surname))
+        author.preferred_name_key = (
+            " ".join(tokenise_name(author.preferred_forenames, author.surname))
+            if author.preferred_forenames
+            else ""
+        )
+        tokens += [
+            AuthorNameToken(author=author, token=token)
+            for token in set(
+                tokenise_name(
+                    author.surname, author.forenames, author.preferred_forenames
+                )
+            )
+        ]
+    Author.objects.bulk_update(
+        authors, ["name_key", "preferred_name_key"], batch_size=500
+    )
+    AuthorNameToken.objects.bulk_create(tokens, batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0080_importjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="author",
+            name="name_key",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=511
+            ),
+        ),
+        migrations.AddField(
+            model_name="author",
+            name="preferred_name_key",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=511
+            ),
+        ),
+        migrations.CreateModel(
+            name="AuthorNameToken",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("token", models.CharField(max_length=255)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="name_token_set",
+                        to="library.author",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("token", "author")},
+            },
+        ),
+        migrations.RunPython(index_author_names, migrations.RunPython.noop),
+    ]
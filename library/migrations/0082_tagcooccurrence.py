@@ -0,0 +1,66 @@
+# Generated by Django 4.2.3 on 2026-10-18 07:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count
+
+
+def count_cooccurrences(apps, *schema_editor):
+    Book = apps.get_model("library", "Book")
+    TagCooccurrence = apps.get_model("library", "TagCooccurrence")
+
+    TagCooccurrence.objects.bulk_create(
+        [
+            TagCooccurrence(tag_id=tag, other_id=other, count=count)
+            for tag, other, count in Book.tags.through.objects.values(
+                "tag", "book__tags"
+            )
+            .annotate(count=Count("book"))
+            .values_list("tag", "book__tags", "count")
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0081_author_name_keys"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagCooccurrence",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("count", models.IntegerField()),
+                (
+                    "other",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="library.tag",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="cooccurrences",
+                        to="library.tag",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("tag", "other")},
+            },
+        ),
+        migrations.RunPython(count_cooccurrences, migrations.RunPython.noop),
+    ]
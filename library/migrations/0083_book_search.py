@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0082_tagcooccurrence"),
+    ]
+
+    operations = [
+        # see library/utils/search_index.py
+        migrations.RunSQL(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS library_book_search USING fts5"
+            "(title, subtitle, edition_title, series, authors, tags,"
+            " tokenize = 'unicode61 remove_diacritics 2')",
+            "DROP TABLE IF EXISTS library_book_search",
+        ),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0083_book_search"),
+    ]
+
+    operations = [
+        # the same rows as search_index.index_books()
+        migrations.RunSQL(
+            [
+                "DELETE FROM library_book_search",
+                """
+                INSERT INTO library_book_search
+                    (rowid, title, subtitle, edition_title, series, authors, tags)
+                SELECT
+                    book.id,
+                    book.title,
+                    book.subtitle,
+                    trim(book.edition_title || ' ' || book.edition_subtitle),
+                    book.series,
+                    coalesce((
+                        SELECT group_concat(
+                            author.forenames || ' ' || author.preferred_forenames
+                            || ' ' || author.surname,
+                            ' '
+                        )
+                        FROM library_author author
+                        WHERE author.id = book.first_author_id
+                            OR author.id IN (
+                                SELECT author_id FROM library_bookauthor
+                                WHERE book_id = book.id
+                            )
+                    ), ''),
+                    coalesce((
+                        SELECT group_concat(tag_id, ' ') FROM library_book_tags
+                        WHERE book_id = book.id
+                    ), '')
+                FROM library_book book
+                """,
+            ],
+            "DELETE FROM library_book_search",
+        ),
+    ]
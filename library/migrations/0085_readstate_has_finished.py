@@ -0,0 +1,40 @@
+# Generated by Django 4.2.3 on 2026-10-18 08:17
+
+from django.db import migrations, models
+
+
+def fill_has_finished(apps, *schema_editor):
+    Book = apps.get_model("library", "Book")
+    LogEntry = apps.get_model("library", "LogEntry")
+    ReadState = apps.get_model("library", "ReadState")
+
+    parents = dict(Book.objects.values_list("id", "parent_edition"))
+    finished = set(
+        LogEntry.objects.filter(end_date__isnull=False).values_list("book", flat=True)
+    )
+
+    book_ids = []
+    for book_id in parents:
+        current, seen = book_id, set()
+        while current and current not in seen:
+            seen.add(current)
+            if current in finished:
+                book_ids.append(book_id)
+                break
+            current = parents[current]
+    ReadState.objects.filter(book__in=book_ids).update(has_finished=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0084_fill_book_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="readstate",
+            name="has_finished",
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.RunPython(fill_has_finished, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.3 on 2026-10-18 08:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("library", "0085_readstate_has_finished"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DirtyReportYear",
+            fields=[
+                (
+                    "year",
+                    models.PositiveSmallIntegerField(primary_key=True, serialize=False),
+                ),
+            ],
+        ),
+    ]
@@ -3,26 +3,38 @@ from typing import Any
 from django.db.models import Field, Lookup
 
 from .api_key import ApiKey
-from .author import Author, AuthorManager
+from .author import Author, AuthorManager, AuthorNameToken, AuthorQuerySet
 from .book import Book, BookAuthor, BookQuerySet
+from .enrichment_job import EnrichmentJob
+from .import_job import ImportJob, ImportRecord
 from .log_entry import LogEntry, LogEntryQuerySet
+from .read_state import ReadState
 from .reading_list import ReadingList, ReadingListEntry
-from .statistics_report import StatisticsReport
-from .tag import Tag
+from .statistics_report import DirtyReportYear, StatisticsReport
+from .tag import Tag, TagClosure, TagCooccurrence
 
 __all__ = [
     "ApiKey",
     "Author",
     "AuthorManager",
+    "AuthorNameToken",
+    "AuthorQuerySet",
     "Book",
     "BookAuthor",
     "BookQuerySet",
+    "DirtyReportYear",
+    "EnrichmentJob",
+    "ImportJob",
+    "ImportRecord",
     "LogEntry",
     "LogEntryQuerySet",
+    "ReadState",
     "ReadingList",
     "ReadingListEntry",
     "StatisticsReport",
     "Tag",
+    "TagClosure",
+    "TagCooccurrence",
 ]
 
 
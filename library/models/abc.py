@@ -1,4 +1,5 @@
 import re
+from collections.abc import Sequence
 from typing import Any
 
 from django.db import models
@@ -22,16 +23,19 @@ class SluggableModel(models.Model):
     def _slug_fields(self) -> list[str]:
         raise NotImplementedError
 
-    def _generate_slug(self) -> str:
+    def base_slug(self) -> str:
         slug = "-".join(
             [field.lower().replace(" ", "-") for field in self._slug_fields()]
         )
         slug = unidecode(slug)
         slug = re.sub(r"[^\w-]+", "", slug)
+        return slug[0:50].strip("-")
+
+    def _generate_slug(self) -> str:
+        slug = self.base_slug()
 
         objects = self.__class__.objects  # type: ignore[attr-defined]
 
-        slug = slug[0:50].strip("-")
         matches = objects.filter(slug=slug).exclude(pk=self.id)
         if (not matches) or (matches.count() == 1 and matches.first() == self):
             return slug
@@ -44,6 +48,26 @@ class SluggableModel(models.Model):
 
         return str(self.id)
 
+    @classmethod
+    def assign_slugs(
+        cls: type["SluggableModel"], instances: Sequence["SluggableModel"]
+    ) -> None:
+        # what _generate_slug would pick for each of several unsaved rows,
+        # checking all the candidates in one query; rows which run out of
+        # candidates are left blank, to be given their id once saved
+        candidates = [
+            [base] + [f"{base[0:48].strip('-')}-{idx}" for idx in range(1, 10)]
+            for base in (instance.base_slug() for instance in instances)
+        ]
+        taken = set(
+            cls.objects.filter(
+                slug__in={slug for slugs in candidates for slug in slugs}
+            ).values_list("slug", flat=True)
+        )
+        for instance, slugs in zip(instances, candidates, strict=True):
+            instance.slug = next((slug for slug in slugs if slug not in taken), "")
+            taken.add(instance.slug)
+
     def regenerate_slug(self) -> None:
         self.slug = self._generate_slug()
         self.save()
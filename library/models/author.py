@@ -1,11 +1,13 @@
 import re
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from django.db import models
-from django.db.models import Q
-from django.db.models.functions import Lower
+from django.db import models, transaction
+from django.db.models import Exists, Func, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Lower
 from django.db.models.indexes import Index
 from django.urls import reverse
+from text_unidecode import unidecode
 
 from library.models.abc import SluggableModel, TimestampedModel
 from library.utils import LANGUAGES, remove_stopwords
@@ -14,23 +16,105 @@ if TYPE_CHECKING:
     from .book import Book, BookQuerySet  # pragma: no cover
 
 
-class AuthorManager(models.Manager["Author"]):
-    def search(self, pattern: str) -> "models.QuerySet[Author]":
-        result = Author.objects.none()
-        for word in pattern.split():
-            result |= Author.objects.filter(surname__icontains=word.strip('"').strip())
-            result |= Author.objects.filter(
-                forenames__icontains=word.strip('"').strip()
+def tokenise_name(*names: str) -> list[str]:
+    # accent-folded, lower-cased words, ignoring punctuation, so "J. R. R."
+    # and "J.R.R." come out the same
+    return re.findall(r"\w+", unidecode(" ".join(names)).lower())
+
+
+def make_name_key(forenames: str, surname: str) -> str:
+    return " ".join(tokenise_name(forenames, surname))
+
+
+# folded names can match several authors, so prefer one spelt exactly as
+# given, then one matched by their name rather than their preferred name,
+# then the oldest
+def best_name_match(
+    authors: Iterable["Author"], names: dict[str, Any], key: str
+) -> "Author | None":
+    matches = [
+        author
+        for author in authors
+        if key in (author.name_key, author.preferred_name_key)
+    ]
+    if not matches:
+        return None
+    return min(
+        matches,
+        key=lambda author: (
+            (author.forenames, author.surname)
+            != (names["forenames"], names["surname"]),
+            author.name_key != key,
+            author.pk,
+        ),
+    )
+
+
+AUTHOR_ROLES = ("", "author")
+EDITOR_ROLES = ("editor",)
+
+
+class AuthorQuerySet(models.QuerySet["Author"]):
+    def with_book_summary(self) -> "AuthorQuerySet":
+        # what authors/list_item.html says about each author's books, as
+        # `authored_count`, `edited_count`, `book_count` and
+        # `representative_title`, and whether it needs to look up their
+        # `identities` (`has_identities`), in the same query as the authors
+        from .book import Book
+
+        counts = {}
+        titles = []
+        for name, roles in (
+            ("authored_count", AUTHOR_ROLES),
+            ("edited_count", EDITOR_ROLES),
+            ("book_count", None),
+        ):
+            books = Book.objects.filter(Author.books_filter(OuterRef("pk"), roles))
+            counts[name] = Coalesce(
+                Subquery(
+                    books.order_by()
+                    .annotate(count=Func("id", function="COUNT"))
+                    .values("count"),
+                    output_field=IntegerField(),
+                ),
+                0,
             )
-        return result
+            titles.append(
+                Subquery(books.with_display_title().values("title_for_display")[:1])
+            )
+        return self.annotate(
+            **counts,
+            representative_title=Coalesce(*titles, Value("")),
+            has_identities=Q(primary_identity__isnull=False)
+            | Exists(Author.objects.filter(primary_identity=OuterRef("pk"))),
+        )
+
+
+class BaseAuthorManager(models.Manager["Author"]):
+    def search(self, pattern: str) -> "models.QuerySet[Author]":
+        # authors with a name starting with any of the words, and the people
+        # behind any pseudonyms which do; each word is a range scan of the
+        # token index
+        query = Q(pk__in=[])
+        for token in tokenise_name(pattern):
+            query |= Q(token__range=(token, token + "\uffff"))
+        matches = AuthorNameToken.objects.filter(query).values("author")
+        return Author.objects.filter(
+            Q(pk__in=matches)
+            | Q(pk__in=Author.objects.filter(pk__in=matches).values("primary_identity"))
+        )
 
     def get_by_single_name(self, name: str) -> "Author":
         names = Author.normalise_name(name)
-        return Author.objects.get(
-            Q(surname=name, forenames="")
-            | Q(**names)
-            | Q(surname=names["surname"], preferred_forenames=names["forenames"])
-        )
+        key = make_name_key(**names)
+        if author := best_name_match(
+            Author.objects.filter(Q(name_key=key) | Q(preferred_name_key=key)),
+            names,
+            key,
+        ):
+            return author
+        msg = "Author matching query does not exist."
+        raise Author.DoesNotExist(msg)
 
     def get_or_create_by_single_name(self, name: str) -> tuple["Author", bool]:
         try:
@@ -38,9 +122,48 @@ class AuthorManager(models.Manager["Author"]):
         except self.model.DoesNotExist:
             return Author.objects.get_or_create(**Author.normalise_name(name))
 
+    def get_or_create_many_by_single_name(
+        self, names: Iterable[str]
+    ) -> dict[str, tuple["Author", bool]]:
+        # get_or_create_by_single_name for many names, with one query to find
+        # the existing authors and one insert for the rest
+        normalised = {name: Author.normalise_name(name) for name in set(names)}
+        keys = {name: make_name_key(**names) for name, names in normalised.items()}
+        candidates = list(
+            Author.objects.filter(
+                Q(name_key__in=set(keys.values()))
+                | Q(preferred_name_key__in=set(keys.values()))
+            )
+        )
+
+        result: dict[str, tuple[Author, bool]] = {}
+        new: dict[str, Author] = {}
+        for name, key in keys.items():
+            if existing := best_name_match(candidates, normalised[name], key):
+                result[name] = (existing, False)
+            else:
+                result[name] = (new.setdefault(key, Author(**normalised[name])), True)
+
+        authors = list(new.values())
+        for author in authors:
+            author.update_name_keys()
+        Author.assign_slugs(authors)
+        Author.objects.bulk_create(authors)
+        AuthorNameToken.objects.refresh(authors)
+        for author in authors:
+            if not author.slug:
+                author.slug = str(author.pk)
+                author.save(update_fields=["slug"])
+        return result
+
+
+# subclassed rather than assigned, as mypy can't follow from_queryset()
+class AuthorManager(BaseAuthorManager.from_queryset(AuthorQuerySet)):  # type: ignore[misc]
+    pass
+
 
 class Author(TimestampedModel, SluggableModel):
-    objects = AuthorManager()
+    objects: ClassVar[AuthorManager] = AuthorManager()
 
     class Meta:
         indexes = [Index(fields=["surname", "forenames"])]
@@ -68,6 +191,15 @@ class Author(TimestampedModel, SluggableModel):
 
     primary_language = models.CharField(max_length=2, default="en", choices=LANGUAGES)
 
+    # the names folded by make_name_key, kept up to date by save(), so that
+    # looking an author up by name is an index lookup
+    name_key = models.CharField(
+        db_index=True, max_length=511, blank=True, default="", editable=False
+    )
+    preferred_name_key = models.CharField(
+        db_index=True, max_length=511, blank=True, default="", editable=False
+    )
+
     primary_identity = models.ForeignKey(
         "self",
         related_name="pseudonyms",
@@ -86,6 +218,34 @@ class Author(TimestampedModel, SluggableModel):
             else (self.preferred_forenames or self.forenames) + " " + self.surname
         )
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.update_name_keys()
+        if (update_fields := kwargs.get("update_fields")) is not None and {
+            "surname",
+            "forenames",
+            "preferred_forenames",
+        } & set(update_fields):
+            kwargs["update_fields"] = {
+                *update_fields,
+                "name_key",
+                "preferred_name_key",
+            }
+        super().save(*args, **kwargs)
+
+    def update_name_keys(self) -> None:
+        self.name_key = make_name_key(self.forenames, self.surname)
+        self.preferred_name_key = (
+            make_name_key(self.preferred_forenames, self.surname)
+            if self.preferred_forenames
+            else ""
+        )
+
+    @property
+    def name_tokens(self) -> set[str]:
+        return set(
+            tokenise_name(self.surname, self.forenames, self.preferred_forenames)
+        )
+
     def to_json(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -131,9 +291,16 @@ class Author(TimestampedModel, SluggableModel):
         return self.role_for_book(book) == "editor"
 
     def role_for_book(self, book: "Book") -> str:
-        if book.first_author == self:
+        if book.first_author_id == self.pk:
             return str(book.first_author_role)
-        return rel.role if (rel := self.bookauthor_set.get(book=book.pk)) else ""
+        return next(
+            (
+                authorship.role
+                for authorship in book.authorships
+                if authorship.author_id == self.pk
+            ),
+            "",
+        )
 
     def display_role_for_book(self, book: "Book") -> str:
         return "ed." if (role := self.role_for_book(book)) == "editor" else role
@@ -145,34 +312,37 @@ class Author(TimestampedModel, SluggableModel):
         all_forenames = re.split(r"[. ]+", self.forenames)
         return ".".join([name[0] for name in all_forenames if name]) + "."
 
+    @staticmethod
+    def books_filter(author: Any, roles: Sequence[str] | None = None) -> Q:
+        # books with `author` (an Author, or an OuterRef to one) in one of
+        # `roles`, as first author or otherwise, without joining anything
+        from .book import BookAuthor
+
+        authorships = BookAuthor.objects.filter(
+            author=OuterRef(author) if isinstance(author, OuterRef) else author
+        )
+        first_author = Q(first_author=author)
+        if roles is not None:
+            authorships = authorships.filter(role__in=roles)
+            first_author &= Q(first_author_role__in=roles)
+        return first_author | Q(pk__in=authorships.values("book"))
+
+    def _books(self, roles: Sequence[str] | None = None) -> "BookQuerySet":
+        from .book import Book
+
+        return Book.objects.filter(self.books_filter(self, roles))
+
     @property
     def books(self) -> "BookQuerySet":
-        return (
-            self.first_authored_books.all() | self.additional_authored_books.all()
-        ).distinct()
+        return self._books()
 
     @property
     def authored_books(self) -> "BookQuerySet":
-        return (
-            self.books.filter(
-                id__in=[
-                    ba.book.id
-                    for ba in self.bookauthor_set.filter(Q(role="") | Q(role="author"))
-                ]
-            )
-            | self.first_authored_books.filter(
-                Q(first_author_role="") | Q(first_author_role="author")
-            ).distinct()
-        )
+        return self._books(AUTHOR_ROLES)
 
     @property
     def edited_books(self) -> "BookQuerySet":
-        return (
-            self.books.filter(
-                id__in=[ba.book.id for ba in self.bookauthor_set.filter(role="editor")]
-            )
-            | self.first_authored_books.filter(first_author_role="editor").distinct()
-        )
+        return self._books(EDITOR_ROLES)
 
     @property
     def identities(self) -> models.QuerySet["Author"]:
@@ -207,3 +377,34 @@ class Author(TimestampedModel, SluggableModel):
         return [
             remove_stopwords(self.name_with_initials, ["von", "van", "der", "le", "de"])
         ]
+
+
+class AuthorNameTokenManager(models.Manager["AuthorNameToken"]):
+    def refresh(self, authors: Iterable[Author]) -> None:
+        authors = list(authors)
+        with transaction.atomic():
+            self.filter(author__in=authors).delete()
+            self.bulk_create(
+                [
+                    AuthorNameToken(author=author, token=token)
+                    for author in authors
+                    for token in author.name_tokens
+                ],
+                batch_size=500,
+            )
+
+
+class AuthorNameToken(models.Model):
+    # one row for each word of each of an author's names, for search
+    author = models.ForeignKey(
+        Author, on_delete=models.CASCADE, related_name="name_token_set"
+    )
+    token = models.CharField(max_length=255)
+
+    objects: ClassVar[AuthorNameTokenManager] = AuthorNameTokenManager()
+
+    class Meta:
+        unique_together = ("token", "author")
+
+    def __str__(self) -> str:
+        return f"{self.author_id}: {self.token}"
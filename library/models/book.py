@@ -1,11 +1,25 @@
 import logging
 import re
-from typing import TYPE_CHECKING, Any
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import quote
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import models
-from django.db.models import CheckConstraint, F, Q, Sum, Value
+from django.db.models import (
+    Case,
+    CheckConstraint,
+    Count,
+    F,
+    Max,
+    Min,
+    Prefetch,
+    Q,
+    Sum,
+    Value,
+    When,
+)
 from django.db.models.functions import Concat, Lower
 from django.db.models.indexes import Index
 from django.urls import reverse
@@ -17,28 +31,42 @@ from library.models.book_with_editions import BookWithEditions
 from library.utils import (
     LANGUAGES,
     clean_publisher,
-    flatten,
     goodreads,
     google,
     isbn_to_isbn10,
     oxford_comma,
     remove_stopwords,
+    search_index,
     smarten,
     str2bool,
     verso,
 )
 
 from .author import Author
-from .tag import Tag
 
 if TYPE_CHECKING:
     from .log_entry import LogEntry  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+SERIES_CACHE_KEY = "series-index"
+# the fields Book.objects.series_index() summarises
+SERIES_INDEX_FIELDS = ["series", "first_author_id", "first_author_role", "private"]
+PUBLISHER_CACHE_KEY = "publisher-index"
+
 
 class BaseBookManager(models.Manager["Book"]):
     def search(self, pattern: str) -> "BookQuerySet":
+        if not search_index.is_available():
+            return self._search_like(pattern)
+
+        table = Book._meta.db_table  # noqa: SLF001
+        if not (match := search_index.match(pattern, table)):
+            return Book.objects.none()
+
+        return Book.objects.extra(**match)
+
+    def _search_like(self, pattern: str) -> "BookQuerySet":
         words = pattern.lower().split()
         sql_pattern = "%" + "%".join(words) + "%"
         query = (
@@ -61,8 +89,192 @@ class BaseBookManager(models.Manager["Book"]):
         )
         return books.filter(query).distinct()
 
+    def series_index(
+        self, include_private: bool  # noqa: FBT001
+    ) -> dict[str, dict[str, Any]]:
+        # each series' book count, first and last place in the series, how
+        # many of its books have been read, and its authors, in title order
+        series = self._series_summaries(include_private)
+        authors = Author.objects.in_bulk(
+            {author for summary in series.values() for author in summary["authors"]}
+        )
+        read = dict(
+            self._series_books(include_private)
+            .filter(read_state__is_read=True)
+            .values("series")
+            .annotate(count=Count("id"))
+            .values_list("series", "count")
+        )
+        return {
+            name: {
+                **summary,
+                "authors": sorted(
+                    (authors[author] for author in summary["authors"]),
+                    key=lambda author: (
+                        author.surname.lower(),
+                        author.forenames.lower(),
+                    ),
+                ),
+                "read": read.get(name, 0),
+            }
+            for name, summary in series.items()
+        }
+
+    def clear_series_index(self) -> None:
+        cache.delete_many([f"{SERIES_CACHE_KEY}:{private}" for private in (0, 1)])
+
+    def publisher_index(
+        self, include_private: bool  # noqa: FBT001
+    ) -> dict[str, dict[str, Any]]:
+        # facet_counts() for every publisher's books, in one grouped query;
+        # kept until a book's publisher, owner, format or read state changes
+        def summarise() -> dict[str, dict[str, Any]]:
+            books = Book.objects.exclude(publisher="")
+            if not include_private:
+                books = books.filter(private=False)
+            return {
+                row["publisher"]: facets_from(row)
+                for row in books.values("publisher")
+                .annotate(**facet_aggregates())
+                .order_by("publisher")
+            }
+
+        return (
+            cache.get_or_set(
+                f"{PUBLISHER_CACHE_KEY}:{int(include_private)}", summarise, None
+            )
+            or {}
+        )
+
+    def clear_publisher_index(self) -> None:
+        cache.delete_many([f"{PUBLISHER_CACHE_KEY}:{private}" for private in (0, 1)])
+
+    def _series_books(self, include_private: bool) -> "BookQuerySet":  # noqa: FBT001
+        books = Book.objects.exclude(series="")
+        return books if include_private else books.filter(private=False)
+
+    def _series_summaries(
+        self, include_private: bool  # noqa: FBT001
+    ) -> dict[str, dict[str, Any]]:
+        # what only changes when a book's series, authors or privacy do, so
+        # it's cached until then; authors are ids, and read counts change
+        # too often to keep
+        def summarise() -> dict[str, dict[str, Any]]:
+            books = self._series_books(include_private)
+            series = {
+                name: {"books": count, "first": first, "last": last, "authors": []}
+                for name, count, first, last in books.values("series")
+                .annotate(
+                    count=Count("id"),
+                    first=Min("series_order"),
+                    last=Max("series_order"),
+                )
+                .values_list("series", "count", "first", "last")
+            }
+
+            # the authors Book.authors lists: the first author, and anyone
+            # else credited in the same role
+            authors = set(
+                books.filter(first_author__isnull=False).values_list(
+                    "series", "first_author"
+                )
+            ) | set(
+                BookAuthor.objects.filter(
+                    book__in=books, role=F("book__first_author_role")
+                ).values_list("book__series", "author")
+            )
+            for name, author in authors:
+                series[name]["authors"].append(author)
+
+            return dict(
+                sorted(
+                    series.items(),
+                    key=lambda item: re.sub(r"^(A|The) (.*)", r"\2, \1", item[0]),
+                )
+            )
+
+        return (
+            cache.get_or_set(
+                f"{SERIES_CACHE_KEY}:{int(include_private)}", summarise, None
+            )
+            or {}
+        )
+
+
+def facet_aggregates() -> dict[str, Count]:
+    return {
+        "total": Count("id"),
+        "owned": Count("id", filter=Q(effective_owner__username="ben")),
+        "read": Count("id", filter=Q(read_state__is_read=True)),
+        **{
+            f"format_{edition_format}": Count(
+                "id", filter=Q(edition_format=edition_format)
+            )
+            for edition_format, _ in Book.Format.choices
+        },
+    }
+
+
+def facets_from(counts: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "total": counts["total"],
+        "owned": counts["owned"],
+        "read": counts["read"],
+        "formats": {
+            edition_format: counts[f"format_{edition_format}"]
+            for edition_format, _ in Book.Format.choices
+        },
+    }
+
+
+# the through rows behind Book.authorships, which authors, editors,
+# all_authors_editors, display_details and Author.attribution_for all read
+# their roles from, so a page of books needs one query for all of them
+def authorships_prefetch(prefix: str = "") -> Prefetch:
+    return Prefetch(
+        f"{prefix}bookauthor_set",
+        queryset=BookAuthor.objects.select_related("author").order_by("order", "id"),
+        to_attr="authorships",
+    )
+
+
+# everything macros/card.html reads, relative to `prefix`, so list pages can
+# fetch it for the whole page in a fixed number of queries
+def card_data_lookups(prefix: str = "") -> tuple[list[str], list[str | Prefetch]]:
+    select_related = ["first_author", "effective_owner", "read_state"]
+    prefetches: list[str | Prefetch] = [
+        authorships_prefetch(prefix),
+        f"{prefix}log_entries",
+        f"{prefix}reading_lists",
+        f"{prefix}subeditions",
+        f"{prefix}tags",
+    ]
+    return [f"{prefix}{field}" for field in select_related], prefetches
+
 
 class BookQuerySet(models.QuerySet["Book"]):
+    def with_display_title(self) -> "BookQuerySet":
+        # Book.display_title, worked out by the database as `title_for_display`
+        def with_subtitle(title: str, subtitle: str) -> Concat:
+            return Concat(
+                title,
+                Case(
+                    When(~Q(**{subtitle: ""}), then=Concat(Value(": "), subtitle)),
+                    default=Value(""),
+                ),
+            )
+
+        return self.annotate(
+            title_for_display=Case(
+                When(
+                    ~Q(edition_title=""),
+                    then=with_subtitle("edition_title", "edition_subtitle"),
+                ),
+                default=with_subtitle("title", "subtitle"),
+                output_field=models.CharField(),
+            )
+        )
+
     def by_gender(self, *genders: int) -> "BookQuerySet":
         return self.filter(
             Q(first_author__gender__in=genders)
@@ -83,11 +295,52 @@ class BookQuerySet(models.QuerySet["Book"]):
         )
 
     def tagged(self, *tag_names: str) -> "BookQuerySet":
-        qs = self.distinct()
+        qs = self
         for tag_name in tag_names:
-            qs &= Tag.objects.get(name=tag_name).books_recursive.distinct()
+            qs = qs.filter(
+                id__in=Book.tags.through.objects.filter(
+                    tag__ancestor_links__ancestor=tag_name.lower().strip()
+                ).values("book")
+            )
         return qs
 
+    def with_export_data(self) -> "BookQuerySet":
+        from .reading_list import ReadingList, ReadingListEntry
+
+        return self.prefetch_related(
+            "tags__ancestor_links",
+            authorships_prefetch(),
+            "log_entries",
+            "alternate_editions",
+            Prefetch(
+                "reading_lists",
+                queryset=ReadingList.objects.prefetch_related(
+                    Prefetch(
+                        "readinglistentry_set",
+                        queryset=ReadingListEntry.objects.order_by("order", "id"),
+                    )
+                ),
+            ),
+        )
+
+    def with_authorships(self) -> "BookQuerySet":
+        return self.select_related("first_author").prefetch_related(
+            authorships_prefetch()
+        )
+
+    def with_card_data(self) -> "BookQuerySet":
+        select_related, prefetches = card_data_lookups()
+        return self.select_related(*select_related).prefetch_related(*prefetches)
+
+    def facet_counts(self) -> dict[str, Any]:
+        # everything the list pages summarise, in one query; filtering on ids
+        # sidesteps duplicate rows from whatever joins this queryset needed
+        return facets_from(
+            Book.objects.filter(id__in=self.values("id")).aggregate(
+                **facet_aggregates()
+            )
+        )
+
     def fiction(self) -> "BookQuerySet":
         return self.tagged("fiction")
 
@@ -95,46 +348,57 @@ class BookQuerySet(models.QuerySet["Book"]):
         return self.tagged("non-fiction")
 
     def read(self) -> "BookQuerySet":
-        return self.filter(
-            Q(log_entries__end_date__isnull=False, log_entries__abandoned=False)
-            | Q(
-                parent_edition__log_entries__end_date__isnull=False,
-                parent_edition__log_entries__abandoned=False,
-            )
-        ).distinct()
+        return self.filter(read_state__is_read=True)
 
     def unread(self) -> "BookQuerySet":
-        return self.exclude(
-            Q(log_entries__end_date__isnull=False)
-            | Q(parent_edition__log_entries__end_date__isnull=False)
-        ).distinct()
+        return self.filter(read_state__has_finished=False)
 
     def owned(self) -> "BookQuerySet":
         return self.owned_by("ben")
 
     def owned_by(self, user: str) -> "BookQuerySet":
-        return self.filter(
-            Q(owned_by__username=user)
-            | Q(parent_edition__owned_by__username=user)
-            # I can't make this recurse but three levels is the most I can foresee needing
-            | Q(parent_edition__parent_edition__owned_by__username=user)
-        )
+        return self.filter(effective_owner__username=user)
 
     def owned_by_any(self) -> "BookQuerySet":
         return self.filter(owned_by__isnull=False)
 
     def available(self) -> "BookQuerySet":
-        return self.owned_by("ben") | self.owned_by("sara") | self.borrowed()
+        return self.filter(
+            Q(effective_owner__username__in=["ben", "sara"]) | Q(was_borrowed=True)
+        )
 
     def borrowed(self) -> "BookQuerySet":
-        return self.exclude(owned_by=None).unowned() | self.filter(was_borrowed=True)
+        return self.filter(was_borrowed=True)
 
     def unowned(self) -> "BookQuerySet":
-        return self.filter(
-            owned_by__isnull=True,
-            parent_edition__owned_by__isnull=True,
-            parent_edition__parent_edition__owned_by__isnull=True,
-        )
+        return self.filter(effective_owner__isnull=True)
+
+    def update_effective_owners(self) -> None:
+        # each book inherits the owner of its nearest owned ancestor edition,
+        # so walk down from the topmost books here one level at a time
+        books: models.QuerySet[Book] = self.exclude(parent_edition__in=self)
+        seen: set[int] = set()
+        while rows := [
+            row
+            for row in books.values_list(
+                "id", "owned_by", "parent_edition__effective_owner"
+            )
+            if row[0] not in seen
+        ]:
+            by_owner: defaultdict[int | None, list[int]] = defaultdict(list)
+            for book_id, owner, inherited_owner in rows:
+                seen.add(book_id)
+                by_owner[owner or inherited_owner].append(book_id)
+            for effective_owner, book_ids in by_owner.items():
+                Book.objects.filter(id__in=book_ids).update(
+                    effective_owner=effective_owner
+                )
+
+            books = Book.objects.filter(parent_edition__in=[row[0] for row in rows])
+
+        if seen:
+            # update() sends no signals, and publisher_index() counts owners
+            Book.objects.clear_publisher_index()
 
     def poc(self, is_poc: bool = True) -> "BookQuerySet":  # noqa: FBT001, FBT002
         return self.filter(
@@ -146,6 +410,9 @@ class BookQuerySet(models.QuerySet["Book"]):
             )
         )
 
+    # the query parameters filter_by_request() reads
+    REQUEST_FILTERS = ("gender", "poc", "tags", "owned", "want_to_read", "read")
+
     def filter_by_request(self, request: Any) -> "BookQuerySet":
         qs = self
         match request.GET.get("gender", "").lower():
@@ -200,11 +467,13 @@ class BookQuerySet(models.QuerySet["Book"]):
         return 0
 
 
-BookManager = BaseBookManager.from_queryset(BookQuerySet)
+# subclassed rather than assigned, as mypy can't follow from_queryset()
+class BookManager(BaseBookManager.from_queryset(BookQuerySet)):  # type: ignore[misc]
+    pass
 
 
 class Book(TimestampedModel, SluggableModel, BookWithEditions):
-    objects = BookManager()
+    objects: ClassVar[BookManager] = BookManager()
 
     class Meta:
         indexes = [
@@ -320,6 +589,15 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
         on_delete=models.CASCADE,
         related_name="owned_books",
     )
+    # owned_by, or else that of the nearest owned ancestor edition
+    effective_owner = models.ForeignKey(
+        User,
+        blank=True,
+        null=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="effectively_owned_books",
+    )
 
     image_url = models.URLField(blank=True)
     publisher_url = models.URLField(blank=True)
@@ -356,18 +634,26 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
 
     @cached_property
     def authors(self) -> list[Author]:
-        additional_authors = list(
-            self.additional_authors.filter(
-                bookauthor__role=self.first_author_role
-            ).order_by("bookauthor__order")
-        )
+        additional_authors = [
+            authorship.author
+            for authorship in self.authorships
+            if authorship.role == self.first_author_role
+        ]
         if self.first_author:
             return [self.first_author, *additional_authors]
         return additional_authors
 
+    # the additional authors' through rows in order; authorships_prefetch()
+    # fetches them for many books at once
+    @cached_property
+    def authorships(self) -> list["BookAuthor"]:
+        return list(
+            self.bookauthor_set.select_related("author").order_by("order", "id")
+        )
+
     @cached_property
     def all_authors(self) -> list[Author]:
-        additional_authors = list(self.additional_authors.order_by("bookauthor__order"))
+        additional_authors = [authorship.author for authorship in self.authorships]
         if self.first_author:
             return [self.first_author, *additional_authors]
         return additional_authors
@@ -393,10 +679,19 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
             else []
         )
 
+    @property
+    def current_log_entry(self) -> "LogEntry | None":
+        entries = [
+            entry
+            for entry in self.log_entries.all()
+            if entry.start_date and not entry.end_date
+        ]
+        return entries[-1] if entries else None
+
     @property
     def currently_reading(self) -> bool:
-        entries = self.log_entries.filter(end_date=None).order_by("-start_date")
-        return bool(entries[0].currently_reading) if entries else False
+        read_state = getattr(self, "read_state", None)
+        return bool(read_state and read_state.is_currently_reading)
 
     @property
     def display_date(self) -> str:
@@ -434,12 +729,9 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
             else:
                 result += oxford_comma(self.editors)
 
-        if (
-            self.alternate_editions.count()
-            and self.edition_format
-            and self.edition_title
-            in self.alternate_editions.all().values_list("edition_title", flat=True)
-        ):
+        if self.edition_format and self.edition_title in {
+            edition.edition_title for edition in self.alternate_editions.all()
+        }:
             result += f", {self.get_edition_disambiguator()} edn."
 
         if self.publisher or self.edition_published or self.first_published:
@@ -451,16 +743,25 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
     def display_series(self) -> str:
         if not self.series:
             return ""
-        if self.subeditions.count() > 1 and all(
-            book.series == self.series for book in self.subeditions.all()
+        subeditions = list(self.subeditions.all())
+        if len(subeditions) > 1 and all(
+            book.series == self.series for book in subeditions
         ):
-            series_orders = sorted(book.series_order for book in self.subeditions.all())
+            series_orders = sorted(book.series_order for book in subeditions)
             return f"{self.series}, #{str(min(series_orders)).replace('.0', '')}–{str(max(series_orders)).replace('.0', '')}"
 
         if self.series_order:
             return f"{self.series}, #{str(self.series_order).replace('.0', '')}"
         return self.series
 
+    # the latest read which wasn't abandoned, for the card's footer
+    @property
+    def display_log_entry(self) -> "LogEntry | None":
+        entries = [entry for entry in self.log_entries.all() if not entry.abandoned]
+        if finished := [entry for entry in entries if entry.end_date]:
+            return max(finished, key=lambda entry: (entry.end_date, entry.pk))
+        return entries[-1] if entries else None
+
     @cached_property
     def display_title(self) -> str:
         if self.edition_title:
@@ -508,33 +809,23 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
     @property
     def owned(self) -> bool:
         return (
-            self.owned_by.username == "ben"
-            if self.owned_by is not None
-            else any(ancestor.owned for ancestor in self.ancestor_editions)
+            self.effective_owner is not None and self.effective_owner.username == "ben"
         )
 
     @property
     def owned_by_sara(self) -> bool:
         return (
-            self.owned_by.username == "sara"
-            if self.owned_by is not None
-            else any(ancestor.owned_by_sara for ancestor in self.ancestor_editions)
+            self.effective_owner is not None and self.effective_owner.username == "sara"
         )
 
     @property
     def parent_owned(self) -> bool:
-        return (not self.owned_by) and any(
-            ancestor.owned for ancestor in self.ancestor_editions
-        )
+        return self.owned_by_id is None and self.owned
 
     @property
     def read(self) -> bool:
-        if self.parent_edition and self.parent_edition.read:
-            return True
-
-        return (
-            self.log_entries.filter(end_date__isnull=False, abandoned=False).count() > 0
-        )
+        read_state = getattr(self, "read_state", None)
+        return bool(read_state and read_state.is_read)
 
     @property
     def review_url(self) -> str:
@@ -552,6 +843,46 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
     def tags_list(self) -> set[str]:
         return {tag.name for tag in self.tags.all()}
 
+    @property
+    def needs_enrichment(self) -> bool:
+        return (
+            self._needs_verso_data
+            or self._needs_goodreads_data
+            or self._needs_google_data
+        )
+
+    @property
+    def _needs_verso_data(self) -> bool:
+        return self.publisher == "Verso" and not (
+            self.publisher_url and "://versobooks.com" in self.image_url
+        )
+
+    @property
+    def _needs_goodreads_data(self) -> bool:
+        return any([self.asin, self.isbn, (self.title and self.first_author)]) and (
+            not all([self.first_published, self.goodreads_id, self.image_url])
+        )
+
+    @property
+    def _needs_google_data(self) -> bool:
+        return any([self.isbn, self.google_books_id]) and (
+            not all(
+                [
+                    self.google_books_id,
+                    self.publisher,
+                    self.page_count,
+                    self.first_published,
+                ]
+            )
+        )
+
+    # set while enrich() runs, which holds back update()'s saves and so
+    # doesn't enqueue more jobs; _enriched lists the fields it has changed
+    # from their values in _unenriched
+    _enriching = False
+    _enriched: frozenset[str] = frozenset()
+    _unenriched: dict[str, Any]
+
     # methods
 
     def __str__(self) -> str:
@@ -584,6 +915,7 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
                 authorship.save()
 
             del self.authors
+            del self.authorships
 
     def finish_reading(self) -> None:
         entry = self.log_entries.get(end_date=None)
@@ -613,7 +945,8 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
             end_precision=2,
         )
 
-    def save(self, *args: Any, **kwargs: Any) -> None:
+    # tidies up the fields every save does; bulk writes call this themselves
+    def normalise(self) -> None:
         if "goodreads" in self.image_url or "amazon" in self.image_url:
             self.image_url = re.sub(r"\._.+_\.jpg$", ".jpg", self.image_url)
 
@@ -628,41 +961,95 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
 
         self.publisher = clean_publisher(self.publisher)
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.normalise()
+
         if self.acquired_date and not self.alienated_date and not self.owned_by:
             self.owned_by = User.objects.get(username="ben")
 
-        orig_goodreads_id = self.goodreads_id
-        if self.id and (self.isbn or self.asin):
-            old = Book.objects.get(pk=self.id)
-            if self.isbn != old.isbn or self.asin != old.asin:
-                self.goodreads_id = ""
+        self.effective_owner_id = self.owned_by_id
+        if not self.owned_by_id and self.parent_edition_id:
+            self.effective_owner_id = (
+                Book.objects.filter(pk=self.parent_edition_id)
+                .values_list("effective_owner", flat=True)
+                .get()
+            )
+
+        refresh_goodreads = False
+        series_changed = bool(self.series)
+        if self.id and (old := Book.objects.filter(pk=self.id).first()):
+            if self.isbn or self.asin:
+                refresh_goodreads = self.isbn != old.isbn or self.asin != old.asin
+            series_changed = any(
+                getattr(self, field) != getattr(old, field)
+                for field in SERIES_INDEX_FIELDS
+            )
 
         super().save(*args, **kwargs)
 
-        verso.update(self)
-        if any([self.asin, self.isbn, (self.title and self.first_author)]) and (
-            not all([self.first_published, self.goodreads_id, self.image_url])
-        ):
-            goodreads.update(self)
-            if orig_goodreads_id and not self.goodreads_id:
-                self.goodreads_id = orig_goodreads_id
-                super().save(*args, **kwargs)
+        if series_changed:
+            Book.objects.clear_series_index()
 
-        if any([self.isbn, self.google_books_id]) and (
-            not all(
-                [
-                    self.google_books_id,
-                    self.publisher,
-                    self.page_count,
-                    self.first_published,
-                ]
-            )
-        ):
-            google.update(self)
-            verso.update(self)
+        if not self._enriching and (refresh_goodreads or self.needs_enrichment):
+            from .enrichment_job import EnrichmentJob
+
+            EnrichmentJob.objects.enqueue(self, refresh_goodreads=refresh_goodreads)
 
         self.save_other_editions()
         self.subeditions.all().update(want_to_read=self.want_to_read)
+        Book.objects.filter(parent_edition=self).update_effective_owners()
+
+    # fetches missing metadata from Goodreads, Google Books and Verso; this
+    # makes network requests, so saves leave it to run_enrichment_worker. With
+    # save=False nothing is written, so it can run on a worker thread and
+    # save_enrichment() can write the result later
+    def enrich(
+        self,
+        refresh_goodreads: bool = False,  # noqa: FBT001, FBT002
+        save: bool = True,  # noqa: FBT001, FBT002
+    ) -> None:
+        self._enriching = True
+        self._unenriched = {
+            field.attname: getattr(self, field.attname) for field in self._meta.fields
+        }
+        try:
+            verso.update(self)
+
+            # look up the Goodreads edition again, keeping the old one if none is found
+            orig_goodreads_id = self.goodreads_id
+            if refresh_goodreads:
+                self.goodreads_id = ""
+            if refresh_goodreads or self._needs_goodreads_data:
+                goodreads.update(self)
+                if orig_goodreads_id and not self.goodreads_id:
+                    self.goodreads_id = orig_goodreads_id
+
+            if self._needs_google_data:
+                google.update(self)
+                verso.update(self)
+        finally:
+            self._enriching = False
+
+        if save:
+            self.save_enrichment()
+
+    def save_enrichment(self) -> None:
+        if not self._enriched:
+            return
+
+        # the lookups take a while, and the book may have been edited since
+        # they started, so only fill in the fields which are as they were
+        book = Book.objects.get(pk=self.pk)
+        for field in self._enriched:
+            if getattr(book, field) == self._unenriched[field]:
+                setattr(book, field, getattr(self, field))
+
+        book._enriching = True  # noqa: SLF001
+        try:
+            book.save()
+        finally:
+            book._enriching = False  # noqa: SLF001
+        self._enriched = frozenset()
 
     def _slug_fields(self) -> list[str]:
         fields = []
@@ -689,7 +1076,7 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
             self.want_to_read = False
             self.save()
 
-    def to_json(self) -> dict[str, Any]:
+    def to_json(self) -> dict[str, Any]:  # noqa: C901
         fields = [
             "title",
             "subtitle",
@@ -732,43 +1119,44 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
             "id": self.id,
         }
         for field in fields:
-            value = getattr(self, field, None)
+            # foreign keys are exported by id, without fetching the related row
             if value_id := getattr(self, field + "_id", None):
                 result[field] = value_id
-            elif value or (field == "want_to_read" and value is False):
+            elif (value := getattr(self, field, None)) or (
+                field == "want_to_read" and value is False
+            ):
                 result[field] = value
-        if self.tags:
-            tags = flatten(((tag,), tag.parents_recursive) for tag in self.tags.all())
+        # everything below reads relations through .all(), so it's served by
+        # with_export_data's prefetches when they're there
+        result["tags"] = []
+        for tag in self.tags.all():
+            ancestors = sorted(
+                (link for link in tag.ancestor_links.all() if link.depth > 0),
+                key=lambda link: (-link.depth, link.ancestor_id),
+            )
+            result["tags"] += [tag.name, *[link.ancestor_id for link in ancestors]]
 
-            result["tags"] = [tag.name for tag in flatten(tags)]
-        if self.additional_authors.count():
+        if authorships := self.authorships:
             result["additional_authors"] = [
-                (author.id, author.role_for_book(self) or None)
-                for author in self.additional_authors.all()
+                (authorship.author_id, authorship.role or None)
+                for authorship in authorships
             ]
-        if self.log_entries.count():
-            result["log_entries"] = [log.to_json() for log in self.log_entries.all()]
-
-        if self.alternate_editions.count():
-            primary_edition = self.alternate_editions.first()
-            if (
-                primary_edition
-                and primary_edition != self
-                and self.id < primary_edition.id
-            ):
+        if log_entries := self.log_entries.all():
+            result["log_entries"] = [log.to_json() for log in log_entries]
+
+        if alternate_editions := self.alternate_editions.all():
+            primary_edition = alternate_editions[0]
+            if primary_edition != self and self.id < primary_edition.id:
                 result["primary_edition"] = primary_edition.id
 
-        if self.reading_lists.count():
-            result["reading_lists"] = [
-                (
-                    reading_list.title,
-                    reading_list.readinglistentry_set.get(book=self).order
-                    or list(
-                        reading_list.readinglistentry_set.values_list("book", flat=True)
-                    ).index(self.id),
+        if reading_lists := self.reading_lists.all():
+            result["reading_lists"] = []
+            for reading_list in reading_lists:
+                entries = list(reading_list.readinglistentry_set.all())
+                entry = next(entry for entry in entries if entry.book_id == self.id)
+                result["reading_lists"].append(
+                    (reading_list.title, entry.order or entries.index(entry))
                 )
-                for reading_list in self.reading_lists.all()
-            ]
 
         return result
 
@@ -784,9 +1172,11 @@ class Book(TimestampedModel, SluggableModel, BookWithEditions):
             if hasattr(self, key) and (force or not getattr(self, key)):
                 if value != getattr(self, key):
                     needs_save = True
+                    if self._enriching and key in self._unenriched:
+                        self._enriched |= {key}
                 setattr(self, key, value)
 
-        if needs_save:
+        if needs_save and not self._enriching:
             self.save()
         return self
 
@@ -0,0 +1,213 @@
+import logging
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import ClassVar
+
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from library.models.abc import TimestampedModel
+from library.utils import lookups
+
+from .book import Book
+
+logger = logging.getLogger(__name__)
+
+
+class EnrichmentJobManager(models.Manager["EnrichmentJob"]):
+    def enqueue(
+        self, book: Book, refresh_goodreads: bool = False  # noqa: FBT001, FBT002
+    ) -> "EnrichmentJob":
+        # at most one pending job per book; later saves fold into it
+        job, created = self.get_or_create(
+            book=book,
+            status=EnrichmentJob.Status.PENDING,
+            defaults={"refresh_goodreads": refresh_goodreads},
+        )
+        if not created and refresh_goodreads and not job.refresh_goodreads:
+            job.refresh_goodreads = True
+            job.save(update_fields=["refresh_goodreads", "modified_date"])
+        return job
+
+    def enqueue_many(
+        self,
+        books: Iterable[Book],
+        refresh_goodreads: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        # enqueue() for a batch of books, in a query or two rather than per book
+        books = list(books)
+        pending = self.filter(book__in=books, status=EnrichmentJob.Status.PENDING)
+        if refresh_goodreads:
+            pending.update(refresh_goodreads=True, modified_date=timezone.now())
+
+        waiting = set(pending.values_list("book", flat=True))
+        self.bulk_create(
+            [
+                EnrichmentJob(book=book, refresh_goodreads=refresh_goodreads)
+                for book in books
+                if book.pk not in waiting
+            ]
+        )
+
+    def claim(self) -> "EnrichmentJob | None":
+        # a job that's ready, or whose worker has stopped without finishing it
+        stale = timezone.now() - EnrichmentJob.STALE_AFTER
+        running = self.filter(
+            status=EnrichmentJob.Status.RUNNING, modified_date__gte=stale
+        )
+        while True:
+            job = (
+                self.filter(
+                    Q(
+                        status=EnrichmentJob.Status.PENDING,
+                        run_after__lte=timezone.now(),
+                    )
+                    | Q(status=EnrichmentJob.Status.RUNNING, modified_date__lt=stale)
+                )
+                .exclude(book__in=running.values("book"))
+                .order_by("run_after", "id")
+                .first()
+            )
+            if job is None:
+                return None
+
+            # another worker may have taken it between the select and the update
+            unclaimed = self.filter(
+                pk=job.pk, status=job.status, modified_date=job.modified_date
+            )
+            if job.attempts >= EnrichmentJob.MAX_ATTEMPTS:
+                # lost by as many workers as a failing job is retried
+                unclaimed.update(
+                    status=EnrichmentJob.Status.FAILED,
+                    last_error="the worker running it stopped",
+                    modified_date=timezone.now(),
+                )
+            elif unclaimed.update(
+                status=EnrichmentJob.Status.RUNNING,
+                attempts=job.attempts + 1,
+                modified_date=timezone.now(),
+            ):
+                job.refresh_from_db()
+                return job
+
+    def run_next(self) -> "EnrichmentJob | None":
+        if job := self.claim():
+            job.run()
+        return job
+
+    def run_batch(self, workers: int = lookups.WORKERS) -> list["EnrichmentJob"]:
+        # claims up to `workers` jobs and does their lookups side by side,
+        # then saves the results one at a time on this thread
+        jobs: list[EnrichmentJob] = []
+        while len(jobs) < workers and (job := self.claim()):
+            # the worker threads shouldn't have to load these themselves
+            job.book = Book.objects.select_related("first_author").get(pk=job.book_id)
+            jobs.append(job)
+
+        errors = lookups.map_concurrently(
+            lambda job: job.fetch(), jobs, workers=workers
+        )
+        for job, error in zip(jobs, errors, strict=True):
+            job.finish(error)
+        return jobs
+
+    def run_pending(self, workers: int = 1) -> int:
+        count = 0
+        while jobs := self.run_batch(workers):
+            count += len(jobs)
+        return count
+
+    def status_for(self, book: Book) -> str | None:
+        return (
+            self.filter(book=book)
+            .order_by("-created_date", "-id")
+            .values_list("status", flat=True)
+            .first()
+        )
+
+    def counts(self) -> dict[str, int]:
+        return dict(
+            self.values("status")
+            .annotate(count=models.Count("id"))
+            .values_list("status", "count")
+        )
+
+
+class EnrichmentJob(TimestampedModel):
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        DONE = "done"
+        FAILED = "failed"
+
+    MAX_ATTEMPTS = 5
+    # a running job which hasn't finished in this long has lost its worker
+    STALE_AFTER = timedelta(minutes=30)
+
+    book = models.ForeignKey(
+        Book, on_delete=models.CASCADE, related_name="enrichment_jobs"
+    )
+    status = models.CharField(
+        choices=Status.choices, db_index=True, default=Status.PENDING, max_length=10
+    )
+    refresh_goodreads = models.BooleanField(default=False)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_after = models.DateTimeField(db_index=True, default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+
+    objects: ClassVar[EnrichmentJobManager] = EnrichmentJobManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["book"],
+                condition=Q(status="pending"),
+                name="one_pending_enrichment_job_per_book",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.book_id}: {self.status}"
+
+    def run(self) -> None:
+        self.finish(self.fetch())
+
+    # the lookups, which write nothing, so can run on a worker thread
+    def fetch(self) -> Exception | None:
+        try:
+            self.book.enrich(refresh_goodreads=self.refresh_goodreads, save=False)
+        except Exception as error:  # noqa: BLE001
+            return error
+        return None
+
+    def finish(self, error: Exception | None) -> None:
+        if error is None:
+            try:
+                with transaction.atomic():
+                    self.book.save_enrichment()
+            except Exception as save_error:  # noqa: BLE001
+                error = save_error
+
+        if error is not None:
+            logger.warning("enriching %s failed: %s", self.book, error)
+            self.retry_or_fail(repr(error))
+        else:
+            self.status = self.Status.DONE
+            self.last_error = ""
+            self.save(update_fields=["status", "last_error", "modified_date"])
+
+    def retry_or_fail(self, error: str) -> None:
+        self.last_error = error
+        self.status = self.Status.FAILED
+        # the book was saved again while we ran, so the newer job takes over
+        newer = EnrichmentJob.objects.filter(
+            book_id=self.book_id, status=self.Status.PENDING
+        ).exclude(pk=self.pk)
+        if self.refresh_goodreads:
+            newer.update(refresh_goodreads=True)
+        superseded = newer.exists()
+        if self.attempts < self.MAX_ATTEMPTS and not superseded:
+            self.status = self.Status.PENDING
+            self.run_after = timezone.now() + timedelta(minutes=2**self.attempts)
+        self.save(update_fields=["status", "last_error", "run_after", "modified_date"])
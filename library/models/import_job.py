@@ -0,0 +1,192 @@
+import logging
+import time
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Any, ClassVar
+
+from django.db import models, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from library.models.abc import TimestampedModel
+
+from .book import Book
+
+logger = logging.getLogger(__name__)
+
+
+class ImportJobManager(models.Manager["ImportJob"]):
+    def submit(
+        self, records: Sequence[dict[str, Any]], status: str = "pending"
+    ) -> "ImportJob":
+        with transaction.atomic():
+            job = self.create(total=len(records), status=status)
+            ImportRecord.objects.bulk_create(
+                [
+                    ImportRecord(job=job, index=index, data=record)
+                    for index, record in enumerate(records)
+                ],
+                batch_size=ImportJob.BATCH_SIZE,
+            )
+        return job
+
+    def claim(self) -> "ImportJob | None":
+        # a job nobody has started, or whose worker has stopped checking in
+        stale = timezone.now() - ImportJob.STALE_AFTER
+        for job in self.filter(
+            Q(status=ImportJob.Status.PENDING)
+            | Q(status=ImportJob.Status.RUNNING, modified_date__lt=stale)
+        ).order_by("id"):
+            if self.filter(pk=job.pk, modified_date=job.modified_date).update(
+                status=ImportJob.Status.RUNNING, modified_date=timezone.now()
+            ):
+                job.refresh_from_db()
+                return job
+        return None
+
+    def resume(self) -> int:
+        count = 0
+        while job := self.claim():
+            logger.info("resuming import %s", job.pk)
+            job.run()
+            count += 1
+        return count
+
+
+class ImportJob(TimestampedModel):
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        DONE = "done"
+
+    # records imported together, and so in one transaction
+    BATCH_SIZE = 100
+    # a running job which hasn't checked in for this long has lost its worker
+    STALE_AFTER = timedelta(minutes=5)
+
+    status = models.CharField(
+        choices=Status.choices, db_index=True, default=Status.PENDING, max_length=10
+    )
+    total = models.PositiveIntegerField(default=0)
+    started_date = models.DateTimeField(blank=True, null=True)
+    finished_date = models.DateTimeField(blank=True, null=True)
+
+    objects: ClassVar[ImportJobManager] = ImportJobManager()
+
+    def __str__(self) -> str:
+        return f"{self.pk}: {self.status}"
+
+    def run(self) -> None:
+        if not self.started_date:
+            self.started_date = timezone.now()
+        self.status = self.Status.RUNNING
+        self.save(update_fields=["status", "started_date", "modified_date"])
+
+        # finished records are skipped, so a resumed job picks up where it was
+        while batch := list(
+            self.records.filter(status=ImportRecord.Status.PENDING).order_by("index")[
+                : self.BATCH_SIZE
+            ]
+        ):
+            self._import(batch)
+            # checks in, so claim() leaves this job alone
+            self.save(update_fields=["modified_date"])
+
+        self.status = self.Status.DONE
+        self.finished_date = timezone.now()
+        self.save(update_fields=["status", "finished_date", "modified_date"])
+
+    def _import(self, batch: list["ImportRecord"]) -> None:
+        from library.utils import importer
+
+        started = time.perf_counter()
+        try:
+            books = importer.import_records([record.data for record in batch])
+        except Exception as error:  # noqa: BLE001
+            if len(batch) > 1:
+                # one bad record spoils its batch, so find out which
+                for record in batch:
+                    self._import([record])
+                return
+            logger.warning("importing %s failed: %s", batch[0].data, error)
+            batch[0].status = ImportRecord.Status.FAILED
+            batch[0].error = repr(error)
+        else:
+            for record, (book, created) in zip(batch, books, strict=True):
+                record.status = ImportRecord.Status.DONE
+                record.book = book
+                record.created = created
+
+        # the batch is imported as one, so each record gets its share
+        duration = (time.perf_counter() - started) * 1000 / len(batch)
+        for record in batch:
+            record.duration_ms = duration
+        ImportRecord.objects.bulk_update(
+            batch, ["status", "book", "created", "error", "duration_ms"]
+        )
+
+    def progress(self) -> dict[str, Any]:
+        counts = dict(
+            self.records.values("status")
+            .annotate(count=Count("id"))
+            .values_list("status", "count")
+        )
+        done = counts.get(ImportRecord.Status.DONE, 0)
+        failed = counts.get(ImportRecord.Status.FAILED, 0)
+
+        elapsed = 0.0
+        if self.started_date:
+            end = self.finished_date or timezone.now()
+            elapsed = (end - self.started_date).total_seconds()
+
+        return {
+            "id": self.pk,
+            "status": self.status,
+            "total": self.total,
+            "done": done,
+            "failed": failed,
+            "pending": counts.get(ImportRecord.Status.PENDING, 0),
+            "records_per_second": round((done + failed) / elapsed, 1)
+            if elapsed
+            else None,
+            "errors": [
+                {
+                    "index": record.index,
+                    "title": record.data.get("title", ""),
+                    "error": record.error,
+                }
+                for record in self.records.filter(
+                    status=ImportRecord.Status.FAILED
+                ).order_by("index")[:20]
+            ],
+        }
+
+
+class ImportRecord(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        DONE = "done"
+        FAILED = "failed"
+
+    job = models.ForeignKey(ImportJob, on_delete=models.CASCADE, related_name="records")
+    index = models.PositiveIntegerField()
+    data = models.JSONField()
+    status = models.CharField(
+        choices=Status.choices, db_index=True, default=Status.PENDING, max_length=10
+    )
+    book = models.ForeignKey(
+        Book,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="import_records",
+    )
+    created = models.BooleanField(default=False)
+    error = models.TextField(blank=True, default="")
+    duration_ms = models.FloatField(blank=True, null=True)
+
+    class Meta:
+        unique_together = ("job", "index")
+
+    def __str__(self) -> str:
+        return f"{self.job_id}.{self.index}: {self.status}"
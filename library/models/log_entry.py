@@ -1,4 +1,5 @@
-from typing import Any
+from collections.abc import Collection
+from typing import Any, ClassVar
 
 from django.db import models
 from django.db.models import F, Q
@@ -8,7 +9,7 @@ from library.models.abc import TimestampedModel
 from library.utils import str2bool
 
 from .author import Author
-from .book import Book
+from .book import Book, card_data_lookups
 
 
 class LogEntryQuerySet(models.QuerySet["LogEntry"]):
@@ -18,6 +19,12 @@ class LogEntryQuerySet(models.QuerySet["LogEntry"]):
             | Q(book__additional_authors__gender__in=genders)
         )
 
+    def with_card_data(self) -> "LogEntryQuerySet":
+        select_related, prefetches = card_data_lookups("book__")
+        return self.select_related("book", *select_related).prefetch_related(
+            *prefetches
+        )
+
     def filter_by_request(self, request: Any) -> "LogEntryQuerySet":  # noqa: C901
         qs = self
         if gender := request.GET.get("gender"):
@@ -54,11 +61,13 @@ class LogEntryQuerySet(models.QuerySet["LogEntry"]):
         return qs
 
 
-LogEntryManager = models.Manager.from_queryset(LogEntryQuerySet)
+# subclassed rather than assigned, as mypy can't follow from_queryset()
+class LogEntryManager(models.Manager.from_queryset(LogEntryQuerySet)):  # type: ignore[misc]
+    pass
 
 
 class LogEntry(TimestampedModel):
-    objects = LogEntryManager()
+    objects: ClassVar[LogEntryManager] = LogEntryManager()
 
     book = models.ForeignKey(Book, on_delete=models.CASCADE, related_name="log_entries")
     start_date = models.DateTimeField(default=timezone.now, blank=True, null=True)
@@ -82,6 +91,9 @@ class LogEntry(TimestampedModel):
         choices=DatePrecision.choices, default=0
     )
 
+    # the stats year as loaded from the database, so saves can tell what changed
+    loaded_stats_year: int | None = None
+
     def __str__(self) -> str:
         text = str(self.book)
         if self.start_date:
@@ -109,6 +121,25 @@ class LogEntry(TimestampedModel):
             if (v := getattr(self, k))
         }
 
+    @classmethod
+    def from_db(
+        cls: type["LogEntry"],
+        db: str | None,
+        field_names: Collection[str],
+        values: Collection[Any],
+    ) -> "LogEntry":
+        instance = super().from_db(db, field_names, values)
+        if {"end_date", "exclude_from_stats"} <= set(field_names):
+            instance.loaded_stats_year = instance.stats_year
+        return instance
+
     @property
     def currently_reading(self) -> bool:
         return self.start_date is not None and self.end_date is None
+
+    # the year of the statistics report this entry counts towards, if any
+    @property
+    def stats_year(self) -> int | None:
+        if self.end_date and not self.exclude_from_stats:
+            return self.end_date.year
+        return None
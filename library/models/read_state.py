@@ -0,0 +1,116 @@
+from collections.abc import Iterable
+from typing import ClassVar
+
+from django.db import models
+from django.db.models import Count, Max, Q
+
+from .book import Book
+from .log_entry import LogEntry
+
+
+class ReadStateManager(models.Manager["ReadState"]):
+    def refresh(self, book_ids: Iterable[int]) -> None:
+        # subeditions inherit their parent's reads, so they change with it
+        affected = set(book_ids)
+        pending = set(affected)
+        while pending:
+            pending = (
+                set(
+                    Book.objects.filter(parent_edition__in=pending).values_list(
+                        "id", flat=True
+                    )
+                )
+                - affected
+            )
+            affected |= pending
+
+        parents: dict[int, int | None] = {}
+        pending = affected
+        while pending:
+            rows = dict(
+                Book.objects.filter(id__in=pending).values_list("id", "parent_edition")
+            )
+            parents.update(rows)
+            pending = {
+                parent for parent in rows.values() if parent and parent not in parents
+            }
+
+        # abandoned entries are finished but not read
+        read = Q(abandoned=False)
+        finished = {
+            row["book"]: (row["count"], row["last"])
+            for row in LogEntry.objects.filter(book__in=parents, end_date__isnull=False)
+            .values("book")
+            .annotate(count=Count("id", filter=read), last=Max("end_date", filter=read))
+        }
+        reading = set(
+            LogEntry.objects.filter(
+                book__in=affected, start_date__isnull=False, end_date__isnull=True
+            ).values_list("book", flat=True)
+        )
+
+        states = []
+        for read_state in self.filter(book__in=affected):
+            read_state.read_count = 0
+            read_state.last_read_date = None
+            read_state.has_finished = False
+
+            book_id: int | None = read_state.book_id
+            seen = set()
+            while book_id and book_id not in seen:
+                seen.add(book_id)
+                if book_id in finished:
+                    read_state.has_finished = True
+                count, last = finished.get(book_id, (0, None))
+                read_state.read_count += count
+                if last and (
+                    not read_state.last_read_date or last > read_state.last_read_date
+                ):
+                    read_state.last_read_date = last
+                book_id = parents.get(book_id)
+
+            read_state.is_read = read_state.read_count > 0
+            read_state.is_currently_reading = read_state.book_id in reading
+            states.append(read_state)
+
+        self.bulk_update(
+            states,
+            [
+                "is_read",
+                "has_finished",
+                "is_currently_reading",
+                "last_read_date",
+                "read_count",
+            ],
+        )
+        # bulk_update() sends no signals, and publisher_index() counts reads
+        Book.objects.clear_publisher_index()
+
+    def rebuild(self) -> None:
+        self.bulk_create(
+            [
+                ReadState(book_id=book_id)
+                for book_id in Book.objects.filter(read_state__isnull=True).values_list(
+                    "id", flat=True
+                )
+            ]
+        )
+        self.refresh(Book.objects.values_list("id", flat=True))
+
+
+class ReadState(models.Model):
+    # counts the book's own log entries and those of its ancestor editions
+    book = models.OneToOneField(
+        Book, on_delete=models.CASCADE, primary_key=True, related_name="read_state"
+    )
+    is_read = models.BooleanField(db_index=True, default=False)
+    # also set by abandoned entries, which keep a book out of unread()
+    has_finished = models.BooleanField(db_index=True, default=False)
+    is_currently_reading = models.BooleanField(db_index=True, default=False)
+    last_read_date = models.DateTimeField(db_index=True, blank=True, null=True)
+    read_count = models.PositiveSmallIntegerField(default=0)
+
+    objects: ClassVar[ReadStateManager] = ReadStateManager()
+
+    def __str__(self) -> str:
+        return f"{self.book_id}: read {self.read_count} times"
@@ -1,17 +1,121 @@
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from statistics import median
-from typing import Any
+from typing import Any, ClassVar
 
 from django.db import models
 
 from library.models.abc import TimestampedModel
 from library.models.author import Author
-from library.models.book import Book, BookQuerySet
+from library.models.book import Book, BookAuthor
 from library.models.log_entry import LogEntry
 
 GENRES = ["fiction", "non-fiction"]
+AUTHOR_ROLES = ["", "author", "editor"]
 
 Numeric = int | float
 
+# the flat breakdowns and the group of books each one counts
+BUCKETS: dict[str, int | str] = {
+    "by_men": Author.Gender.MALE,
+    "by_women": Author.Gender.FEMALE,
+    "by_multiple": "multiple",
+    "by_organisations": Author.Gender.ORGANIZATION,
+    "by_nonbinary": Author.Gender.NONBINARY,
+    "by_unknown": Author.Gender.UNKNOWN,
+    "by_poc": "poc",
+    "fiction": "fiction",
+    "nonfiction": "non-fiction",
+}
+GENDER_BUCKETS = {
+    group: field for field, group in BUCKETS.items() if isinstance(group, int)
+}
+GENRE_BUCKETS = {group: field for field, group in BUCKETS.items() if group in GENRES}
+
+
+class _PendingReports(threading.local):
+    def __init__(self) -> None:
+        self.years: set[int] = set()
+        self.suspended = 0
+
+
+_pending = _PendingReports()
+
+
+class StatisticsReportManager(models.Manager["StatisticsReport"]):
+    # years are stored as DirtyReportYear rows, and regenerated by the worker
+    # (run_enrichment_worker) rather than in the save that changed them
+    def mark_dirty(self, years: Iterable[int]) -> None:
+        _pending.years.update(years)
+        if _pending.years and not _pending.suspended:
+            self._store()
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        _pending.suspended += 1
+        try:
+            yield
+        finally:
+            _pending.suspended -= 1
+            if _pending.years and not _pending.suspended:
+                self._store()
+
+    def record_entry_change(
+        self,
+        entry: LogEntry,
+        old_year: int | None,
+        new_year: int | None,
+    ) -> None:
+        # a book joins or leaves a report only when this entry was, or now is,
+        # its only one counting towards that year
+        for year in {y for y in (old_year, new_year, 0) if y is not None}:
+            was_counted = old_year is not None and year in (0, old_year)
+            is_counted = new_year is not None and year in (0, new_year)
+            if was_counted == is_counted:
+                continue
+
+            others = LogEntry.objects.filter(
+                book=entry.book_id, end_date__isnull=False, exclude_from_stats=False
+            ).exclude(pk=entry.pk)
+            if year:
+                others = others.filter(end_date__year=year)
+            if not others.exists():
+                self._apply_book(year, entry.book_id, 1 if is_counted else -1)
+
+    def regenerate_dirty(self) -> list[int]:
+        years = set(DirtyReportYear.objects.values_list("year", flat=True))
+        if not years:
+            return []
+
+        # anything marked after this is picked up by the next run
+        DirtyReportYear.objects.filter(year__in=years).delete()
+        for year in sorted(years | {1, 0}):
+            report, created = self.get_or_create(year=year)
+            if not created:
+                report.generate()
+                report.save()
+        return sorted(years)
+
+    def _apply_book(self, year: int, book_id: int, sign: int) -> None:
+        # a report the worker is yet to regenerate can't be adjusted
+        if _pending.suspended or DirtyReportYear.objects.filter(year=year).exists():
+            self.mark_dirty([year])
+            return
+
+        report = self.filter(year=year).first()
+        if report and report.apply_book(book_id, sign):
+            report.save()
+        else:
+            self.mark_dirty([year])
+
+    def _store(self) -> None:
+        years, _pending.years = _pending.years, set()
+        DirtyReportYear.objects.bulk_create(
+            [DirtyReportYear(year=year) for year in years], ignore_conflicts=True
+        )
+
 
 class StatisticsReport(TimestampedModel):
     year = models.PositiveSmallIntegerField(primary_key=True)
@@ -30,6 +134,7 @@ class StatisticsReport(TimestampedModel):
     by_multiple = models.JSONField()
     by_organisations = models.JSONField()
     by_nonbinary = models.JSONField()
+    by_unknown = models.JSONField(default=dict)
     by_poc = models.JSONField()
 
     fiction = models.JSONField()
@@ -38,83 +143,111 @@ class StatisticsReport(TimestampedModel):
     gender_breakdowns = models.JSONField()
     genre_breakdowns = models.JSONField()
 
+    objects: ClassVar[StatisticsReportManager] = StatisticsReportManager()
+
     # derived properties
 
     # methods
 
+    def apply_book(self, book_id: int, sign: int) -> bool:
+        # adjusts the report for one book joining (1) or leaving (-1) it; returns
+        # False if it needs a full generate() to find the new longest/shortest
+        if not self.by_unknown or (
+            sign < 0 and book_id in (self.longest_id, self.shortest_id)
+        ):
+            return False
+
+        page_counts, groups = self._group_books(Book.objects.filter(pk=book_id))
+        if book_id not in page_counts:
+            return False
+        pages = page_counts[book_id]
+
+        def adjust(counts: dict[str, Numeric], *group_names: int | str) -> None:
+            if all(book_id in groups[group] for group in group_names):
+                counts["count"] += sign
+                counts["page_count"] += sign * pages
+
+        self.count += sign
+        self.page_count += sign * pages
+
+        # breakdowns are keyed by strings once they've been through the database
+        self.gender_breakdowns = {
+            str(gender): value for gender, value in self.gender_breakdowns.items()
+        }
+        self.genre_breakdowns = {
+            genre: {str(gender): value for gender, value in value.items()}
+            for genre, value in self.genre_breakdowns.items()
+        }
+
+        for field, group in BUCKETS.items():
+            adjust(getattr(self, field), group)
+            self._set_percents(getattr(self, field), self.count, self.page_count)
+
+        for gender in Author.Gender:
+            gender_totals = getattr(self, GENDER_BUCKETS[gender])
+            for genre in GENRES:
+                genre_totals = getattr(self, GENRE_BUCKETS[genre])
+                by_gender = self.gender_breakdowns[str(gender)][genre]
+                by_genre = self.genre_breakdowns[genre][str(gender)]
+                adjust(by_gender, gender, genre)
+                adjust(by_genre, gender, genre)
+                self._set_percents(
+                    by_gender, gender_totals["count"], gender_totals["page_count"]
+                )
+                self._set_percents(
+                    by_genre, genre_totals["count"], genre_totals["page_count"]
+                )
+
+        if pages > 0:
+            if sign > 0:
+                self._update_extremes(book_id, pages)
+            self.average_pages = self._median_pages()
+
+        return True
+
     def generate(self) -> None:
-        if self.year:
-            logs = LogEntry.objects.filter(end_date__year=self.year)
-        else:
-            logs = LogEntry.objects.filter(end_date__isnull=False)
-        logs = logs.filter(exclude_from_stats=False)
-        books = Book.objects.filter(id__in=logs.values_list("book_id", flat=True))
+        page_counts, groups = self._group_books(self._books())
+
+        def counts(book_ids: set[int], total_ids: Iterable[int]) -> dict[str, Numeric]:
+            return self._counts_for_books(book_ids, total_ids, page_counts)
 
-        self.count = books.count()
-        self.page_count = books.page_count
+        self.count = len(page_counts)
+        self.page_count = sum(page_counts.values())
 
-        books_with_page_count = books.exclude(page_count=0)
+        books_with_page_count = [
+            (page_count, book_id)
+            for book_id, page_count in page_counts.items()
+            if page_count > 0
+        ]
         self.average_pages = (
-            median(b.page_count for b in books_with_page_count)
-            if books_with_page_count.count()
+            median(page_count for page_count, _ in books_with_page_count)
+            if books_with_page_count
             else 0
         )
 
         if self.count:
-            self.shortest = (
-                books.filter(page_count__gt=0).order_by("page_count").first()
-            )
-            self.longest = (
-                books.filter(page_count__gt=0).order_by("-page_count").first()
-            )
+            self.shortest_id = min(books_with_page_count, default=(0, None))[1]
+            self.longest_id = min(
+                books_with_page_count,
+                key=lambda book: (-book[0], book[1]),
+                default=(0, None),
+            )[1]
 
-        self.by_men = self._counts_for_queryset(
-            books.by_men(), self.count, self.page_count
-        )
-        self.by_women = self._counts_for_queryset(
-            books.by_women(), self.count, self.page_count
-        )
-        self.by_multiple = self._counts_for_queryset(
-            books.by_multiple_genders(), self.count, self.page_count
-        )
-        self.by_organisations = self._counts_for_queryset(
-            books.by_gender(3), self.count, self.page_count
-        )
-        self.by_nonbinary = self._counts_for_queryset(
-            books.by_gender(4), self.count, self.page_count
-        )
-        self.by_poc = self._counts_for_queryset(
-            books.poc(), self.count, self.page_count
-        )
-
-        self.fiction = self._counts_for_queryset(
-            books.fiction(), self.count, self.page_count
-        )
-        self.nonfiction = self._counts_for_queryset(
-            books.nonfiction(), self.count, self.page_count
-        )
+        for field, group in BUCKETS.items():
+            setattr(self, field, counts(groups[group], page_counts))
 
         self.gender_breakdowns = {
             int(i): {
-                genre: self._counts_for_queryset(
-                    books.tagged(genre).by_gender(i),
-                    books.by_gender(i).count(),
-                    books.by_gender(i).page_count,
-                )
-                for genre in GENRES
+                genre: counts(groups[genre] & groups[i], groups[i]) for genre in GENRES
             }
             for i in Author.Gender
         }
         self.genre_breakdowns = {
             genre: {
-                int(i): self._counts_for_queryset(
-                    books.tagged(genre).by_gender(i),
-                    books.tagged(genre).count(),
-                    books.tagged(genre).page_count,
-                )
+                int(i): counts(groups[genre] & groups[i], groups[genre])
                 for i in Author.Gender
             }
-            for genre in ["fiction", "non-fiction"]
+            for genre in GENRES
         }
 
     def save(self, *args: Any, **kwargs: Any) -> None:
@@ -123,12 +256,109 @@ class StatisticsReport(TimestampedModel):
 
         super().save(*args, **kwargs)
 
-    def _counts_for_queryset(
-        self, qs: BookQuerySet, total_count: int, total_pages: int
+    def _books(self) -> "models.QuerySet[Book]":
+        if self.year:
+            logs = LogEntry.objects.filter(end_date__year=self.year)
+        else:
+            logs = LogEntry.objects.filter(end_date__isnull=False)
+        logs = logs.filter(exclude_from_stats=False)
+        return Book.objects.filter(id__in=logs.values_list("book_id", flat=True))
+
+    # fetches what each book contributes in three queries; the groups are keyed
+    # by author gender, genre, "multiple" (genders) and "poc"
+    def _group_books(
+        self, books: "models.QuerySet[Book]"
+    ) -> tuple[dict[int, int], defaultdict[int | str, set[int]]]:
+        page_counts: dict[int, int] = {}
+        first_author_genders: dict[int, int] = {}
+        groups: defaultdict[int | str, set[int]] = defaultdict(set)
+
+        for book_id, page_count, gender, poc, role in books.values_list(
+            "id",
+            "page_count",
+            "first_author__gender",
+            "first_author__poc",
+            "first_author_role",
+        ):
+            page_counts[book_id] = page_count
+            if gender is not None:
+                first_author_genders[book_id] = gender
+                groups[gender].add(book_id)
+            if poc and role in AUTHOR_ROLES:
+                groups["poc"].add(book_id)
+
+        for book_id, gender, poc, role in BookAuthor.objects.filter(
+            book__in=books
+        ).values_list("book", "author__gender", "author__poc", "role"):
+            groups[gender].add(book_id)
+            if first_author_genders.get(book_id, gender) != gender:
+                groups["multiple"].add(book_id)
+            if poc and role in AUTHOR_ROLES:
+                groups["poc"].add(book_id)
+
+        for book_id, genre in Book.tags.through.objects.filter(
+            book__in=books, tag__ancestor_links__ancestor__in=GENRES
+        ).values_list("book", "tag__ancestor_links__ancestor"):
+            groups[genre].add(book_id)
+
+        return page_counts, groups
+
+    def _counts_for_books(
+        self,
+        book_ids: set[int],
+        total_ids: Iterable[int],
+        page_counts: dict[int, int],
     ) -> dict[str, Numeric]:
-        return {
-            "count": qs.count(),
-            "page_count": qs.page_count,
-            "percent": qs.count() / max(1, total_count) * 100,
-            "pages_percent": qs.page_count / max(1, total_pages) * 100,
+        total_count = total_pages = 0
+        for book_id in total_ids:
+            total_count += 1
+            total_pages += page_counts[book_id]
+
+        counts: dict[str, Numeric] = {
+            "count": len(book_ids),
+            "page_count": sum(page_counts[book_id] for book_id in book_ids),
         }
+        self._set_percents(counts, total_count, total_pages)
+        return counts
+
+    def _median_pages(self) -> Numeric:
+        # only the middle one or two page counts leave the database
+        page_counts = (
+            self._books()
+            .filter(page_count__gt=0)
+            .order_by("page_count")
+            .values_list("page_count", flat=True)
+        )
+        total = page_counts.count()
+        return median(page_counts[(total - 1) // 2 : total // 2 + 1]) if total else 0
+
+    def _set_percents(
+        self, counts: dict[str, Numeric], total_count: int, total_pages: int
+    ) -> None:
+        counts["percent"] = counts["count"] / max(1, total_count) * 100
+        counts["pages_percent"] = counts["page_count"] / max(1, total_pages) * 100
+
+    def _update_extremes(self, book_id: int, pages: int) -> None:
+        extremes = dict(
+            Book.objects.filter(id__in=[self.longest_id, self.shortest_id]).values_list(
+                "id", "page_count"
+            )
+        )
+        if self.longest_id not in extremes or (-pages, book_id) < (
+            -extremes[self.longest_id],
+            self.longest_id,
+        ):
+            self.longest_id = book_id
+        if self.shortest_id not in extremes or (pages, book_id) < (
+            extremes[self.shortest_id],
+            self.shortest_id,
+        ):
+            self.shortest_id = book_id
+
+
+class DirtyReportYear(models.Model):
+    # a year whose report is out of date until the worker regenerates it
+    year = models.PositiveSmallIntegerField(primary_key=True)
+
+    def __str__(self) -> str:
+        return str(self.year)
@@ -1,8 +1,10 @@
-import operator
-from functools import reduce
-from typing import TYPE_CHECKING, Any
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Count
 from django.urls import reverse
 
 from library.models.abc import TimestampedModel
@@ -11,19 +13,69 @@ if TYPE_CHECKING:
     from .book import BookQuerySet  # pragma: no cover
 
 
+CLOUD_CACHE_KEY = "tag-cloud"
+
+
 class TagManager(models.Manager["Tag"]):
     def get(self, name: str) -> "Tag":
         tag, _ = Tag.objects.get_or_create(name=name.lower().strip())
         return tag
 
+    def cloud(self) -> dict[str, dict[str, int]]:
+        # the number of books tagged with each tag, and the number of fiction
+        # and non-fiction books under each tag or its children; kept until a
+        # tag or a book's tags change
+        return cache.get_or_set(CLOUD_CACHE_KEY, self._cloud, None) or {}
+
+    def clear_cloud(self) -> None:
+        cache.delete(CLOUD_CACHE_KEY)
+
+    def _cloud(self) -> dict[str, dict[str, int]]:
+        from .book import Book
+
+        names = list(self.values_list("name", flat=True))
+        through = Book.tags.through.objects
+        counts = {
+            "all": {
+                **dict.fromkeys(names, 0),
+                **dict(
+                    through.values("tag")
+                    .annotate(count=Count("book"))
+                    .values_list("tag", "count")
+                ),
+            }
+        }
+        for genre in ("fiction", "non-fiction"):
+            # each link counts towards the tag and all its ancestors
+            counts[genre] = {
+                **dict.fromkeys(names, 0),
+                **dict(
+                    through.filter(book__in=Book.objects.tagged(genre).values("id"))
+                    .values("tag__ancestor_links__ancestor")
+                    .annotate(count=Count("book", distinct=True))
+                    .values_list("tag__ancestor_links__ancestor", "count")
+                ),
+            }
+            # Tag.books_uniquely_tagged, without creating the genre's tag
+            counts[genre]["no other tags"] = (
+                Book.objects.tagged(genre)
+                .exclude(
+                    tags__in=self.exclude(name__in=[genre, "fiction", "non-fiction"])
+                )
+                .count()
+            )
+        return counts
+
 
 class Tag(TimestampedModel):
-    objects = TagManager()
+    objects: ClassVar[TagManager] = TagManager()
 
     class Meta:
         ordering = ("name",)
 
     name = models.CharField(max_length=64, primary_key=True)
+    # set just before the tag is deleted, for refreshing their closure after
+    deleted_descendants: list[str] | None = None
     parents = models.ManyToManyField(
         "self", related_name="children", blank=True, symmetrical=False
     )
@@ -37,12 +89,17 @@ class Tag(TimestampedModel):
             return parent.fullname + " :: " + self.name
         return self.name
 
+    @property
+    def ancestors(self) -> models.QuerySet["Tag"]:
+        return Tag.objects.filter(
+            descendant_links__descendant=self, descendant_links__depth__gt=0
+        ).order_by("-descendant_links__depth", "name")
+
     @property
     def books_recursive(self) -> "BookQuerySet":
-        books = self.books.distinct()
-        for child in self.children.all():
-            books |= child.books_recursive.distinct()
-        return books
+        from .book import Book
+
+        return Book.objects.tagged(self.name)
 
     @property
     def books_uniquely_tagged(self) -> "BookQuerySet":
@@ -51,31 +108,18 @@ class Tag(TimestampedModel):
 
     @property
     def parents_recursive(self) -> models.QuerySet["Tag"]:
-        return reduce(
-            operator.or_,
-            [p.parents_recursive for p in self.parents.all()],
-            self.parents.all(),
-        )
+        return self.ancestors
 
     @property
     def children_recursive(self) -> models.QuerySet["Tag"]:
-        return reduce(
-            operator.or_,
-            [c.children_recursive for c in self.children.all()],
-            self.children.all(),
+        return Tag.objects.filter(
+            ancestor_links__ancestor=self, ancestor_links__depth__gt=0
         )
 
     @property
     def related(self) -> models.QuerySet["Tag"]:
-        return reduce(
-            operator.or_,
-            [
-                Tag.objects.filter(
-                    name__in=[tag.name for tag in book.tags.all() if tag != self]
-                )
-                for book in self.books.all()
-            ],
-            Tag.objects.none(),
+        return Tag.objects.filter(
+            name__in=self.cooccurrences.exclude(other=self).values("other")
         )
 
     def __lt__(self, other: "Tag") -> bool:
@@ -87,3 +131,162 @@ class Tag(TimestampedModel):
     def save(self, *args: Any, **kwargs: Any) -> None:
         self.name = self.name.lower()
         super().save(*args, **kwargs)
+
+
+class TagClosureManager(models.Manager["TagClosure"]):
+    def refresh(self, tag_names: Iterable[str]) -> None:
+        parents: dict[str, set[str]] = defaultdict(set)
+        children: dict[str, set[str]] = defaultdict(set)
+        for child, parent in Tag.parents.through.objects.values_list(
+            "from_tag", "to_tag"
+        ):
+            parents[child].add(parent)
+            children[parent].add(child)
+
+        # anything below a changed tag might have gained or lost ancestors;
+        # the existing rows still know about descendants of removed links
+        affected = set(tag_names)
+        affected |= set(
+            self.filter(ancestor__in=affected).values_list("descendant", flat=True)
+        )
+        queue = deque(affected)
+        while queue:
+            for child in children[queue.popleft()] - affected:
+                affected.add(child)
+                queue.append(child)
+        affected &= set(
+            Tag.objects.filter(name__in=affected).values_list("name", flat=True)
+        )
+
+        rows = []
+        for tag in affected:
+            depths = {tag: 0}
+            queue = deque([tag])
+            while queue:
+                current = queue.popleft()
+                for parent in parents[current]:
+                    if parent not in depths:
+                        depths[parent] = depths[current] + 1
+                        queue.append(parent)
+            rows += [
+                TagClosure(ancestor_id=ancestor, descendant_id=tag, depth=depth)
+                for ancestor, depth in depths.items()
+            ]
+
+        with transaction.atomic():
+            self.filter(descendant__in=affected).delete()
+            self.bulk_create(rows)
+
+    def rebuild(self) -> None:
+        self.refresh(Tag.objects.values_list("name", flat=True))
+
+
+class TagClosure(models.Model):
+    # every tag is its own ancestor at depth 0
+    ancestor = models.ForeignKey(
+        Tag, on_delete=models.CASCADE, related_name="descendant_links"
+    )
+    descendant = models.ForeignKey(
+        Tag, on_delete=models.CASCADE, related_name="ancestor_links"
+    )
+    depth = models.PositiveSmallIntegerField()
+
+    objects: ClassVar[TagClosureManager] = TagClosureManager()
+
+    class Meta:
+        unique_together = ("ancestor", "descendant")
+        indexes = [models.Index(fields=["descendant", "depth"])]
+
+    def __str__(self) -> str:
+        return f"{self.ancestor_id} > {self.descendant_id} ({self.depth})"
+
+
+class TagCooccurrenceManager(models.Manager["TagCooccurrence"]):
+    def rebuild(self) -> None:
+        from .book import Book
+
+        # the book-tag links joined to themselves through their books
+        pairs = (
+            Book.tags.through.objects.values("tag", "book__tags")
+            .annotate(count=Count("book"))
+            .values_list("tag", "book__tags", "count")
+        )
+        with transaction.atomic():
+            self.all().delete()
+            self.bulk_create(
+                [
+                    TagCooccurrence(tag_id=tag, other_id=other, count=count)
+                    for tag, other, count in pairs
+                ],
+                batch_size=500,
+            )
+
+    def tags_for(self, book_ids: Iterable[int]) -> dict[int, set[str]]:
+        from .book import Book
+
+        tags: dict[int, set[str]] = {book_id: set() for book_id in book_ids}
+        for book_id, tag in Book.tags.through.objects.filter(
+            book__in=list(tags)
+        ).values_list("book", "tag"):
+            tags[book_id].add(tag)
+        return tags
+
+    def apply(
+        self, before: Mapping[int, set[str]], after: Mapping[int, set[str]]
+    ) -> None:
+        # moves the counts from each book's old tags to its new ones
+        deltas: Counter[tuple[str, str]] = Counter()
+        for book_id, old_tags in before.items():
+            deltas.subtract((tag, other) for tag in old_tags for other in old_tags)
+            new_tags = after.get(book_id, set())
+            deltas.update((tag, other) for tag in new_tags for other in new_tags)
+        deltas = Counter({pair: delta for pair, delta in deltas.items() if delta})
+        if not deltas:
+            return
+
+        tags = {tag for pair in deltas for tag in pair}
+        existing = {
+            pair: row
+            for row in self.filter(tag__in=tags, other__in=tags)
+            if (pair := (row.tag_id, row.other_id)) in deltas
+        }
+        for pair, row in existing.items():
+            row.count += deltas.pop(pair, 0)
+        with transaction.atomic():
+            self.bulk_update(
+                [row for row in existing.values() if row.count > 0], ["count"]
+            )
+            self.filter(
+                pk__in=[row.pk for row in existing.values() if row.count <= 0]
+            ).delete()
+            self.bulk_create(
+                [
+                    TagCooccurrence(tag_id=tag, other_id=other, count=delta)
+                    for (tag, other), delta in deltas.items()
+                    if delta > 0
+                ]
+            )
+
+    def matrix(self) -> dict[str, dict[str, int]]:
+        matrix: dict[str, dict[str, int]] = defaultdict(dict)
+        for tag, other, count in self.order_by("tag", "other").values_list(
+            "tag", "other", "count"
+        ):
+            matrix[tag][other] = count
+        return dict(matrix)
+
+
+class TagCooccurrence(models.Model):
+    # how many books have both tags; every pair is stored both ways round,
+    # and a tag paired with itself counts its books
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="cooccurrences")
+    other = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="+")
+    count = models.IntegerField()
+
+    objects: ClassVar[TagCooccurrenceManager] = TagCooccurrenceManager()
+
+    class Meta:
+        unique_together = ("tag", "other")
+
+    def __str__(self) -> str:
+        return f"{self.tag_id} & {self.other_id}: {self.count}"
@@ -1,12 +1,31 @@
+from collections.abc import Iterable
 from typing import Any
 
-from django.db.models import Model
-from django.db.models.signals import post_save, pre_save
+from django.db.models import Model, QuerySet
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
 from django.utils import timezone
 
-from library.models import Author, Book, LogEntry, StatisticsReport
+from library.models import (
+    Author,
+    AuthorNameToken,
+    Book,
+    BookAuthor,
+    LogEntry,
+    ReadState,
+    StatisticsReport,
+    Tag,
+    TagClosure,
+    TagCooccurrence,
+)
 from library.models.abc import TimestampedModel
+from library.utils import search_index
 
 
 @receiver(pre_save)
@@ -16,26 +35,17 @@ def update_timestamp_on_save(
     raw: bool,  # noqa: ARG001, FBT001
     using: str,  # noqa: ARG001
     update_fields: dict[str, Any],  # noqa: ARG001
-    **_kwargs: Any
+    **_kwargs: Any,
 ) -> None:
     if issubclass(sender, TimestampedModel):
         instance.modified_date = timezone.now()
 
 
-@receiver(post_save)
-def update_report_on_save(  # noqa: PLR0913  # not my function signature
-    sender: type[Model],  # noqa: ARG001
-    instance: Model,
-    created: bool,  # noqa: ARG001, FBT001
-    raw: bool,  # noqa: ARG001, FBT001
-    using: str,  # noqa: ARG001
-    update_fields: dict[str, Any],  # noqa: ARG001
-    **_kwargs: Any
-) -> None:
+@receiver(post_save, sender=Author)
+@receiver(post_save, sender=Book)
+def update_report_on_save(instance: Model, **_kwargs: Any) -> None:
     years = []
-    if isinstance(instance, LogEntry) and instance.end_date:
-        years = [instance.end_date.year]
-    elif isinstance(instance, Author):
+    if isinstance(instance, Author):
         years = list(
             instance.books.read().values_list("log_entries__end_date__year", flat=True)
         )
@@ -46,11 +56,255 @@ def update_report_on_save(  # noqa: PLR0913  # not my function signature
             )
         )
 
-    if not years:
+    StatisticsReport.objects.mark_dirty(year for year in years if year is not None)
+
+
+@receiver(post_save, sender=LogEntry)
+def update_report_on_logentry_save(
+    instance: LogEntry, created: bool, raw: bool, **_kwargs: Any  # noqa: FBT001
+) -> None:
+    if raw or not (created or "loaded_stats_year" in instance.__dict__):
+        # no idea what this entry counted towards before
+        StatisticsReport.objects.mark_dirty(
+            StatisticsReport.objects.values_list("year", flat=True)
+        )
+    else:
+        StatisticsReport.objects.record_entry_change(
+            instance, instance.loaded_stats_year, instance.stats_year
+        )
+    instance.loaded_stats_year = instance.stats_year
+
+
+@receiver(post_delete, sender=LogEntry)
+def update_report_on_logentry_delete(
+    instance: LogEntry, origin: Model | QuerySet[Any], **_kwargs: Any
+) -> None:
+    if origin is not instance:
+        # every entry of a book in a bulk or cascading delete would otherwise
+        # remove the book from the report again
+        StatisticsReport.objects.mark_dirty(
+            year for year in [instance.stats_year] if year is not None
+        )
+    else:
+        StatisticsReport.objects.record_entry_change(
+            instance, instance.stats_year, None
+        )
+
+
+def _reindex_books(book_ids: Iterable[int]) -> None:
+    search_index.index_books(
+        Book.objects.filter(id__in=book_ids)
+        .select_related("first_author")
+        .prefetch_related("additional_authors", "tags")
+    )
+
+
+@receiver(post_save, sender=Book)
+def update_search_index_on_book_save(
+    instance: Book, raw: bool, **_kwargs: Any  # noqa: FBT001
+) -> None:
+    if not raw:
+        _reindex_books([instance.pk])
+
+
+@receiver(post_delete, sender=Book)
+def update_search_index_on_book_delete(instance: Book, **_kwargs: Any) -> None:
+    search_index.remove_book(instance.pk)
+
+
+@receiver(post_save, sender=Author)
+def update_search_index_on_author_save(
+    instance: Author, raw: bool, **_kwargs: Any  # noqa: FBT001
+) -> None:
+    if not raw:
+        _reindex_books(instance.books.values_list("id", flat=True))
+
+
+@receiver(post_save, sender=Author)
+def update_author_name_tokens(
+    instance: Author, raw: bool, **_kwargs: Any  # noqa: FBT001
+) -> None:
+    if not raw:
+        AuthorNameToken.objects.refresh([instance])
+
+
+@receiver(post_save, sender=BookAuthor)
+@receiver(post_delete, sender=BookAuthor)
+def update_search_index_on_bookauthor_change(
+    instance: BookAuthor, raw: bool = False, **_kwargs: Any  # noqa: FBT001, FBT002
+) -> None:
+    if not raw:
+        _reindex_books([instance.book_id])
+
+
+@receiver(m2m_changed, sender=Book.tags.through)
+@receiver(m2m_changed, sender=Book.additional_authors.through)
+def update_search_index_on_m2m_change(
+    instance: Model,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[Any] | None,
+    **_kwargs: Any,
+) -> None:
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        _reindex_books([instance.pk])
+    elif pk_set:
+        _reindex_books(pk_set)
+
+
+@receiver(post_save, sender=Tag)
+def create_tag_closure(
+    instance: Tag, created: bool, **_kwargs: Any  # noqa: FBT001
+) -> None:
+    if created:
+        TagClosure.objects.get_or_create(
+            ancestor=instance, descendant=instance, defaults={"depth": 0}
+        )
+
+
+@receiver(m2m_changed, sender=Tag.parents.through)
+def update_tag_closure(
+    instance: Tag,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[str] | None,
+    **_kwargs: Any,
+) -> None:
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        # this tag's parents changed
+        TagClosure.objects.refresh([instance.name])
+    elif pk_set:
+        # some of this tag's children changed
+        TagClosure.objects.refresh(pk_set)
+    else:
+        # all children removed: the stale closure still lists them
+        TagClosure.objects.refresh(
+            instance.descendant_links.values_list("descendant", flat=True)
+        )
+
+
+@receiver(pre_delete, sender=Tag)
+def remember_tag_descendants(instance: Tag, **_kwargs: Any) -> None:
+    # deleting the tag drops its links without an m2m_changed, and only the
+    # closure rows which mention it, not those it connected
+    instance.deleted_descendants = list(
+        instance.descendant_links.filter(depth__gt=0).values_list(
+            "descendant", flat=True
+        )
+    )
+
+
+@receiver(post_delete, sender=Tag)
+def update_tag_closure_on_delete(instance: Tag, **_kwargs: Any) -> None:
+    if instance.deleted_descendants:
+        TagClosure.objects.refresh(instance.deleted_descendants)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Book)
+@receiver(m2m_changed, sender=Book.tags.through)
+@receiver(m2m_changed, sender=Tag.parents.through)
+def clear_tag_cloud(**_kwargs: Any) -> None:
+    Tag.objects.clear_cloud()
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+@receiver(post_save, sender=LogEntry)
+@receiver(post_delete, sender=LogEntry)
+def clear_publisher_index(**_kwargs: Any) -> None:
+    Book.objects.clear_publisher_index()
+
+
+@receiver(post_delete, sender=Book)
+def clear_series_index_on_book_delete(instance: Book, **_kwargs: Any) -> None:
+    if instance.series:
+        Book.objects.clear_series_index()
+
+
+@receiver(post_save, sender=BookAuthor)
+@receiver(post_delete, sender=BookAuthor)
+@receiver(m2m_changed, sender=Book.additional_authors.through)
+def clear_series_index_on_author_change(**_kwargs: Any) -> None:
+    Book.objects.clear_series_index()
+
+
+@receiver(m2m_changed, sender=Book.tags.through)
+def update_tag_cooccurrences(
+    instance: Book | Tag,
+    action: str,
+    pk_set: set[Any] | None,
+    **_kwargs: Any,
+) -> None:
+    # the links haven't changed yet, so work out what they're about to be
+    if action not in ("pre_add", "pre_remove", "pre_clear"):
+        return
+
+    if isinstance(instance, Tag):
+        if pk_set is None:
+            pk_set = set(
+                Book.tags.through.objects.filter(tag=instance).values_list(
+                    "book", flat=True
+                )
+            )
+        before = TagCooccurrence.objects.tags_for(pk_set)
+        changed = {instance.name}
+    else:
+        before = TagCooccurrence.objects.tags_for([instance.id])
+        changed = before[instance.id] if pk_set is None else pk_set
+
+    after = {
+        book_id: tags | changed if action == "pre_add" else tags - changed
+        for book_id, tags in before.items()
+    }
+    TagCooccurrence.objects.apply(before, after)
+
+
+@receiver(pre_delete, sender=Book)
+def remove_tag_cooccurrences(instance: Book, **_kwargs: Any) -> None:
+    TagCooccurrence.objects.apply(TagCooccurrence.objects.tags_for([instance.pk]), {})
+
+
+def _refresh_read_state(book: Book) -> None:
+    ReadState.objects.refresh([book.pk])
+    if Book.read_state.is_cached(book):  # type: ignore[attr-defined]
+        book.read_state.refresh_from_db()
+
+
+@receiver(post_save, sender=Book)
+def update_read_state_on_book_save(
+    instance: Book, raw: bool, **_kwargs: Any  # noqa: FBT001
+) -> None:
+    if not raw:
+        ReadState.objects.get_or_create(book_id=instance.pk)
+        _refresh_read_state(instance)
+
+
+@receiver(pre_delete, sender=Book)
+def detach_subeditions_on_book_delete(instance: Book, **_kwargs: Any) -> None:
+    # subeditions are about to lose this book's reads and ownership
+    subeditions = list(instance.subeditions.values_list("id", flat=True))
+    instance.subeditions.update(parent_edition=None)
+    ReadState.objects.refresh(subeditions)
+    Book.objects.filter(id__in=subeditions).update_effective_owners()
+
+
+@receiver(post_save, sender=LogEntry)
+@receiver(post_delete, sender=LogEntry)
+def update_read_state_on_logentry_change(
+    instance: LogEntry, raw: bool = False, **_kwargs: Any  # noqa: FBT001, FBT002
+) -> None:
+    if raw:
         return
 
-    for year in [*years, 1, 0]:
-        report, report_created = StatisticsReport.objects.get_or_create(year=year)
-        if not report_created:
-            report.generate()
-            report.save()
+    if LogEntry.book.is_cached(instance):
+        _refresh_read_state(instance.book)
+    else:
+        ReadState.objects.refresh([instance.book_id])
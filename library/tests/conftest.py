@@ -1,7 +1,10 @@
 import pytest
+from django.core.cache import cache
+from django.core.cache.backends.filebased import FileBasedCache
 from pytest_factoryboy import register
 
 from library.factories import AuthorFactory, BookFactory, TagFactory, UserFactory
+from library.utils import search_index
 
 register(AuthorFactory)
 register(BookFactory)
@@ -9,11 +12,51 @@ register(TagFactory)
 register(UserFactory)
 
 
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):  # noqa: ARG001, PT004
+    # --nomigrations skips the migration which creates the search index
+    with django_db_blocker.unblock():
+        search_index.create_table()
+
+
 @pytest.fixture(autouse=True)
 def _unset_goodreads_key(settings):
     settings.GOODREADS_KEY = None
 
 
+@pytest.fixture(autouse=True)
+def _disable_http_cache(settings):
+    settings.HTTP_CACHE_PATH = None
+
+
+@pytest.fixture(autouse=True)
+def _disable_rate_limits(settings):
+    settings.HTTP_RATE_LIMITS = False
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(settings):
+    # each test process gets its own cache, which outlives each test's
+    # rolled-back database
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    yield
+    cache.clear()
+
+
+@pytest.fixture()
+def other_worker_cache(settings, tmp_path):
+    # the file cache the site uses, and how another process sees it
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": tmp_path,
+        }
+    }
+    return FileBasedCache(tmp_path, {})
+
+
 @pytest.fixture()
 def _goodreads_key(settings):
     settings.GOODREADS_KEY = "TEST_FAKE"
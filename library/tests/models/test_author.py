@@ -67,3 +67,108 @@ class TestAuthor:
     def test_author_get_by_single_name_organisation(self, author_factory):
         author = author_factory(forenames="", surname="Smithee Books")
         assert Author.objects.get_by_single_name("Smithee Books") == author
+
+    def test_author_get_by_single_name_ignores_accents_and_case(self, author_factory):
+        author = author_factory(forenames="Gabriel García", surname="Márquez")
+        assert Author.objects.get_by_single_name("gabriel garcia marquez") == author
+
+    def test_author_get_by_single_name_prefers_exact_spelling(self, author_factory):
+        folded = author_factory(forenames="Emile", surname="Zola")
+        exact = author_factory(forenames="Émile", surname="Zola")
+        assert Author.objects.get_by_single_name("Émile Zola") == exact
+        assert Author.objects.get_by_single_name("emile zola") == folded
+
+    def test_author_get_by_single_name_prefers_name_to_preferred_name(
+        self, author_factory
+    ):
+        author_factory(forenames="Alan", preferred_forenames="Al", surname="Smithee")
+        al = author_factory(forenames="Al", surname="Smithee")
+        assert Author.objects.get_by_single_name("al smithee") == al
+
+    def test_author_get_or_create_by_ambiguous_name(self, author_factory):
+        author = author_factory(forenames="Emile", surname="Zola")
+        author_factory(forenames="EMILE", surname="ZOLA")
+        assert Author.objects.get_or_create_by_single_name("Émile Zola") == (
+            author,
+            False,
+        )
+        assert Author.objects.get_or_create_many_by_single_name(["Émile Zola"]) == {
+            "Émile Zola": (author, False)
+        }
+
+    def test_author_name_keys_kept_up_to_date(self, author_factory):
+        author = author_factory(forenames="Alan", surname="Smithee")
+        author.preferred_forenames = "Al"
+        author.save(update_fields=["preferred_forenames"])
+        author.refresh_from_db()
+        assert author.name_key == "alan smithee"
+        assert author.preferred_name_key == "al smithee"
+        assert Author.objects.get_by_single_name("Al Smithee") == author
+
+    def test_author_search(self, author_factory):
+        author = author_factory(forenames="Émile", surname="Zola")
+        author_factory(forenames="Alan", surname="Smithee")
+        assert list(Author.objects.search("emile")) == [author]
+        assert list(Author.objects.search("Zol")) == [author]
+        assert not Author.objects.search("ola")
+
+    def test_author_search_after_rename(self, author_factory):
+        author = author_factory(forenames="Alan", surname="Smithee")
+        author.surname = "Smith"
+        author.save()
+        assert list(Author.objects.search("Smith")) == [author]
+        assert not Author.objects.search("Smithee")
+
+    def test_author_search_by_pseudonym(self, author_factory):
+        author = author_factory(forenames="Stephen", surname="King")
+        pseudonym = author_factory(
+            forenames="Richard", surname="Bachman", primary_identity=author
+        )
+        assert set(Author.objects.search("Bachman")) == {author, pseudonym}
+
+    def test_author_books_by_role(self, author_factory, book_factory):
+        author = author_factory()
+        written = book_factory(first_author=author)
+        co_written = book_factory()
+        co_written.add_author(author, role="author")
+        edited = book_factory(first_author=author, first_author_role="editor")
+        translated = book_factory()
+        translated.add_author(author, role="translator")
+        book_factory()
+
+        assert set(author.books) == {written, co_written, edited, translated}
+        assert set(author.authored_books) == {written, co_written}
+        assert list(author.edited_books) == [edited]
+
+    def test_author_with_book_summary(
+        self, author_factory, book_factory, django_assert_num_queries
+    ):
+        author = author_factory()
+        book_factory(first_author=author, title="Edited", first_author_role="editor")
+        book_factory(first_author=author, title="Written", subtitle="A Novel")
+        translator = author_factory()
+        translated = book_factory(edition_title="Traduit", title="Translated")
+        translated.add_author(translator, role="translator")
+        nobody = author_factory()
+
+        with django_assert_num_queries(1):
+            summaries = {
+                summary.pk: summary
+                for summary in Author.objects.with_book_summary()
+                if summary.pk in (author.pk, translator.pk, nobody.pk)
+            }
+        assert (
+            summaries[author.pk].authored_count,
+            summaries[author.pk].edited_count,
+            summaries[author.pk].book_count,
+            summaries[author.pk].representative_title,
+        ) == (1, 1, 2, "Written: A Novel")
+        assert (
+            summaries[translator.pk].authored_count,
+            summaries[translator.pk].book_count,
+            summaries[translator.pk].representative_title,
+        ) == (0, 1, "Traduit")
+        assert (
+            summaries[nobody.pk].book_count,
+            summaries[nobody.pk].representative_title,
+        ) == (0, "")
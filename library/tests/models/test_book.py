@@ -55,6 +55,29 @@ class TestBook:
             == f"{book.first_author}, _{book.display_title}_, ed. by {author}"
         )
 
+    def test_author_roles_prefetched(
+        self, book_factory, author_factory, django_assert_num_queries
+    ):
+        editor = author_factory()
+        for _ in range(3):
+            edited = book_factory(first_author_role="editor")
+            edited.add_author(author_factory(), order=1, role="editor")
+            book_factory().add_author(editor, order=1, role="editor")
+
+        with django_assert_num_queries(3):
+            books = list(
+                Book.objects.with_authorships().prefetch_related("alternate_editions")
+            )
+            details = [book.display_details for book in books]
+            attributions = [
+                author.attribution_for(book)
+                for book in books
+                for author in book.all_authors
+            ]
+        assert len(details) == 6
+        assert sum(book.all_authors_editors for book in books) == 3
+        assert attributions.count(f"{editor} (ed.)") == 3
+
     def test_search_by_title(self, book):
         results = Book.objects.search(book.title)
         assert book in results
@@ -118,6 +141,55 @@ class TestBook:
         assert book2.display_series == "Foo, #2"
         assert book_collection.display_series == "Foo, #1–2"
 
+    def test_effective_owner_any_depth(self, book_factory, user):
+        root = book_factory()
+        child = book_factory(parent_edition=root)
+        grandchild = book_factory(parent_edition=child)
+        great_grandchild = book_factory(parent_edition=grandchild)
+
+        root.owned_by = user
+        root.save()
+
+        great_grandchild.refresh_from_db()
+        assert great_grandchild.effective_owner == user
+        assert great_grandchild.owned
+        assert great_grandchild.parent_owned
+        assert set(Book.objects.owned()) == {root, child, grandchild, great_grandchild}
+        assert not Book.objects.unowned()
+
+        root.owned_by = None
+        root.save()
+        assert set(Book.objects.unowned()) == {
+            root,
+            child,
+            grandchild,
+            great_grandchild,
+        }
+
+    def test_effective_owner_nearest_ancestor(self, book_factory, user_factory):
+        ben = user_factory(username="ben")
+        sara = user_factory(username="sara")
+        root = book_factory(owned_by=ben)
+        child = book_factory(parent_edition=root, owned_by=sara)
+        grandchild = book_factory(parent_edition=child)
+
+        assert grandchild.owned_by_sara
+        assert not grandchild.owned
+        assert set(Book.objects.owned_by("sara")) == {child, grandchild}
+        assert set(Book.objects.available()) == {root, child, grandchild}
+
+        child.delete()
+        grandchild.refresh_from_db()
+        assert grandchild.effective_owner is None
+        assert grandchild in Book.objects.unowned()
+
+    def test_borrowed(self, book_factory):
+        book = book_factory(was_borrowed=True, borrowed_from="library")
+        book_factory()
+
+        assert list(Book.objects.borrowed()) == [book]
+        assert list(Book.objects.available()) == [book]
+
     @pytest.mark.parametrize(
         ("actual", "expected"),
         [
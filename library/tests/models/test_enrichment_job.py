@@ -0,0 +1,213 @@
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from library.models import Book, EnrichmentJob
+
+
+@pytest.mark.django_db()
+class TestEnrichmentJob:
+    @pytest.fixture()
+    def _mock_goodreads(self, requests_mock, _goodreads_key):
+        with Path("library/fixtures/marx.xml").open() as fixture:
+            requests_mock.get(
+                "https://www.goodreads.com/search/index.xml?key=TEST_FAKE&q=9781844678761",
+                text=fixture.read(),
+            )
+        requests_mock.get(
+            "https://www.googleapis.com/books/v1/volumes?q=isbn:9781844678761",
+            json={},
+        )
+
+    @pytest.fixture()
+    def _failing_enrichment(self, monkeypatch):
+        def enrich(*_args, **_kwargs):
+            raise ConnectionError
+
+        monkeypatch.setattr(Book, "enrich", enrich)
+
+    def test_save_enqueues_one_job(self, book):
+        book.save()
+        book.save()
+
+        job = EnrichmentJob.objects.get(book=book)
+        assert job.status == EnrichmentJob.Status.PENDING
+        assert EnrichmentJob.objects.status_for(book) == "pending"
+
+    def test_complete_book_is_not_enqueued(self, book_factory):
+        book = book_factory(
+            isbn="",
+            first_published=1848,
+            goodreads_id="2205479",
+            image_url="http://a.b/c.jpg",
+        )
+
+        assert EnrichmentJob.objects.status_for(book) is None
+
+    @pytest.mark.usefixtures("_mock_goodreads")
+    def test_worker_enriches_book(self, book_factory):
+        book = book_factory(isbn="9781844678761", first_author__surname="Marx")
+        assert not book.goodreads_id
+
+        assert EnrichmentJob.objects.run_pending() == 1
+
+        book.refresh_from_db()
+        assert book.goodreads_id == "13403951"
+        assert book.first_published == 1848
+        assert EnrichmentJob.objects.status_for(book) == "done"
+        assert not EnrichmentJob.objects.filter(status="pending").exists()
+
+    @pytest.mark.usefixtures("_goodreads_key")
+    def test_changed_isbn_keeps_goodreads_id_when_not_found(
+        self, book_factory, requests_mock
+    ):
+        requests_mock.get(
+            "https://www.goodreads.com/search/index.xml?key=TEST_FAKE&q=9780000000002",
+            text="<GoodreadsResponse><search><results></results></search></GoodreadsResponse>",
+        )
+        book = book_factory(
+            isbn="9780000000001",
+            first_published=1848,
+            goodreads_id="2205479",
+            image_url="http://a.b/c.jpg",
+        )
+        book.isbn = "9780000000002"
+        book.save()
+
+        assert EnrichmentJob.objects.get(book=book).refresh_goodreads
+        EnrichmentJob.objects.run_pending()
+
+        book.refresh_from_db()
+        assert book.goodreads_id == "2205479"
+
+    @pytest.mark.usefixtures("_failing_enrichment")
+    def test_failed_job_is_retried_later(self, book):
+        EnrichmentJob.objects.run_pending()
+
+        job = EnrichmentJob.objects.get(book=book)
+        assert job.status == EnrichmentJob.Status.PENDING
+        assert job.attempts == 1
+        assert job.run_after > timezone.now()
+        assert "ConnectionError" in job.last_error
+        assert EnrichmentJob.objects.claim() is None
+
+    @pytest.mark.usefixtures("_failing_enrichment")
+    def test_job_fails_after_max_attempts(self, book):
+        job = EnrichmentJob.objects.get(book=book)
+        for _ in range(EnrichmentJob.MAX_ATTEMPTS):
+            EnrichmentJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+            EnrichmentJob.objects.run_next()
+
+        job.refresh_from_db()
+        assert job.status == EnrichmentJob.Status.FAILED
+        assert job.attempts == EnrichmentJob.MAX_ATTEMPTS
+
+    @pytest.mark.usefixtures("_failing_enrichment")
+    def test_failed_job_superseded_by_newer_save(self, book):
+        job = EnrichmentJob.objects.claim()
+        book.save()
+
+        job.run()
+
+        assert job.status == EnrichmentJob.Status.FAILED
+        assert EnrichmentJob.objects.status_for(book) == "pending"
+
+    def test_running_job_blocks_newer_job_for_same_book(self, book):
+        assert EnrichmentJob.objects.claim()
+        book.save()
+
+        assert EnrichmentJob.objects.claim() is None
+
+    def test_stale_running_job_is_claimed_again(self, book):
+        job = EnrichmentJob.objects.claim()
+        EnrichmentJob.objects.filter(pk=job.pk).update(
+            modified_date=timezone.now() - EnrichmentJob.STALE_AFTER
+        )
+        book.save()
+
+        reclaimed = EnrichmentJob.objects.claim()
+        assert reclaimed == job
+        assert reclaimed.attempts == 2
+        assert EnrichmentJob.objects.claim() is None
+
+    @pytest.mark.usefixtures("book")
+    def test_stale_running_job_fails_after_max_attempts(self):
+        job = EnrichmentJob.objects.claim()
+        EnrichmentJob.objects.filter(pk=job.pk).update(
+            attempts=EnrichmentJob.MAX_ATTEMPTS,
+            modified_date=timezone.now() - EnrichmentJob.STALE_AFTER,
+        )
+
+        assert EnrichmentJob.objects.claim() is None
+        job.refresh_from_db()
+        assert job.status == EnrichmentJob.Status.FAILED
+        assert "stopped" in job.last_error
+
+    @pytest.mark.usefixtures("_mock_goodreads")
+    def test_edits_made_during_lookups_are_kept(self, book_factory):
+        book = book_factory(isbn="9781844678761", first_author__surname="Marx")
+        job = EnrichmentJob.objects.claim()
+        assert job.fetch() is None
+
+        book.refresh_from_db()
+        book.title = "Edited"
+        book.first_published = 1867
+        book.save()
+        job.finish(None)
+
+        book.refresh_from_db()
+        assert book.title == "Edited"
+        assert book.first_published == 1867
+        assert book.goodreads_id == "13403951"
+
+    def test_worker_command(self, book_factory, caplog):
+        book_factory.create_batch(2)
+
+        call_command("run_enrichment_worker", "--once")
+        call_command("run_enrichment_worker", "--status")
+
+        assert EnrichmentJob.objects.counts() == {"done": 2}
+        assert "done: 2" in caplog.text
+
+    @pytest.mark.usefixtures("_goodreads_key")
+    def test_exhausted_google_quota_is_retried_later(self, book_factory, requests_mock):
+        requests_mock.get(
+            "https://www.goodreads.com/search/index.xml",
+            text="<GoodreadsResponse><search><results></results></search></GoodreadsResponse>",
+        )
+        requests_mock.get(
+            "https://www.googleapis.com/books/v1/volumes?q=isbn:9781844678761",
+            status_code=429,
+            json={"error": {"status": "RESOURCE_EXHAUSTED"}},
+        )
+        book = book_factory(isbn="9781844678761")
+
+        EnrichmentJob.objects.run_pending()
+
+        job = EnrichmentJob.objects.get(book=book)
+        assert job.status == EnrichmentJob.Status.PENDING
+        assert "RateLimitedError" in job.last_error
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentEnrichment:
+    @pytest.mark.usefixtures("_goodreads_key")
+    def test_batch_looks_up_books_side_by_side(self, book_factory, requests_mock):
+        requests_mock.get(
+            "https://www.goodreads.com/search/index.xml",
+            text=Path("library/fixtures/marx.xml").read_text(),
+        )
+        requests_mock.get("https://www.googleapis.com/books/v1/volumes", json={})
+        books = book_factory.create_batch(3, first_author__surname="Marx")
+
+        jobs = EnrichmentJob.objects.run_batch(workers=3)
+
+        assert {job.book_id for job in jobs} == {book.pk for book in books}
+        assert EnrichmentJob.objects.counts() == {"done": 3}
+        assert set(
+            Book.objects.filter(id__in=[book.pk for book in books]).values_list(
+                "goodreads_id", flat=True
+            )
+        ) == {"13403951"}
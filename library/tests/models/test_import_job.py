@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from library.models import Book, ImportJob, ImportRecord
+
+
+def records(count, start=0):
+    return [
+        {"title": f"Book {index}", "authors": [(f"Jane Writer{index}", "")]}
+        for index in range(start, start + count)
+    ]
+
+
+@pytest.mark.django_db()
+class TestImportJob:
+    def test_submit(self):
+        job = ImportJob.objects.submit(records(3))
+
+        assert job.status == ImportJob.Status.PENDING
+        assert job.total == 3
+        assert list(job.records.values_list("index", "status")) == [
+            (0, "pending"),
+            (1, "pending"),
+            (2, "pending"),
+        ]
+
+    def test_run(self, monkeypatch):
+        monkeypatch.setattr(ImportJob, "BATCH_SIZE", 2)
+        job = ImportJob.objects.submit(records(5))
+
+        job.run()
+
+        assert job.status == ImportJob.Status.DONE
+        assert job.finished_date
+        assert Book.objects.count() == 5
+        for record in job.records.all():
+            assert record.status == ImportRecord.Status.DONE
+            assert record.book.title == record.data["title"]
+            assert record.created
+            assert record.duration_ms > 0
+
+    def test_bad_record_fails_alone(self):
+        job = ImportJob.objects.submit(
+            [*records(2), {"title": "Anonymous", "authors": []}, *records(1, start=2)]
+        )
+
+        job.run()
+
+        assert Book.objects.count() == 3
+        failed = job.records.get(status=ImportRecord.Status.FAILED)
+        assert failed.index == 2
+        assert "no authors" in failed.error
+
+        progress = job.progress()
+        assert progress["done"] == 3
+        assert progress["failed"] == 1
+        assert progress["pending"] == 0
+        assert progress["errors"] == [
+            {"index": 2, "title": "Anonymous", "error": failed.error}
+        ]
+
+    def test_progress_before_start(self):
+        progress = ImportJob.objects.submit(records(2)).progress()
+
+        assert progress["status"] == "pending"
+        assert progress["pending"] == 2
+        assert progress["records_per_second"] is None
+
+    def test_resume_skips_finished_records(self):
+        job = ImportJob.objects.submit(records(3), status=ImportJob.Status.RUNNING)
+        job.records.filter(index=0).update(status=ImportRecord.Status.DONE)
+        ImportJob.objects.filter(pk=job.pk).update(
+            modified_date=timezone.now() - timedelta(hours=1)
+        )
+
+        call_command("resume_imports")
+
+        job.refresh_from_db()
+        assert job.status == ImportJob.Status.DONE
+        assert list(Book.objects.values_list("title", flat=True).order_by("id")) == [
+            "Book 1",
+            "Book 2",
+        ]
+
+    def test_worker_resumes_interrupted_imports(self):
+        job = ImportJob.objects.submit(records(2), status=ImportJob.Status.RUNNING)
+        ImportJob.objects.filter(pk=job.pk).update(
+            modified_date=timezone.now() - timedelta(hours=1)
+        )
+
+        call_command("run_enrichment_worker", "--once")
+
+        job.refresh_from_db()
+        assert job.status == ImportJob.Status.DONE
+        assert Book.objects.count() == 2
+
+    def test_running_job_is_left_alone(self):
+        ImportJob.objects.submit(records(1), status=ImportJob.Status.RUNNING)
+
+        assert ImportJob.objects.claim() is None
+        assert ImportJob.objects.resume() == 0
@@ -0,0 +1,90 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from library.models import Book, ReadState
+
+
+@pytest.mark.django_db()
+class TestReadState:
+    def test_created_with_book(self, book):
+        assert not book.read_state.is_read
+        assert not book.read_state.is_currently_reading
+        assert book.read_state.read_count == 0
+        assert book.read_state.last_read_date is None
+
+    def test_follows_log_entries(self, book):
+        book.start_reading()
+        assert book.read_state.is_currently_reading
+        assert not book.read
+
+        book.finish_reading()
+        assert not book.read_state.is_currently_reading
+        assert book.read
+        assert book.read_state.read_count == 1
+        assert book.read_state.last_read_date == book.log_entries.get().end_date
+
+        book.log_entries.get().delete()
+        book.refresh_from_db()
+        assert not book.read
+
+    def test_abandoned_entries_do_not_count(self, book):
+        book.log_entries.create(end_date=timezone.now(), abandoned=True)
+
+        assert not book.read
+        assert book not in Book.objects.read()
+        assert book not in Book.objects.unread()
+
+    def test_abandoned_parent_edition_is_not_unread(self, book_factory):
+        parent = book_factory()
+        child = book_factory(parent_edition=parent)
+        unread = book_factory()
+
+        parent.log_entries.create(end_date=timezone.now(), abandoned=True)
+
+        assert set(Book.objects.unread()) == {unread}
+        assert not Book.objects.read().exists()
+        assert ReadState.objects.get(book=child).has_finished
+
+    def test_subeditions_inherit_reads(self, book_factory):
+        parent = book_factory()
+        child = book_factory(parent_edition=parent)
+        grandchild = book_factory(parent_edition=child)
+
+        parent.mark_read_sometime()
+
+        assert set(Book.objects.read()) == {parent, child, grandchild}
+        assert ReadState.objects.get(book=grandchild).read_count == 1
+
+        child.parent_edition = None
+        child.save()
+        assert set(Book.objects.read()) == {parent}
+
+    def test_deleting_parent_edition(self, book_factory):
+        parent = book_factory()
+        child = book_factory(parent_edition=parent)
+        parent.mark_read_sometime()
+
+        parent.delete()
+
+        assert not ReadState.objects.get(book=child).is_read
+
+    def test_read_filters_single_query(self, book_factory):
+        parent = book_factory()
+        book_factory(parent_edition=parent)
+        parent.mark_read_sometime()
+        parent.mark_read_sometime()
+
+        with CaptureQueriesContext(connection) as queries:
+            assert Book.objects.read().count() == 2
+            assert Book.objects.unread().count() == 0
+        assert len(queries) == 2
+
+    def test_rebuild(self, book):
+        book.mark_read_sometime()
+        ReadState.objects.all().delete()
+
+        ReadState.objects.rebuild()
+
+        assert Book.objects.read().get() == book
@@ -1,7 +1,100 @@
+import json
+import random
+from datetime import datetime
+from statistics import median
+
 import pytest
+from django.core.management import call_command
 from django.utils import timezone
 
-from library.models import StatisticsReport, Tag
+from library.models import (
+    Author,
+    Book,
+    DirtyReportYear,
+    LogEntry,
+    StatisticsReport,
+    Tag,
+)
+from library.models.statistics_report import GENRES
+
+FIELDS = [
+    "count",
+    "page_count",
+    "average_pages",
+    "longest",
+    "shortest",
+    "by_men",
+    "by_women",
+    "by_multiple",
+    "by_organisations",
+    "by_nonbinary",
+    "by_poc",
+    "fiction",
+    "nonfiction",
+    "gender_breakdowns",
+    "genre_breakdowns",
+]
+
+
+# the query-per-figure implementation generate() replaced, kept as a reference
+def legacy_report(year):
+    def counts(qs, total_count, total_pages):
+        return {
+            "count": qs.count(),
+            "page_count": qs.page_count,
+            "percent": qs.count() / max(1, total_count) * 100,
+            "pages_percent": qs.page_count / max(1, total_pages) * 100,
+        }
+
+    if year:
+        logs = LogEntry.objects.filter(end_date__year=year)
+    else:
+        logs = LogEntry.objects.filter(end_date__isnull=False)
+    logs = logs.filter(exclude_from_stats=False)
+    books = Book.objects.filter(id__in=logs.values_list("book_id", flat=True))
+
+    count = books.count()
+    page_count = books.page_count
+    with_pages = books.filter(page_count__gt=0)
+    return {
+        "count": count,
+        "page_count": page_count,
+        "average_pages": (
+            median(b.page_count for b in with_pages) if with_pages.count() else 0
+        ),
+        "longest": with_pages.order_by("-page_count").first(),
+        "shortest": with_pages.order_by("page_count").first(),
+        "by_men": counts(books.by_men(), count, page_count),
+        "by_women": counts(books.by_women(), count, page_count),
+        "by_multiple": counts(books.by_multiple_genders(), count, page_count),
+        "by_organisations": counts(books.by_gender(3), count, page_count),
+        "by_nonbinary": counts(books.by_gender(4), count, page_count),
+        "by_poc": counts(books.poc(), count, page_count),
+        "fiction": counts(books.fiction(), count, page_count),
+        "nonfiction": counts(books.nonfiction(), count, page_count),
+        "gender_breakdowns": {
+            int(i): {
+                genre: counts(
+                    books.tagged(genre).by_gender(i),
+                    books.by_gender(i).count(),
+                    books.by_gender(i).page_count,
+                )
+                for genre in GENRES
+            }
+            for i in Author.Gender
+        },
+        "genre_breakdowns": {
+            genre: {
+                int(i): counts(
+                    books.tagged(genre).by_gender(i),
+                    books.tagged(genre).count(),
+                    books.tagged(genre).page_count,
+                )
+                for i in Author.Gender
+            }
+            for genre in GENRES
+        },
+    }
 
 
 @pytest.mark.django_db()
@@ -47,3 +140,182 @@ class TestStatisticsReport:
         report, _ = StatisticsReport.objects.get_or_create(year=timezone.now().year)
         assert not report.longest
         assert not report.shortest
+
+    def test_matches_legacy_report(self, book_factory, author_factory):
+        rng = random.Random(1066)
+        authors = [
+            author_factory(
+                gender=rng.choice(Author.Gender.values), poc=rng.random() < 0.3
+            )
+            for _ in range(12)
+        ]
+        novel = Tag.objects.create(name="novel")
+        novel.parents.add(Tag.objects.get(name="fiction"))
+        tags = [
+            novel,
+            *Tag.objects.filter(name__in=["fiction", "non-fiction", "history"]),
+        ]
+        page_counts = rng.sample(range(1, 1000), 40)
+
+        for i in range(40):
+            book = book_factory(
+                first_author=rng.choice([*authors, None]),
+                first_author_role=rng.choice(["", "author", "translator"]),
+                page_count=page_counts[i] if i % 7 else 0,
+            )
+            for order, author in enumerate(rng.sample(authors, rng.randrange(3))):
+                book.add_author(
+                    author, role=rng.choice(["", "editor", "introduction"]), order=order
+                )
+            book.tags.set(rng.sample(tags, rng.randrange(3)))
+            for _ in range(rng.randrange(3)):
+                book.log_entries.create(
+                    end_date=timezone.make_aware(
+                        datetime(rng.choice([2019, 2020]), 6, 1)  # noqa: DTZ001
+                    ),
+                    exclude_from_stats=rng.random() < 0.1,
+                )
+
+        for year in [2019, 2020, 0]:
+            report = StatisticsReport(year=year)
+            report.generate()
+
+            expected = legacy_report(year)
+            assert {field: getattr(report, field) for field in FIELDS} == expected
+
+    def test_generate_query_count(
+        self, read_book_factory, django_assert_max_num_queries
+    ):
+        read_book_factory(page_count=100).tags.add(Tag.objects.get(name="fiction"))
+        read_book_factory(page_count=200)
+        report = StatisticsReport(year=timezone.now().year)
+
+        with django_assert_max_num_queries(3):
+            report.generate()
+        assert report.fiction["count"] == 1
+
+    def test_regenerated_by_worker(
+        self, read_book_factory, monkeypatch, transactional_db  # noqa: ARG002
+    ):
+        year = timezone.now().year
+        generated = []
+        generate = StatisticsReport.generate
+        monkeypatch.setattr(
+            StatisticsReport,
+            "generate",
+            lambda report: generated.append(report.year) or generate(report),
+        )
+
+        # saved outside a transaction, as in a request
+        read_book_factory()
+        read_book_factory()
+        assert not generated
+        assert not StatisticsReport.objects.exists()
+        assert DirtyReportYear.objects.filter(year=year).exists()
+
+        call_command("run_enrichment_worker", "--once")
+
+        assert sorted(generated) == [0, 1, year]
+        assert StatisticsReport.objects.get(year=year).count == 2
+        assert not DirtyReportYear.objects.exists()
+        assert StatisticsReport.objects.regenerate_dirty() == []
+
+    def test_deferred(self, read_book_factory, transactional_db):  # noqa: ARG002
+        with StatisticsReport.objects.deferred():
+            read_book_factory()
+            with StatisticsReport.objects.deferred():
+                read_book_factory()
+            assert not DirtyReportYear.objects.exists()
+
+        assert DirtyReportYear.objects.exists()
+        StatisticsReport.objects.regenerate_dirty()
+        assert StatisticsReport.objects.get(year=timezone.now().year).count == 2
+
+
+@pytest.mark.django_db()
+class TestStatisticsReportDelta:
+    @pytest.fixture(autouse=True)
+    def books(self, book_factory, author_factory):
+        woman = author_factory(gender=Author.Gender.FEMALE, poc=True)
+        books = [
+            book_factory(page_count=300, first_author=woman),
+            book_factory(page_count=100),
+            book_factory(page_count=0, first_author=woman),
+        ]
+        books[0].tags.add(Tag.objects.get(name="fiction"))
+        books[1].add_author(woman)
+        for book in books:
+            book.start_reading()
+            book.finish_reading()
+        StatisticsReport.objects.regenerate_dirty()
+
+        return books
+
+    def assert_up_to_date(self):
+        def snapshot(report):
+            return json.loads(
+                json.dumps(
+                    {
+                        field: getattr(report, field)
+                        for field in [*FIELDS, "by_unknown"]
+                    },
+                    default=lambda book: book.id,
+                )
+            )
+
+        for year in [timezone.now().year, 0]:
+            expected = StatisticsReport(year=year)
+            expected.generate()
+            assert snapshot(StatisticsReport.objects.get(year=year)) == snapshot(
+                expected
+            )
+
+    def test_finish_reading(self, book_factory, author_factory):
+        book = book_factory(
+            page_count=200, first_author=author_factory(gender=Author.Gender.MALE)
+        )
+        book.tags.add(Tag.objects.get(name="non-fiction"))
+
+        book.start_reading()
+        book.finish_reading()
+        book.log_entries.create(end_date=timezone.now())
+
+        assert not DirtyReportYear.objects.exists()
+        assert StatisticsReport.objects.get(year=0).count == 4
+        self.assert_up_to_date()
+
+    def test_new_extremes(self, book_factory):
+        book_factory(page_count=1000).mark_read_sometime()
+        book = book_factory(page_count=50)
+        book.start_reading()
+        book.finish_reading()
+
+        assert not DirtyReportYear.objects.exists()
+        self.assert_up_to_date()
+
+    def test_exclude_from_stats(self, books):
+        entry = books[2].log_entries.get()
+
+        entry.exclude_from_stats = True
+        entry.save()
+
+        assert not DirtyReportYear.objects.exists()
+        assert StatisticsReport.objects.get(year=0).count == 2
+        self.assert_up_to_date()
+
+    def test_removing_extreme_regenerates(self, books):
+        books[0].log_entries.get().delete()
+
+        assert DirtyReportYear.objects.exists()
+        StatisticsReport.objects.regenerate_dirty()
+        self.assert_up_to_date()
+
+    def test_cascading_delete_regenerates(self, books):
+        books[1].log_entries.create(end_date=timezone.now())
+
+        books[1].delete()
+
+        assert DirtyReportYear.objects.exists()
+        StatisticsReport.objects.regenerate_dirty()
+        assert StatisticsReport.objects.get(year=0).count == 2
+        self.assert_up_to_date()
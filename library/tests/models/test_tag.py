@@ -1,6 +1,6 @@
 import pytest
 
-from library.models import Tag
+from library.models import Book, Tag, TagClosure, TagCooccurrence
 
 
 @pytest.mark.django_db()
@@ -38,6 +38,102 @@ class TestTag:
         book.tags.add(tag3)
         assert book in tag1.books_recursive
 
+    def test_books_recursive_single_query(
+        self, book_factory, tag_factory, django_assert_num_queries
+    ):
+        tag1 = tag_factory()
+        tag2 = tag_factory()
+        tag3 = tag_factory()
+        tag1.children.add(tag2)
+        tag2.children.add(tag3)
+
+        book1 = book_factory()
+        book1.tags.set((tag2, tag3))
+        book2 = book_factory()
+        book2.tags.add(tag1)
+
+        with django_assert_num_queries(1):
+            assert list(tag1.books_recursive.order_by("id")) == [book1, book2]
+
+    def test_ancestors(self, tag_factory):
+        grandparent = tag_factory()
+        parent = tag_factory()
+        child = tag_factory()
+        grandparent.children.add(parent)
+        child.parents.add(parent)
+
+        assert list(child.ancestors) == [grandparent, parent]
+        assert list(grandparent.ancestors) == []
+
+    def test_closure_multiple_parents(self, tag_factory):
+        root = tag_factory()
+        middle = tag_factory()
+        leaf = tag_factory()
+        root.children.add(middle)
+        middle.children.add(leaf)
+        leaf.parents.add(root)
+
+        assert TagClosure.objects.get(ancestor=root, descendant=leaf).depth == 1
+
+        leaf.parents.remove(root)
+        assert TagClosure.objects.get(ancestor=root, descendant=leaf).depth == 2
+
+    def test_closure_removing_parents(self, book, tag_factory):
+        tag1 = tag_factory()
+        tag2 = tag_factory()
+        tag3 = tag_factory()
+        tag1.children.add(tag2)
+        tag2.children.add(tag3)
+        book.tags.add(tag3)
+
+        tag2.parents.remove(tag1)
+        assert book not in tag1.books_recursive
+        assert tag3 not in tag1.children_recursive
+        assert book in tag2.books_recursive
+
+        tag1.children.add(tag2)
+        assert book in tag1.books_recursive
+
+        tag1.children.clear()
+        assert book not in tag1.books_recursive
+        assert tag1 not in tag3.parents_recursive
+
+    def test_closure_deleting_middle_tag(self, book, tag_factory):
+        top = tag_factory()
+        middle = tag_factory()
+        bottom = tag_factory()
+        top.children.add(middle)
+        middle.children.add(bottom)
+        book.tags.add(bottom)
+        assert book in top.books_recursive
+
+        middle.delete()
+        assert book not in top.books_recursive
+        assert list(bottom.ancestors) == []
+        assert not TagClosure.objects.filter(ancestor=top, descendant=bottom)
+
+    def test_closure_rebuild(self, tag_factory):
+        tag1 = tag_factory()
+        tag2 = tag_factory()
+        tag1.children.add(tag2)
+
+        TagClosure.objects.all().delete()
+        TagClosure.objects.rebuild()
+
+        assert tag2 in tag1.children_recursive
+        assert TagClosure.objects.filter(ancestor=tag1, descendant=tag1).exists()
+
+    def test_tagged_nested(self, book_factory, tag_factory):
+        tag1 = tag_factory()
+        tag2 = tag_factory()
+        tag1.children.add(tag2)
+        book = book_factory()
+        book.tags.add(tag2)
+
+        assert book in Book.objects.tagged(tag1.name)
+        assert book in Book.objects.tagged(tag1.name.upper(), tag2.name)
+        assert book not in Book.objects.tagged(tag1.name, "nonexistent")
+
     def test_related(self, book, tag_factory):
         tag1 = tag_factory()
         tag2 = tag_factory()
@@ -74,3 +170,40 @@ class TestTag:
         book2.tags.add(Tag.objects.get(name="Foo"))
 
         assert Tag.objects.get(name="foo") == Tag.objects.get(name="Foo")
+
+    def test_cooccurrences_kept_up_to_date(self, book_factory, tag_factory):
+        tag1, tag2, tag3 = tag_factory(), tag_factory(), tag_factory()
+        book1, book2, book3 = book_factory(), book_factory(), book_factory()
+
+        def matrix():
+            incremental = TagCooccurrence.objects.matrix()
+            TagCooccurrence.objects.rebuild()
+            assert TagCooccurrence.objects.matrix() == incremental
+            return incremental
+
+        book1.tags.set((tag1, tag2))
+        book2.tags.add(tag1)
+        tag2.books.add(book2, book3)
+        assert matrix()[tag1.name] == {tag1.name: 2, tag2.name: 2}
+        assert matrix()[tag2.name][tag2.name] == 3
+
+        book1.tags.add(tag3)
+        book1.tags.remove(tag1)
+        tag3.books.add(book2)
+        assert matrix()[tag3.name] == {tag2.name: 2, tag3.name: 2, tag1.name: 1}
+
+        tag2.books.clear()
+        book2.tags.clear()
+        assert matrix() == {tag3.name: {tag3.name: 1}}
+
+        book1.delete()
+        assert matrix() == {}
+
+    def test_related_after_untagging(self, book, tag_factory):
+        tag1 = tag_factory()
+        tag2 = tag_factory()
+        book.tags.set((tag1, tag2))
+        book.tags.remove(tag2)
+
+        assert tag2 not in tag1.related
+        assert not tag2.related
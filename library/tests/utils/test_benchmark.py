@@ -0,0 +1,48 @@
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from library.utils import benchmark, synthetic
+
+
+@pytest.mark.django_db()
+class TestBenchmark:
+    @pytest.fixture(autouse=True)
+    def _library(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            synthetic.generate(30)
+
+    def test_run(self):
+        results = benchmark.run(repeat=1)
+
+        assert results["library"]["books"] == 30
+        assert set(results["results"]) == set(benchmark.BENCHMARKS)
+        for result in results["results"].values():
+            assert result["min_ms"] <= result["median_ms"] <= result["max_ms"]
+            assert result["queries"] >= 1
+
+    def test_compare(self):
+        previous = {"results": {"books.read": {"median_ms": 2.0}}}
+        current = {
+            "results": {
+                "books.read": {"median_ms": 1.0},
+                "books.owned": {"median_ms": 1.0},
+            }
+        }
+
+        assert benchmark.compare(previous, current) == {"books.read": 0.5}
+
+    def test_command(self, tmp_path):
+        output = tmp_path / "results.json"
+        call_command(
+            "run_benchmarks", "books.read", "tag_cloud", "-r", "2", "-o", output
+        )
+        results = json.loads(output.read_text())
+        assert set(results["results"]) == {"books.read", "tag_cloud"}
+
+        call_command("run_benchmarks", "books.read", "-r", "1", "--compare", output)
+
+    def test_unknown_benchmark(self):
+        with pytest.raises(CommandError, match="nope"):
+            call_command("run_benchmarks", "nope")
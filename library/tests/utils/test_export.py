@@ -0,0 +1,100 @@
+import gzip
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.serializers.json import DjangoJSONEncoder
+
+from library.models import Author, Book, ReadingList, ReadingListEntry, Tag
+from library.utils import export
+
+
+def read(lines):
+    return [json.loads(line) for line in lines]
+
+
+@pytest.mark.django_db()
+class TestExport:
+    @pytest.fixture()
+    def library(self, book_factory, author_factory):
+        author = author_factory()
+        book = book_factory(first_author=author)
+        book.add_author(author_factory(), role="editor")
+        book.tags.add(Tag.objects.get(name="history"))
+        book.start_reading()
+        book_factory(parent_edition=book, first_author=author)
+        reading_list = ReadingList.objects.create(title="Summer")
+        ReadingListEntry.objects.create(reading_list=reading_list, book=book)
+        # has no books, so isn't exported
+        author_factory()
+        return book
+
+    def test_records(self, library):
+        records = read(export.ndjson())
+
+        assert [record["type"] for record in records] == ["author"] * 2 + ["book"] * 2
+        assert {record["id"] for record in records if record["type"] == "author"} == {
+            author.id for author in Author.objects.filter(export.has_books())
+        }
+        exported = next(
+            record
+            for record in records
+            if record["type"] == "book" and record["id"] == library.id
+        )
+        assert exported == json.loads(
+            json.dumps(
+                {"type": "book", **Book.objects.get(id=library.id).to_json()},
+                cls=DjangoJSONEncoder,
+            )
+        )
+
+    def test_matches_unprefetched_json(self, library):
+        prefetched = Book.objects.with_export_data().get(id=library.id)
+
+        assert prefetched.to_json() == Book.objects.get(id=library.id).to_json()
+        assert prefetched.to_json()["reading_lists"] == [("Summer", 0)]
+
+    def test_gzip(self, library):  # noqa: ARG002
+        plain = b"".join(export.stream())
+
+        assert gzip.decompress(b"".join(export.stream(compress=True))) == plain
+
+    def test_queries_dont_grow_with_books(
+        self, book_factory, django_assert_max_num_queries
+    ):
+        for book in book_factory.create_batch(3):
+            book.tags.add(Tag.objects.get(name="history"))
+        with django_assert_max_num_queries(20) as small:
+            list(export.ndjson())
+
+        for book in book_factory.create_batch(30):
+            book.tags.add(Tag.objects.get(name="history"))
+            book.start_reading()
+        with django_assert_max_num_queries(len(small)):
+            list(export.ndjson())
+
+    def test_command(self, library, tmp_path):  # noqa: ARG002
+        output = tmp_path / "library.ndjson.gz"
+
+        call_command("export_library", output=str(output))
+
+        lines = gzip.decompress(output.read_bytes()).decode("utf-8").splitlines()
+        assert len(lines) == 4
+
+
+@pytest.mark.django_db()
+class TestExportView:
+    def test_ndjson(self, admin_client, book):
+        response = admin_client.get("/export/library.ndjson")
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        records = read(b"".join(response.streaming_content).decode().splitlines())
+        assert records[-1]["id"] == book.id
+
+    def test_gzip(self, admin_client, book):  # noqa: ARG002
+        response = admin_client.get("/export/library.ndjson?gzip=true")
+
+        assert response["Content-Type"] == "application/gzip"
+        assert "library.ndjson.gz" in response["Content-Disposition"]
+        data = gzip.decompress(b"".join(response.streaming_content))
+        assert len(data.splitlines()) == 2
@@ -0,0 +1,163 @@
+import time
+
+import pytest
+
+from library.utils import http
+
+
+class TestHttp:
+    url = "https://www.goodreads.com/book/show/1"
+
+    @pytest.fixture(autouse=True)
+    def _cache(self, settings, tmp_path):
+        settings.HTTP_CACHE_PATH = tmp_path / "http_cache.sqlite3"
+        http.reset_stats()
+
+    def test_session_per_host(self):
+        session = http.session_for(self.url)
+
+        assert http.session_for("https://www.goodreads.com/search/") is session
+        assert http.session_for("https://www.googleapis.com/books/") is not session
+
+    def test_ttls_by_longest_prefix(self):
+        assert http.ttls_for(self.url) == (30 * http.DAY, http.DAY)
+        assert http.ttls_for("https://www.versobooks.com/search?q=x") == (
+            http.DAY,
+            http.HOUR,
+        )
+        assert http.ttls_for("https://example.com/") == http.DEFAULT_TTLS
+
+    def test_responses_are_cached(self, requests_mock):
+        requests_mock.get(self.url, text="first")
+        assert http.get(self.url).text == "first"
+
+        requests_mock.get(self.url, text="second")
+        assert http.get(self.url).text == "first"
+        assert requests_mock.call_count == 1
+        assert http.cache_stats() == {
+            "hits": 1,
+            "misses": 1,
+            "stores": 1,
+            "evictions": 0,
+        }
+
+    def test_cache_disabled(self, settings, requests_mock):
+        settings.HTTP_CACHE_PATH = None
+        requests_mock.get(self.url, json={"a": 1})
+
+        assert http.get(self.url).json() == {"a": 1}
+        assert http.get(self.url).json() == {"a": 1}
+        assert requests_mock.call_count == 2
+
+    def test_misses_expire_sooner(self, requests_mock, monkeypatch):
+        requests_mock.get(self.url, text="nothing here")
+        requests_mock.get(f"{self.url}0", status_code=404)
+        http.get(self.url, is_miss=lambda response: "nothing" in response.text)
+        http.get(f"{self.url}0")
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 2 * http.DAY)
+        http.get(self.url)
+        http.get(f"{self.url}0")
+
+        assert requests_mock.call_count == 4
+
+    def test_errors_are_not_cached(self, requests_mock):
+        requests_mock.get(self.url, status_code=429)
+        http.get(self.url)
+        http.get(self.url)
+
+        assert requests_mock.call_count == 2
+        assert http.cache_stats()["stores"] == 0
+
+    def test_least_recently_used_are_evicted(self, settings, requests_mock):
+        settings.HTTP_CACHE_MAX_BYTES = 25
+        for page in range(3):
+            requests_mock.get(f"{self.url}{page}", text="x" * 10)
+
+        http.get(f"{self.url}0")
+        http.get(f"{self.url}1")
+        http.get(f"{self.url}0")
+        http.get(f"{self.url}2")
+
+        assert http.cache_stats()["evictions"] == 1
+        http.get(f"{self.url}0")
+        http.get(f"{self.url}1")
+        assert requests_mock.call_count == 4
+
+
+class TestRateLimits:
+    url = "https://www.goodreads.com/book/show/1"
+
+    @pytest.fixture(autouse=True)
+    def _clock(self, monkeypatch, settings):
+        settings.HTTP_RATE_LIMITS = True
+        monkeypatch.setattr(http, "_buckets", {})
+        self.now = 1000.0
+        self.slept = []
+
+        def sleep(seconds):
+            self.slept.append(seconds)
+            self.now += seconds
+
+        monkeypatch.setattr(time, "monotonic", lambda: self.now)
+        monkeypatch.setattr(time, "sleep", sleep)
+
+    def test_bucket_allows_bursts_then_paces(self):
+        bucket = http.TokenBucket(rate=2.0, burst=3)
+
+        for _ in range(5):
+            bucket.take()
+
+        assert self.slept == [0.5, 0.5]
+
+    def test_bucket_refills(self):
+        bucket = http.TokenBucket(rate=2.0, burst=3)
+        for _ in range(3):
+            bucket.take()
+
+        self.now += 10
+        for _ in range(3):
+            bucket.take()
+
+        assert self.slept == []
+
+    def test_bucket_per_host(self):
+        bucket = http.bucket_for(self.url)
+
+        assert http.bucket_for("https://www.goodreads.com/search/") is bucket
+        assert http.bucket_for("https://example.com/") is not bucket
+        assert bucket.rate == http.RATES["www.goodreads.com"][0]
+
+    def test_get_waits_for_a_token(self, requests_mock):
+        requests_mock.get(self.url, text="ok")
+        burst = http.RATES["www.goodreads.com"][1]
+
+        for _ in range(burst + 1):
+            http.get(self.url)
+
+        assert len(self.slept) == 1
+
+    @pytest.mark.parametrize(
+        ("response", "pause"),
+        [
+            ({"status_code": 429, "headers": {"Retry-After": "30"}}, 30),
+            ({"status_code": 429}, http.BACKOFF),
+            (
+                {
+                    "status_code": 403,
+                    "text": '{"error": {"status": "RESOURCE_EXHAUSTED"}}',
+                },
+                http.BACKOFF,
+            ),
+        ],
+    )
+    def test_rate_limited_responses_pause_the_host(
+        self, requests_mock, response, pause
+    ):
+        requests_mock.get(self.url, **response)
+
+        http.get(self.url)
+        http.get(self.url)
+
+        assert self.slept == [pause]
@@ -0,0 +1,111 @@
+import pytest
+
+from library.models import Author, Book, BookAuthor, EnrichmentJob, ReadState
+from library.utils import importer
+
+
+def record(index, **kwargs):
+    return {
+        "title": f"Book {index}",
+        "authors": [(f"Jane Writer{index}", "")],
+        "isbn": f"978000000{index:04d}",
+        **kwargs,
+    }
+
+
+@pytest.mark.django_db()
+class TestImportRecords:
+    def test_creates_books_and_authors(self, user):  # noqa: ARG002
+        books = importer.import_records(
+            [
+                record(1, title="Mort (Discworld, #4)"),
+                record(
+                    2,
+                    authors=[
+                        ("Ann Editor", "editor"),
+                        ("Tom Translator", "translator"),
+                    ],
+                    owned=True,
+                    edition_format=Book.Format.PAPERBACK,
+                ),
+            ]
+        )
+
+        assert [created for _, created in books] == [True, True]
+        mort = Book.objects.get(title="Mort")
+        assert mort.series == "Discworld"
+        assert mort.series_order == 4
+        assert str(mort.first_author) == "Jane Writer1"
+        assert mort.slug == "writer1-mort"
+
+        edited = Book.objects.get(title="Book 2")
+        assert edited.first_author_role == "editor"
+        assert edited.owned_by.username == "ben"
+        assert edited.effective_owner == edited.owned_by
+        translator = edited.additional_authors.get()
+        assert translator.role_for_book(edited) == "translator"
+        assert translator.slug == "translator-t"
+
+        assert ReadState.objects.filter(book__in=[mort, edited]).count() == 2
+        assert list(Book.objects.search("translator")) == [edited]
+        assert EnrichmentJob.objects.filter(book__in=[mort, edited]).count() == 2
+
+    def test_reuses_existing_books_and_authors(self, book_factory, author_factory):
+        author = author_factory(forenames="Emily", surname="Brontë")
+        book = book_factory(
+            title="Wuthering Heights", first_author=author, isbn="", publisher="OUP"
+        )
+        editor = author_factory(forenames="Ann", surname="Editor")
+        book.add_author(editor, role="editor", order=1)
+
+        books = importer.import_records(
+            [
+                {
+                    "title": "Wuthering Heights",
+                    "authors": [("Emily Brontë", ""), ("Ann Editor", "editor")],
+                    "isbn": "9780199541898",
+                    "publisher": "Penguin",
+                },
+                {"title": "wuthering heights", "authors": [("E. Brontë", "")]},
+            ]
+        )
+
+        assert books == [(book, False), (book, False)]
+        book.refresh_from_db()
+        assert book.isbn == "9780199541898"
+        assert book.publisher == "OUP"
+        assert Book.objects.count() == 1
+        assert Author.objects.count() == 2
+        assert BookAuthor.objects.count() == 1
+        assert EnrichmentJob.objects.get(book=book).refresh_goodreads
+
+    def test_repeated_records_make_one_book(self):
+        books = importer.import_records([record(1), record(1, page_count=200)])
+
+        assert Book.objects.count() == 1
+        assert [created for _, created in books] == [True, False]
+        assert Book.objects.get().page_count == 200
+
+    def test_slugs_are_unique(self, book_factory, author_factory):
+        book_factory(title="Book", first_author=author_factory(surname="Writer"))
+
+        importer.import_records(
+            [
+                record(1, title="Book!", authors=[("Jo Writer", "")]),
+                record(2, title="Book?", authors=[("Jo Writer", "")]),
+            ]
+        )
+
+        assert sorted(Book.objects.values_list("slug", flat=True)) == [
+            "writer-book",
+            "writer-book-1",
+            "writer-book-2",
+        ]
+
+    def test_queries_dont_grow_with_records(self, django_assert_max_num_queries):
+        with django_assert_max_num_queries(30) as small:
+            importer.import_records([record(i) for i in range(3)])
+
+        with django_assert_max_num_queries(len(small)):
+            importer.import_records([record(i) for i in range(3, 20)])
+        assert Book.objects.count() == 20
@@ -0,0 +1,87 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+
+from library.models import Book
+from library.utils.keyset import InvalidCursorError, KeysetPaginator, encode_cursor
+
+
+def walk(queryset, per_page):
+    paginator = KeysetPaginator(queryset, per_page)
+    pages = [paginator.page()]
+    while pages[-1].has_next():
+        pages.append(paginator.page(after=pages[-1].next_cursor))
+    return paginator, pages
+
+
+@pytest.mark.django_db()
+class TestKeysetPaginator:
+    @pytest.fixture()
+    def books(self, book_factory, author_factory, user):
+        author = author_factory(surname="Same")
+        books = [
+            book_factory(title=title, first_author=author, series=series)
+            for title, series in [("B", ""), ("A", ""), ("A", ""), ("C", "X")]
+        ]
+        books += book_factory.create_batch(3)
+        for index, book in enumerate(books[:4]):
+            book.owned_by = user
+            book.acquired_date = datetime.date(2020, 1, index % 2 + 1)
+            book.save()
+        return books
+
+    @pytest.mark.parametrize(
+        "ordering",
+        [
+            [],
+            ["-title"],
+            ["acquired_date"],
+            [F("acquired_date").desc(nulls_last=True)],
+            [F("acquired_date").asc(nulls_last=True), "-title"],
+        ],
+    )
+    def test_pages_match_queryset(self, books, ordering):  # noqa: ARG002
+        queryset = Book.objects.all()
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+
+        paginator, pages = walk(queryset, 2)
+
+        assert [book for page in pages for book in page] == list(
+            paginator.queryset.order_by(*[key.order_by() for key in paginator.keys])
+        )
+        assert len(pages) == paginator.num_pages == 4
+        assert [page.number for page in pages] == [1, 2, 3, 4]
+
+    def test_previous_pages(self, books):  # noqa: ARG002
+        paginator, pages = walk(Book.objects.order_by("-title"), 3)
+
+        previous = paginator.page(before=pages[-1].previous_cursor)
+        assert list(previous) == list(pages[-2])
+        assert previous.number == pages[-2].number
+        assert previous.has_next()
+        assert previous.has_previous()
+
+        first = paginator.page(before=previous.previous_cursor)
+        assert list(first) == list(pages[0])
+        assert not first.has_previous()
+
+    def test_no_offset(self, books):  # noqa: ARG002
+        paginator = KeysetPaginator(Book.objects.all(), 2)
+        cursor = paginator.page().next_cursor
+
+        with CaptureQueriesContext(connection) as queries:
+            paginator.page(after=cursor)
+
+        assert len(queries) == 1
+        assert "OFFSET" not in queries[0]["sql"].upper()
+
+    @pytest.mark.parametrize(
+        "cursor", ["nonsense", encode_cursor(["a"], 2), encode_cursor([], 0)]
+    )
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            KeysetPaginator(Book.objects.all(), 2).page(after=cursor)
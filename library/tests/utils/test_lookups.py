@@ -0,0 +1,45 @@
+import threading
+import time
+
+import pytest
+
+from library.models import Book
+from library.utils import lookups
+
+
+class TestMapConcurrently:
+    def test_results_in_order(self):
+        def slow_square(number):
+            time.sleep((5 - number) / 100)
+            return number * number
+
+        assert lookups.map_concurrently(slow_square, range(5)) == [0, 1, 4, 9, 16]
+
+    def test_runs_on_worker_threads(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait(_):
+            barrier.wait()
+            return threading.get_ident()
+
+        threads = lookups.map_concurrently(wait, range(3), workers=3)
+
+        assert len(set(threads)) == 3
+        assert threading.get_ident() not in threads
+
+    def test_one_worker_runs_inline(self):
+        threads = lookups.map_concurrently(
+            lambda _: threading.get_ident(), range(3), workers=1
+        )
+
+        assert set(threads) == {threading.get_ident()}
+
+    @pytest.mark.django_db(transaction=True)
+    def test_workers_can_read_the_database(self, book_factory):
+        books = book_factory.create_batch(3)
+
+        titles = lookups.map_concurrently(
+            lambda pk: Book.objects.get(pk=pk).title, [book.pk for book in books]
+        )
+
+        assert titles == [book.title for book in books]
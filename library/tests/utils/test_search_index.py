@@ -0,0 +1,102 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from library.models import Book, Tag
+from library.utils import search_index
+
+
+class TestBuildQuery:
+    def test_empty(self):
+        assert not search_index.build_query("  ")
+        assert not search_index.build_query("!?")
+
+    def test_terms_are_prefix_matched(self):
+        query = search_index.build_query('Wuthering "Heights"')
+        assert query == '"wuthering"* AND "heights"*'
+
+    def test_tag_names(self):
+        query = search_index.build_query("non-fiction")
+        assert query == '"non"* AND "fiction"*'
+
+
+@pytest.mark.django_db()
+class TestSearchIndex:
+    def test_available(self):
+        assert search_index.is_available()
+
+    def test_search_ranks_title_above_tags(self, book_factory):
+        book_factory.create_batch(3)
+        tagged = book_factory(title="Something Else")
+        tagged.tags.add(Tag.objects.get(name="history"))
+        titled = book_factory(title="A History of Things")
+
+        # faker titles can contain "history" too
+        results = list(Book.objects.search("history"))
+        assert [book for book in results if book in (titled, tagged)] == [
+            titled,
+            tagged,
+        ]
+
+    def test_search_pages_in_the_database(
+        self, book_factory, django_assert_num_queries
+    ):
+        book_factory.create_batch(3, title="Dune")
+
+        with django_assert_num_queries(1) as captured:
+            assert len(Book.objects.search("dune")[:2]) == 2
+        assert "LIMIT 2" in captured.captured_queries[0]["sql"]
+
+    def test_search_ignores_entries_without_books(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {search_index.TABLE} (rowid, title) "  # noqa: S608
+                "VALUES (999, 'Orphaned')"
+            )
+
+        assert not Book.objects.search("orphaned")
+
+    def test_search_across_fields(self, book_factory, author_factory):
+        book = book_factory(title="Capital", first_author__surname="Marx")
+        book.add_author(author_factory(surname="Engels"), order=1)
+
+        assert list(Book.objects.search("marx capital")) == [book]
+        assert list(Book.objects.search("capital history")) == []
+        book.tags.add(Tag.objects.get(name="history"))
+        assert list(Book.objects.search("capital history")) == [book]
+        assert list(Book.objects.search("engels")) == [book]
+
+    def test_search_edition_title_and_series(self, book_factory):
+        book = book_factory(edition_title="Das Kapital", series="Penguin Classics")
+
+        assert book in Book.objects.search("kapital")
+        assert book in Book.objects.search("penguin")
+
+    def test_search_ignores_diacritics(self, book_factory):
+        book = book_factory(first_author__surname="Brontë")
+
+        assert book in Book.objects.search("bronte")
+
+    def test_author_rename_updates_index(self, book):
+        book.first_author.surname = "Zzyzx"
+        book.first_author.save()
+
+        assert book in Book.objects.search("zzyzx")
+
+    def test_delete_removes_from_index(self, book):
+        title = book.title
+        book.delete()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {search_index.TABLE}")  # noqa: S608
+            assert cursor.fetchone()[0] == 0
+        assert not Book.objects.search(title)
+
+    def test_rebuild_command(self, book):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search_index.TABLE}")  # noqa: S608
+        assert book not in Book.objects.search(book.title)
+
+        call_command("rebuild_search_index")
+
+        assert book in Book.objects.search(book.title)
@@ -0,0 +1,67 @@
+import sys
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from library.models import (
+    Author,
+    Book,
+    BookAuthor,
+    LogEntry,
+    ReadingList,
+    StatisticsReport,
+    Tag,
+    TagClosure,
+)
+from library.utils import synthetic
+
+
+@pytest.mark.django_db()
+class TestGenerate:
+    @pytest.fixture()
+    def counts(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            return synthetic.generate(300, seed=1)
+
+    def test_counts(self, counts):
+        assert counts["books"] == Book.objects.count() == 300
+        assert counts["authors"] == Author.objects.count() == 100
+        assert counts["log_entries"] == LogEntry.objects.count()
+        assert counts["reading_lists"] == ReadingList.objects.count()
+
+    def test_shape(self, counts):  # noqa: ARG002
+        assert Author.objects.filter(primary_identity__isnull=False).exists()
+        assert Book.objects.filter(parent_edition__isnull=False).exists()
+        assert BookAuthor.objects.filter(role="editor").exists()
+        assert TagClosure.objects.filter(depth__gt=1).exists()
+        assert LogEntry.objects.dates("end_date", "year").count() > 10
+
+    def test_derived_tables(self, counts):  # noqa: ARG002
+        assert Book.objects.read().exists()
+        assert Book.objects.owned().exists()
+        assert Book.objects.filter(slug="").count() == 0
+        assert StatisticsReport.objects.get(year=0).count > 0
+
+    def test_seed_is_repeatable(self):
+        synthetic.generate(20, seed=3)
+        titles = list(Book.objects.order_by("id").values_list("title", flat=True))
+        for model in [Book, Author, Tag]:
+            model.objects.all().delete()
+        synthetic.generate(20, seed=3)
+
+        assert (
+            list(Book.objects.order_by("id").values_list("title", flat=True)) == titles
+        )
+
+    def test_command(self):
+        call_command("generate_library", "--books", "10")
+
+        assert Book.objects.count() == 10
+
+    def test_command_without_faker(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "faker", None)
+        monkeypatch.delitem(sys.modules, "library.utils.synthetic")
+        monkeypatch.delattr("library.utils.synthetic")
+
+        with pytest.raises(CommandError, match="requirements-dev"):
+            call_command("generate_library", "--books", "10")
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 
+from library.models import EnrichmentJob
 from library.utils import verso
 
 
@@ -36,5 +37,9 @@ class TestVerso:
             publisher="Verso",
             publisher_url="https://www.versobooks.com/books/960-liberalism",
         )
+        assert not book.image_url
+
+        EnrichmentJob.objects.run_pending()
 
+        book.refresh_from_db()
         assert book.image_url
@@ -13,6 +13,16 @@ class TestAuthor:
         assert len(resp.context_data["object_list"]) == 1
         assert author in resp.context_data["object_list"]
 
+    def test_author_list_summarises_books(self, author_factory, book_factory, client):
+        author = author_factory()
+        book_factory(first_author=author, title="Edited", first_author_role="editor")
+        book_factory(first_author=author, title="First")
+        book_factory(first_author=author, title="Second")
+
+        resp = client.get("/authors/")
+        assert "Author of First" in resp.content.decode()
+        assert "and 2 others." in resp.content.decode()
+
     def test_author_list_by_gender(self, author_factory, client):
         male = author_factory(gender=1)
         female = author_factory(gender=2)
@@ -1,6 +1,8 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from library.models import Book, Tag
+from library.models import Book, ReadingList, ReadingListEntry, Tag
 
 
 @pytest.mark.django_db()
@@ -101,6 +103,17 @@ class TestBook:
         assert resp.context_data["object_list"][0] == book2
         assert resp.context_data["object_list"][1] == book1
 
+    def test_sort_by_read_date(self, client, book_factory):
+        book1 = book_factory(title="AAAAA")
+        book2 = book_factory(title="BBBBB")
+        book1.mark_read_sometime()
+        book2.mark_read_sometime()
+        book1.start_reading()
+        book1.finish_reading()
+
+        resp = client.get("/books/", {"sort_by": "read_date"})
+        assert list(resp.context_data["object_list"]) == [book1, book2]
+
     def test_start_reading(self, admin_client, book):
         admin_client.post(f"{book.get_absolute_url()}start/")
         assert book.currently_reading
@@ -165,3 +178,84 @@ class TestBook:
         admin_client.post(f"{book.get_absolute_url()}rate/", {"rating": 5})
         book.refresh_from_db()
         assert book.rating == 5
+
+
+@pytest.mark.django_db()
+class TestCardData:
+    @pytest.fixture()
+    def add_books(self, book_factory, author_factory, user):
+        reading_list = ReadingList.objects.create(title="Summer")
+
+        def _add_books(count):
+            for _ in range(count):
+                book = book_factory(series="Series", owned_by=user, want_to_read=True)
+                book.add_author(author_factory(), role="editor", order=1)
+                book.add_author(author_factory(), order=2)
+                book.tags.add(Tag.objects.get(name="history"))
+                ReadingListEntry.objects.create(reading_list=reading_list, book=book)
+                book_factory.create_batch(2, parent_edition=book, series="Series")
+                book.mark_read_sometime()
+                book.start_reading()
+
+        return _add_books
+
+    @pytest.mark.parametrize(
+        "url", ["/books/", "/books/read/", "/search/?query=series"]
+    )
+    def test_query_count_is_fixed(self, admin_client, add_books, url):
+        add_books(2)
+        with CaptureQueriesContext(connection) as few:
+            admin_client.get(url)
+
+        add_books(4)
+        with CaptureQueriesContext(connection) as many:
+            resp = admin_client.get(url)
+
+        assert resp.status_code == 200
+        assert len(many) == len(few)
+
+    def test_card_contents(self, admin_client, add_books):
+        add_books(1)
+        book = Book.objects.with_card_data().get(parent_edition__isnull=True)
+
+        resp = admin_client.get("/books/")
+
+        card = resp.content.decode()
+        assert [author.slug for author in book.authors] == [
+            book.first_author.slug,
+            book.all_authors[2].slug,
+        ]
+        assert book.all_authors[2].get_absolute_url() in card
+        assert book.display_series in card
+        assert "Summer" in card
+        assert "history" in card
+        assert book.current_log_entry.start_date
+        assert book.display_log_entry.end_date.year == 1
+
+
+@pytest.mark.django_db()
+class TestFacetCounts:
+    def test_counts(self, admin_client, book_factory, user):
+        history = Tag.objects.get(name="history")
+        for edition_format in [Book.Format.PAPERBACK, Book.Format.EBOOK]:
+            book = book_factory(edition_format=edition_format, owned_by=user)
+            # two tags mustn't count the book twice
+            book.tags.add(history, Tag.objects.get(name="war"))
+        book_factory(edition_format=Book.Format.HARDBACK).mark_read_sometime()
+
+        resp = admin_client.get("/books/", {"tags": "history,war"})
+        assert resp.context_data["stats"] == {"total": 2, "owned": 2, "read": 0}
+        assert resp.context_data["counts"][Book.Format.PAPERBACK] == 1
+        assert resp.context_data["counts"][Book.Format.HARDBACK] == 0
+
+        resp = admin_client.get("/books/")
+        assert resp.context_data["stats"] == {"total": 3, "owned": 2, "read": 1}
+        assert resp.context_data["paginator"].count == 3
+
+    def test_tag_page_title(self, admin_client, book_factory):
+        for book in book_factory.create_batch(2):
+            book.tags.add(Tag.objects.get(name="history"))
+
+        resp = admin_client.get("/tag/history/")
+
+        assert resp.context_data["page_title"] == "2 books tagged history"
@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 
 from library.models import Book
+from library.utils import importer
 
 
 @pytest.mark.django_db()
@@ -46,6 +47,22 @@ class TestImporter:
         assert b"Wuthering Heights" in resp.content
         assert resp.context_data["goodreads_results"][0]["title"] == "Wuthering Heights"
 
+    @pytest.mark.usefixtures("_goodreads_mock")
+    def test_import_get_finds_existing_book(self, admin_client, book_factory):
+        book = book_factory(
+            title="Wuthering Heights",
+            first_author__forenames="Emily",
+            first_author__surname="Brontë",
+            isbn="",
+            first_published=1847,
+            goodreads_id="6185",
+            image_url="https://example.com/cover.jpg",
+        )
+
+        resp = admin_client.get("/book/import/", {"query": "Wuthering Heights"})
+        result = resp.context_data["goodreads_results"][0]
+        assert resp.context_data["matches"][result["goodreads_id"]] == book
+
     @pytest.mark.parametrize(
         ("query_string", "expected"),
         [
@@ -82,3 +99,39 @@ class TestImporter:
         assert book.isbn == expected["isbn"]
         assert book.asin == expected["asin"]
         assert book.edition_format == expected["edition_format"]
+
+
+@pytest.mark.django_db()
+class TestBulkImport:
+    @pytest.fixture(autouse=True)
+    def _run_in_request(self, monkeypatch):
+        # the test database isn't visible from another thread
+        class Thread:
+            def __init__(self, target, args):  # noqa: ARG002
+                self.job = args[0]
+
+            def start(self):
+                self.job.run()
+
+        monkeypatch.setattr(importer.threading, "Thread", Thread)
+
+    def test_default_format(self, admin_client):
+        resp = admin_client.post(
+            "/bulkimport/",
+            {
+                "input_format": "default",
+                "data": "Mort (Discworld, #4);Terry Pratchett\nCapital;Karl Marx:author",
+            },
+        )
+
+        job = resp.context_data["job"]
+        assert b'data-controller="import-progress"' in resp.content
+        assert job.total == 2
+        assert Book.objects.get(title="Mort").series == "Discworld"
+
+        progress = admin_client.get(f"/bulkimport/{job.pk}/").json()
+        assert progress["status"] == "done"
+        assert progress["done"] == 2
+
+    def test_progress_of_missing_job(self, admin_client):
+        assert admin_client.get("/bulkimport/1/").status_code == 404
@@ -0,0 +1,50 @@
+import json
+import os
+
+import pytest
+
+from library.utils import http, metrics
+
+
+@pytest.mark.django_db()
+class TestMetrics:
+    def test_request_is_recorded(self, admin_client, book, caplog):  # noqa: ARG002
+        caplog.set_level("INFO", logger="library.middleware")
+
+        admin_client.get("/books/")
+
+        sample = metrics.recent[-1]
+        assert sample["view"] == "library:books_all"
+        assert sample["status"] == 200
+        assert sample["queries"] > 0
+        assert sample["sql_ms"] > 0
+        assert sample["template_ms"] > 0
+        assert sample["total_ms"] >= sample["template_ms"]
+        assert json.loads(caplog.records[-1].args[0]) == sample
+
+    def test_http_time(self, requests_mock, settings):
+        settings.HTTP_CACHE_PATH = None
+        requests_mock.get("https://example.com/", text="ok")
+
+        metrics.start()
+        http.get("https://example.com/")
+        sample = metrics.finish()
+
+        assert sample["http_requests"] == 1
+        assert sample["queries"] == 0
+
+    def test_endpoint_is_staff_only(self, client):
+        resp = client.get("/metrics/")
+
+        assert resp.status_code == 302
+
+    def test_endpoint(self, admin_client):
+        admin_client.get("/books/")
+        admin_client.get("/authors/")
+
+        resp = admin_client.get("/metrics/", {"view": "library:books_all"})
+
+        assert resp.json()["worker"] == os.getpid()
+        samples = resp.json()["requests"]
+        assert samples
+        assert {sample["view"] for sample in samples} == {"library:books_all"}
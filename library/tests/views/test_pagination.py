@@ -0,0 +1,47 @@
+import datetime
+
+import pytest
+from django.utils.http import urlencode
+
+from library.views.book import IndexView
+from library.views.log_entry import ReadView
+
+
+@pytest.mark.django_db()
+class TestKeysetViews:
+    def test_book_list_pages(self, client, book_factory, monkeypatch):
+        monkeypatch.setattr(IndexView, "paginate_by", 2)
+        book_factory.create_batch(5)
+
+        resp = client.get("/books/", {"after": ""})
+        page = resp.context_data["page_obj"]
+        assert resp.context_data["paginator"].num_pages == 3
+        assert urlencode({"after": page.next_cursor}) in resp.content.decode()
+
+        resp = client.get("/books/", {"after": page.next_cursor})
+        second = resp.context_data["page_obj"]
+        assert second.number == 2
+        assert not set(page) & set(second)
+
+    def test_invalid_cursor(self, client):
+        assert client.get("/books/", {"after": "nonsense"}).status_code == 404
+
+    def test_read_list_continues_year(self, client, book_factory, monkeypatch):
+        monkeypatch.setattr(ReadView, "keyset_page_size", 2)
+        for book in book_factory.create_batch(3):
+            book.start_reading()
+            book.finish_reading()
+
+        resp = client.get("/books/read/")
+        page = resp.context_data["page_obj"]
+        assert len(page) == 2
+        assert f'data-infinite-scroll-cursor-value="{page.next_cursor}"' in (
+            resp.content.decode()
+        )
+
+        resp = client.get(
+            f"/books/read/{datetime.date.today().year}/",  # noqa: DTZ011
+            {"infinite": "true", "after": page.next_cursor},
+        )
+        assert len(resp.context_data["page_obj"]) == 1
+        assert "Read in" not in resp.content.decode()
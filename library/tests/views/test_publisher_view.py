@@ -1,4 +1,9 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from library.models import Book, ReadState
+from library.models.book import PUBLISHER_CACHE_KEY
 
 
 @pytest.mark.django_db()
@@ -8,3 +13,45 @@ class TestPublisher:
 
         resp = client.get("/publishers/")
         assert "Foo" in resp.context_data["publishers"]
+
+    def test_publisher_counts(self, book_factory, user, client):
+        book_factory(publisher="Verso", owned_by=user, edition_format=1)
+        book_factory(publisher="Verso", edition_format=2).mark_read_sometime()
+        book_factory(publisher="Verso", private=True)
+        book_factory(publisher="Penguin")
+
+        resp = client.get("/publishers/")
+        assert list(resp.context_data["publishers"]) == ["Penguin", "Verso"]
+        verso = resp.context_data["publishers"]["Verso"]
+        assert (verso["total"], verso["owned"], verso["read"]) == (2, 1, 1)
+        assert verso["formats"][1] == verso["formats"][2] == 1
+        assert "2 books, 1 owned, 1 read" in resp.content.decode()
+
+    def test_publisher_books_reuse_index(self, book_factory, client):
+        book_factory(publisher="Verso")
+        client.get("/publishers/")
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/publisher/Verso/")
+        assert resp.context_data["stats"]["total"] == 1
+        assert not [query for query in queries if "COUNT(" in query["sql"]]
+
+        book_factory(publisher="Verso")
+        resp = client.get("/publisher/Verso/", {"read": "false"})
+        assert resp.context_data["stats"]["total"] == 2
+
+    def test_publisher_index_cleared_by_bulk_updates(
+        self, book_factory, user, other_worker_cache
+    ):
+        book = book_factory(publisher="Verso")
+        key = f"{PUBLISHER_CACHE_KEY}:0"
+
+        Book.objects.publisher_index(include_private=False)
+        assert other_worker_cache.get(key)
+        Book.objects.filter(pk=book.pk).update(owned_by=user)
+        Book.objects.filter(pk=book.pk).update_effective_owners()
+        assert other_worker_cache.get(key) is None
+
+        Book.objects.publisher_index(include_private=False)
+        ReadState.objects.refresh([book.pk])
+        assert other_worker_cache.get(key) is None
@@ -0,0 +1,290 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver
+
+from library import urls
+from library.models import (
+    Author,
+    ImportJob,
+    ReadingList,
+    ReadingListEntry,
+    StatisticsReport,
+    Tag,
+)
+
+# the most queries each route may make for the `library` fixture below; if a
+# change needs more, check it isn't an N+1 before raising the budget
+QUERY_BUDGETS = {
+    "author_delete": 3,
+    "author_details": 12,
+    "author_edit": 4,
+    "author_list": 8,
+    "author_new": 3,
+    "basic_search": 11,
+    "book_add_tags": 2,
+    "book_delete": 5,
+    "book_details": 28,
+    "book_edit": 43,
+    "book_finish_reading": 2,
+    "book_import": 2,
+    "book_mark_owned": 2,
+    "book_mark_read_sometime": 2,
+    "book_new": 9,
+    "book_rate": 2,
+    "book_remove_tags": 2,
+    "book_start_reading": 2,
+    "book_update_progress": 2,
+    "books_all": 9,
+    "books_borrowed": 3,
+    "books_currently_reading": 8,
+    "books_owned": 9,
+    "books_owned_by_date": 9,
+    "books_read": 14,
+    "books_read_markdown": 9,
+    "books_read_xml": 11,
+    "books_reviewed": 3,
+    "books_to_read": 3,
+    "books_unowned": 9,
+    "books_unreviewed": 9,
+    "bulk_import": 2,
+    "export_authors": 4,
+    "export_books": 11,
+    "export_library": 9,
+    "import_progress": 5,
+    "index": 8,
+    "list_delete": 3,
+    "list_details": 12,
+    "list_edit": 15,
+    "list_index": 6,
+    "list_new": 13,
+    "metrics": 2,
+    "publisher_details": 9,
+    "publisher_index": 3,
+    "report": 2,
+    "report_authors": 3,
+    "report_related_tags": 4,
+    "report_tags": 8,
+    "robots_txt": 0,
+    "series_details": 9,
+    "series_index": 7,
+    "stats": 18,
+    "tag_cloud": 8,
+    "tag_details": 13,
+}
+
+
+# routes whose pages list books, authors or tags; a fixed budget over a handful
+# of books can hide an N+1, so these must also not grow with the library
+LIST_ROUTES = {
+    "author_details",
+    "author_list",
+    "basic_search",
+    "books_all",
+    "books_borrowed",
+    "books_currently_reading",
+    "books_owned",
+    "books_owned_by_date",
+    "books_read",
+    "books_read_markdown",
+    "books_read_xml",
+    "books_reviewed",
+    "books_to_read",
+    "books_unowned",
+    "books_unreviewed",
+    "export_authors",
+    "export_books",
+    "export_library",
+    "index",
+    "list_details",
+    "list_index",
+    "publisher_details",
+    "publisher_index",
+    "report",
+    "report_authors",
+    "report_related_tags",
+    "report_tags",
+    "series_details",
+    "series_index",
+    "stats",
+    "tag_cloud",
+    "tag_details",
+}
+
+
+def route_names(patterns: list[URLPattern | URLResolver]) -> set[str]:
+    names = set()
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            names |= route_names(pattern.url_patterns)
+        elif pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+@pytest.fixture()
+def library(book_factory, author_factory, user):
+    author = author_factory(surname="Pratchett")
+    book = book_factory(
+        first_author=author,
+        series="Discworld",
+        series_order=1,
+        publisher="Verso",
+        page_count=300,
+        owned_by=user,
+    )
+    book.add_author(author_factory(), role="editor")
+    book.tags.add(Tag.objects.get(name="history"))
+    book_factory(parent_edition=book, series="Discworld")
+    for other in book_factory.create_batch(3, first_author=author, page_count=200):
+        other.mark_read_sometime()
+    book.start_reading()
+
+    reading_list = ReadingList.objects.create(title="Summer")
+    ReadingListEntry.objects.create(reading_list=reading_list, book=book)
+
+    job = ImportJob.objects.submit(
+        [{"title": "Mort", "authors": [("Terry Pratchett", "")]}]
+    )
+    StatisticsReport.objects.regenerate_dirty()
+
+    return {
+        "author": author.get_absolute_url(),
+        "book": book.get_absolute_url(),
+        "list": reading_list.get_absolute_url(),
+        "import": job.pk,
+    }
+
+
+@pytest.fixture()
+def add_books(book_factory, author_factory, user):
+    # more of each kind of book the `library` fixture has, four at a time
+    def add(count: int) -> None:
+        author = Author.objects.get(surname="Pratchett")
+        reading_list = ReadingList.objects.get(title="Summer")
+        history = Tag.objects.get(name="history")
+        for _ in range(count // 4):
+            book = book_factory(
+                first_author=author,
+                series="Discworld",
+                publisher="Verso",
+                page_count=300,
+                owned_by=user,
+            )
+            book.add_author(author_factory(), role="editor")
+            book.tags.add(history)
+            ReadingListEntry.objects.create(reading_list=reading_list, book=book)
+            book_factory(parent_edition=book, series="Discworld")
+            book_factory(
+                first_author=author_factory(), page_count=200
+            ).mark_read_sometime()
+            book_factory(
+                first_author=author, want_to_read=True, was_borrowed=True, review="Fun."
+            ).start_reading()
+        StatisticsReport.objects.regenerate_dirty()
+
+    return add
+
+
+def url_for(name: str, library: dict[str, str]) -> str:
+    # POST-only routes are requested too, to check they refuse GETs cheaply
+    paths = {
+        "author_delete": f"{library['author']}delete/",
+        "author_details": library["author"],
+        "author_edit": f"{library['author']}edit/",
+        "author_list": "/authors/",
+        "author_new": "/author/new/",
+        "basic_search": "/search/?query=discworld",
+        "book_add_tags": f"{library['book']}add_tags/",
+        "book_delete": f"{library['book']}delete/",
+        "book_details": library["book"],
+        "book_edit": f"{library['book']}edit/",
+        "book_finish_reading": f"{library['book']}finish/",
+        "book_import": "/book/import/",
+        "book_mark_owned": f"{library['book']}mark_owned/",
+        "book_mark_read_sometime": f"{library['book']}mark_read_sometime/",
+        "book_new": "/book/new/",
+        "book_rate": f"{library['book']}rate/",
+        "book_remove_tags": f"{library['book']}remove_tags/",
+        "book_start_reading": f"{library['book']}start/",
+        "book_update_progress": f"{library['book']}update/",
+        "books_all": "/books/",
+        "books_borrowed": "/books/borrowed/",
+        "books_currently_reading": "/books/reading/",
+        "books_owned": "/books/owned/",
+        "books_owned_by_date": "/books/owned/bydate/",
+        "books_read": "/books/read/",
+        "books_read_markdown": "/books/read.md",
+        "books_read_xml": "/books/read.xml",
+        "books_reviewed": "/books/reviewed/",
+        "books_to_read": "/books/toread/",
+        "books_unowned": "/books/unowned/",
+        "books_unreviewed": "/books/unreviewed/",
+        "bulk_import": "/bulkimport/",
+        "export_authors": "/export/authors/",
+        "export_books": "/export/books/",
+        "export_library": "/export/library.ndjson",
+        "import_progress": f"/bulkimport/{library['import']}/",
+        "index": "/",
+        "list_delete": f"{library['list']}delete/",
+        "list_details": library["list"],
+        "list_edit": f"{library['list']}edit/",
+        "list_index": "/lists/",
+        "list_new": "/list/new/",
+        "metrics": "/metrics/",
+        "publisher_details": "/publisher/Verso/",
+        "publisher_index": "/publishers/",
+        "report": "/report/",
+        "report_authors": "/report/authors/",
+        "report_related_tags": "/report/tags/related/history/",
+        "report_tags": "/report/tags/",
+        "robots_txt": "/robots.txt",
+        "series_details": "/series/Discworld/",
+        "series_index": "/series/",
+        "stats": "/stats/",
+        "tag_cloud": "/tags/",
+        "tag_details": "/tag/history/",
+    }
+    return paths[name]
+
+
+def test_every_route_has_a_budget():
+    assert route_names(urls.urlpatterns) == set(QUERY_BUDGETS)
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(("name", "budget"), sorted(QUERY_BUDGETS.items()))
+def test_query_budget(
+    admin_client, library, django_assert_max_num_queries, name, budget
+):
+    url = url_for(name, library)
+
+    with django_assert_max_num_queries(budget):
+        response = admin_client.get(url)
+        if response.streaming:
+            b"".join(response.streaming_content)
+
+    assert response.status_code < 500
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize("name", sorted(LIST_ROUTES))
+def test_list_queries_do_not_grow(admin_client, library, add_books, name):
+    url = url_for(name, library)
+
+    def count_queries() -> int:
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = admin_client.get(url)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        assert response.status_code == 200
+        return len(queries)
+
+    # every kind of book is on the page at both sizes
+    add_books(4)
+    small = count_queries()
+    add_books(20)
+
+    assert count_queries() == small
@@ -79,6 +79,9 @@ class TestReportView:
 
         assert "history" in results["politics"]
         assert "politics" in results["history"]
+        assert results["history"]["politics"] == 1
+        assert results["history"]["total"] == 1
+        assert results["philosophy"] == {"philosophy": 0, "total": 1}
 
         assert "philosophy" not in results["politics"]
         assert "philosophy" not in results["history"]
@@ -1,5 +1,8 @@
 import pytest
 
+from library.models import Book
+from library.models.book import SERIES_CACHE_KEY
+
 
 @pytest.mark.django_db()
 class TestPublisher:
@@ -8,3 +11,61 @@ class TestPublisher:
 
         resp = client.get("/series/")
         assert "Foo" in resp.context_data["all_series"]
+
+    def test_series_summaries(self, book_factory, author_factory, client):
+        author = author_factory(surname="Pratchett")
+        editor = author_factory(surname="Zed")
+        book = book_factory(series="Discworld", series_order=1, first_author=author)
+        book.add_author(editor, role="editor")
+        book_factory(series="Discworld", series_order=3, first_author=author)
+        book_factory(series="The Bromeliad", private=True)
+        book_factory()
+
+        resp = client.get("/series/")
+        assert list(resp.context_data["all_series"]) == ["Discworld"]
+        discworld = resp.context_data["all_series"]["Discworld"]
+        assert discworld["books"] == 2
+        assert (discworld["first"], discworld["last"]) == (1, 3)
+        assert discworld["authors"] == [author]
+        assert discworld["read"] == 0
+
+        co_author = author_factory(surname="Gaiman")
+        book.add_author(co_author)
+        book.start_reading()
+        book.finish_reading()
+        resp = client.get("/series/")
+        assert resp.context_data["all_series"]["Discworld"]["authors"] == [
+            co_author,
+            author,
+        ]
+        assert resp.context_data["all_series"]["Discworld"]["read"] == 1
+
+    def test_series_index_cached_until_series_change(
+        self, book_factory, admin_client, django_assert_num_queries
+    ):
+        book = book_factory(series="Discworld")
+        book_factory(series="The Bromeliad", private=True)
+        admin_client.get("/series/")
+
+        book.title = "Mort"
+        book.save()
+        # the session, the user, the authors and the read counts
+        with django_assert_num_queries(4):
+            resp = admin_client.get("/series/")
+        assert list(resp.context_data["all_series"]) == ["The Bromeliad", "Discworld"]
+
+        book.series = "Witches"
+        book.save()
+        resp = admin_client.get("/series/")
+        assert list(resp.context_data["all_series"]) == ["The Bromeliad", "Witches"]
+
+    def test_series_index_cleared_for_every_process(
+        self, book_factory, other_worker_cache
+    ):
+        book = book_factory(series="Discworld")
+        Book.objects.series_index(include_private=False)
+        assert other_worker_cache.get(f"{SERIES_CACHE_KEY}:0")
+
+        book.series = "Witches"
+        book.save()
+        assert other_worker_cache.get(f"{SERIES_CACHE_KEY}:0") is None
@@ -1,7 +1,7 @@
 import pytest
 from freezegun import freeze_time
 
-from library.models.book import Tag
+from library.models import Tag
 from library.views.stats import calculate_year_progress
 
 
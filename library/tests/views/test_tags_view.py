@@ -1,6 +1,7 @@
 import pytest
 
 from library.models import Tag
+from library.models.tag import CLOUD_CACHE_KEY
 
 
 @pytest.mark.django_db()
@@ -27,3 +28,34 @@ class TestTag:
         assert tags["size"]["non-fiction"]["history"] == 2
         assert tags["size"]["non-fiction"]["politics"] == 1
         assert tags["size"]["non-fiction"]["philosophy"] == 1
+
+    def test_tag_cloud_cached_until_tags_change(
+        self, book_factory, client, tag_factory, django_assert_num_queries
+    ):
+        fiction = tag_factory(name="fiction")
+        fiction.children.add(tag_factory(name="fantasy"))
+        book = book_factory()
+        book.tags.set((Tag.objects.get(name="fantasy"),))
+
+        client.get("/tags/")
+        with django_assert_num_queries(0):
+            resp = client.get("/tags/")
+        assert resp.context_data["tags"]["name"]["fiction"]["fantasy"] == 1
+        assert resp.context_data["tags"]["name"]["fiction"]["no other tags"] == 0
+
+        book_factory().tags.set((fiction,))
+        resp = client.get("/tags/")
+        assert resp.context_data["tags"]["name"]["fiction"]["fiction"] == 2
+        assert resp.context_data["tags"]["name"]["fiction"]["no other tags"] == 1
+        assert resp.context_data["tags"]["name"]["all"]["fiction"] == 1
+
+        book.delete()
+        resp = client.get("/tags/")
+        assert resp.context_data["tags"]["name"]["fiction"]["fantasy"] == 0
+
+    def test_tag_cloud_cleared_for_every_process(self, other_worker_cache, tag_factory):
+        Tag.objects.cloud()
+        assert other_worker_cache.get(CLOUD_CACHE_KEY)
+
+        tag_factory(name="history")
+        assert other_worker_cache.get(CLOUD_CACHE_KEY) is None
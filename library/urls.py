@@ -5,7 +5,7 @@ from . import views
 app_name = "library"
 urlpatterns = [
     path("", views.log_entry.CurrentlyReadingView.as_view(), name="index"),
-    path("robots.txt", views.robots_txt),
+    path("robots.txt", views.robots_txt, name="robots_txt"),
     path("author/new/", views.author.NewView.as_view(), name="author_new"),
     path(
         "author/<slug:slug>/",
@@ -145,6 +145,7 @@ urlpatterns = [
         ),
     ),
     path("lists/", views.reading_list.IndexView.as_view(), name="list_index"),
+    path("metrics/", views.metrics.recent_requests, name="metrics"),
     path("list/new/", views.reading_list.NewView.as_view(), name="list_new"),
     path(
         "list/<str:pk>/",
@@ -193,7 +194,17 @@ urlpatterns = [
         r"^report(?:/(?P<page>\d+))?/", views.report.IndexView.as_view(), name="report"
     ),
     path("bulkimport/", views.importer.bulk_import, name="bulk_import"),
+    path(
+        "bulkimport/<int:pk>/",
+        views.importer.import_progress,
+        name="import_progress",
+    ),
     # exporters
     path("export/authors/", views.author.export_authors, name="export_authors"),
     path("export/books/", views.book.export_books, name="export_books"),
+    path(
+        "export/library.ndjson",
+        views.book.export_library,
+        name="export_library",
+    ),
 ]
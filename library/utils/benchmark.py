@@ -0,0 +1,89 @@
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import django
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from library.models import Author, Book, LogEntry, StatisticsReport, Tag
+
+
+def _view(path: str) -> Callable[[], Any]:
+    def get() -> Any:
+        return Client().get(path)
+
+    return get
+
+
+def _statistics_report() -> None:
+    StatisticsReport(year=0).generate()
+
+
+def _to_json() -> list[dict[str, Any]]:
+    return [book.to_json() for book in Book.objects.all()[:100]]
+
+
+# the hot paths worth watching as the library grows; querysets are listed so
+# they actually run
+BENCHMARKS: dict[str, Callable[[], Any]] = {
+    "books.read": lambda: list(Book.objects.read()),
+    "books.owned": lambda: list(Book.objects.owned()),
+    "books.tagged": lambda: list(Book.objects.tagged("fiction")),
+    "books.search": lambda: list(Book.objects.search("the")),
+    "statistics_report.generate": _statistics_report,
+    "book.to_json": _to_json,
+    "tag_cloud": _view("/tags/"),
+    "series.index": _view("/series/"),
+    "view.books": _view("/books/"),
+    "view.books_read": _view("/books/read/"),
+    "view.books_owned": _view("/books/owned/"),
+    "view.authors": _view("/authors/"),
+}
+
+
+def measure(benchmark: Callable[[], Any], repeat: int) -> dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            benchmark()
+            timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "min_ms": round(min(timings), 2),
+        "median_ms": round(statistics.median(timings), 2),
+        "max_ms": round(max(timings), 2),
+        "queries": len(queries),
+    }
+
+
+def run(names: Iterable[str] | None = None, repeat: int = 5) -> dict[str, Any]:
+    return {
+        "run_at": timezone.now().isoformat(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "library": {
+            "books": Book.objects.count(),
+            "authors": Author.objects.count(),
+            "tags": Tag.objects.count(),
+            "log_entries": LogEntry.objects.count(),
+        },
+        "results": {
+            name: measure(BENCHMARKS[name], repeat) for name in (names or BENCHMARKS)
+        },
+    }
+
+
+# median time of each benchmark in `current` relative to `previous`
+def compare(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, float]:
+    return {
+        name: round(result["median_ms"] / before["median_ms"], 2)
+        for name, result in current["results"].items()
+        if (before := previous["results"].get(name)) and before["median_ms"]
+    }
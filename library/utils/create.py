@@ -7,9 +7,8 @@ from library.models import Author, Book
 from library.utils import smarten
 
 
-def book(
-    data: dict[str, Any], *_: Any, owned: bool = False
-) -> tuple[Book, bool, list[tuple[Author, bool]]]:
+# moves "Title (Series, #1)" into the title, series and series_order fields
+def split_series(data: dict[str, Any]) -> None:
     data["title"] = data["title"].strip()
 
     if data["title"].endswith(")"):
@@ -21,6 +20,12 @@ def book(
             with suppress(ValueError):
                 data["series_order"] = float(rest[0].strip(")"))
 
+
+def book(
+    data: dict[str, Any], *_: Any, owned: bool = False
+) -> tuple[Book, bool, list[tuple[Author, bool]]]:
+    split_series(data)
+
     new_book, book_created = Book.objects.filter(
         Q(title__iexact=data["title"]) | Q(title__iexact=smarten(data["title"]))
     ).get_or_create(
@@ -0,0 +1,60 @@
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Exists, OuterRef, Q
+
+from library.models import Author, Book, BookAuthor
+
+CHUNK_SIZE = 500
+
+
+def _line(kind: str, record: dict[str, Any]) -> str:
+    return json.dumps({"type": kind, **record}, cls=DjangoJSONEncoder) + "\n"
+
+
+def has_books() -> Q:
+    return Q(
+        Exists(Book.objects.filter(first_author=OuterRef("pk")))
+        | Exists(BookAuthor.objects.filter(author=OuterRef("pk")))
+    )
+
+
+def authors() -> Iterator[str]:
+    for author in (
+        Author.objects.filter(has_books())
+        .order_by("id")
+        .iterator(chunk_size=CHUNK_SIZE)
+    ):
+        yield _line("author", author.to_json())
+
+
+def books() -> Iterator[str]:
+    # iterator() runs the prefetches once per chunk, so memory stays flat and
+    # the query count grows with the number of chunks, not books
+    for book in (
+        Book.objects.with_export_data().order_by("id").iterator(chunk_size=CHUNK_SIZE)
+    ):
+        yield _line("book", book.to_json())
+
+
+# one JSON object per line; authors come first so books can refer to them
+def ndjson() -> Iterator[str]:
+    yield from authors()
+    yield from books()
+
+
+def gzipped(lines: Iterable[str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for line in lines:
+        if data := compressor.compress(line.encode("utf-8")):
+            yield data
+    yield compressor.flush()
+
+
+def stream(compress: bool = False) -> Iterator[bytes]:  # noqa: FBT001, FBT002
+    if compress:
+        return gzipped(ndjson())
+    return (line.encode("utf-8") for line in ndjson())
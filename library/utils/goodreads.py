@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING
 
-import requests
 from bs4 import BeautifulSoup
 from django.conf import settings
 
+from library.utils import http
+
 if TYPE_CHECKING:
     from library.models import Book  # pragma: no cover
 
@@ -45,7 +46,10 @@ def find_all(query: str) -> list[dict[str, str]]:
 
     search_url = f"https://www.goodreads.com/search/index.xml?key={settings.GOODREADS_KEY}&q={query}"
 
-    xml = BeautifulSoup(requests.get(search_url, timeout=10).text, features="xml")
+    response = http.get(
+        search_url, is_miss=lambda response: "<work>" not in response.text
+    )
+    xml = BeautifulSoup(response.text, features="xml")
 
     all_results = xml.GoodreadsResponse.search.results.find_all("work")
     if not all_results:
@@ -73,7 +77,7 @@ def find_all(query: str) -> list[dict[str, str]]:
 
 def scrape_image(goodreads_id: str) -> str:
     goodreads_url = f"https://www.goodreads.com/book/show/{goodreads_id}"
-    data = BeautifulSoup(requests.get(goodreads_url, timeout=10).text, features="lxml")
+    data = BeautifulSoup(http.get(goodreads_url).text, features="lxml")
     if meta_tag := data.find(
         "meta", property="og:image", content=lambda x: "nophoto" not in x
     ):
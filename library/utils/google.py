@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 import requests
 from django.conf import settings
 
+from library.utils import http
+
 if TYPE_CHECKING:
     from library.models import Book  # pragma: no cover
 
@@ -27,12 +29,17 @@ def fetch(google_id: str = "", isbn: str = "") -> dict[str, str] | None:
         return {}
 
     try:
-        data = requests.get(search_url, timeout=10).json()
+        data = http.get(
+            search_url, is_miss=lambda response: "volumeInfo" not in response.text
+        ).json()
     except requests.exceptions.ConnectionError:
         return None
 
     if "error" in data and data["error"]["status"] == "RESOURCE_EXHAUSTED":
-        return None
+        # out of quota: http.get has paused requests to Google, and enrichment
+        # jobs try again later
+        msg = "Google Books quota exhausted"
+        raise http.RateLimitedError(msg)
 
     if "volumeInfo" in data:
         volume = data["volumeInfo"]
@@ -0,0 +1,263 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+
+from library.utils import metrics
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+TIMEOUT = 10
+
+# (ttl, miss ttl) in seconds for each endpoint, matched by longest url prefix;
+# misses are retried sooner in case the data turns up
+TTLS = {
+    "www.goodreads.com/search/": (7 * DAY, DAY),
+    "www.goodreads.com/book/show/": (30 * DAY, DAY),
+    "www.googleapis.com/books/": (7 * DAY, DAY),
+    "www.versobooks.com/search": (DAY, HOUR),
+    "www.versobooks.com/": (30 * DAY, DAY),
+    "versobooks.com/": (30 * DAY, DAY),
+}
+DEFAULT_TTLS = (HOUR, 5 * MINUTE)
+
+# statuses which say the thing isn't there, as opposed to a transient failure
+MISSING_STATUSES = {404, 410}
+
+# (requests per second, burst) allowed to each host, shared by all threads
+RATES = {
+    "www.goodreads.com": (1.0, 5),
+    "www.googleapis.com": (2.0, 10),
+    "www.versobooks.com": (1.0, 5),
+    "versobooks.com": (1.0, 5),
+}
+DEFAULT_RATE = (2.0, 5)
+
+# how long to leave a host alone when it says we've asked too often and
+# doesn't say for how long
+BACKOFF = MINUTE
+
+stats: Counter[str] = Counter()
+_stats_lock = threading.Lock()
+_local = threading.local()
+
+
+class RateLimitedError(Exception):
+    pass
+
+
+class TokenBucket:
+    # hands out `rate` tokens a second, saving up to `burst` of them; a paused
+    # bucket hands out nothing until the pause is over
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        # takes a token, returning how many seconds to wait before using it
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return max(self.paused_until - now, 0) + max(-self.tokens / self.rate, 0)
+
+    def take(self) -> None:
+        if (wait := self.reserve()) > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket_for(url: str) -> TokenBucket:
+    host = urlsplit(url).netloc
+    with _buckets_lock:
+        if host not in _buckets:
+            _buckets[host] = TokenBucket(*RATES.get(host, DEFAULT_RATE))
+        return _buckets[host]
+
+
+def _retry_after(response: requests.Response) -> float | None:
+    # Google says it's out of quota in the body, sometimes with a 403
+    if response.status_code != 429 and "RESOURCE_EXHAUSTED" not in response.text:
+        return None
+    try:
+        return float(response.headers.get("Retry-After", BACKOFF))
+    except ValueError:
+        return BACKOFF
+
+
+class CachedResponse:
+    def __init__(self, status_code: int, text: str) -> None:
+        self.status_code = status_code
+        self.text = text
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        stats[key] += 1
+
+
+def cache_stats() -> dict[str, int]:
+    with _stats_lock:
+        return {key: stats[key] for key in ["hits", "misses", "stores", "evictions"]}
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        stats.clear()
+
+
+# requests sessions aren't thread safe, so each thread keeps one per host
+def session_for(url: str) -> requests.Session:
+    sessions: dict[str, requests.Session] = _local.__dict__.setdefault("sessions", {})
+    host = urlsplit(url).netloc
+    if host not in sessions:
+        sessions[host] = requests.Session()
+    return sessions[host]
+
+
+def ttls_for(url: str) -> tuple[int, int]:
+    parts = urlsplit(url)
+    location = f"{parts.netloc}{parts.path}"
+    matches = [prefix for prefix in TTLS if location.startswith(prefix)]
+    return TTLS[max(matches, key=len)] if matches else DEFAULT_TTLS
+
+
+def _cache() -> sqlite3.Connection | None:
+    path = getattr(settings, "HTTP_CACHE_PATH", None)
+    if not path:
+        return None
+
+    connections: dict[str, sqlite3.Connection] = _local.__dict__.setdefault(
+        "connections", {}
+    )
+    if str(path) not in connections:
+        connection = sqlite3.connect(path, isolation_level=None, timeout=TIMEOUT)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS response ("
+            "key TEXT PRIMARY KEY, status INTEGER, body TEXT, size INTEGER, "
+            "expires REAL, accessed REAL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS response_accessed ON response (accessed)"
+        )
+        connections[str(path)] = connection
+    return connections[str(path)]
+
+
+def _key(url: str) -> str:
+    # urls can carry api keys, so don't store them as they are
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _lookup(cache: sqlite3.Connection, key: str) -> CachedResponse | None:
+    now = time.time()
+    row = cache.execute(
+        "SELECT status, body FROM response WHERE key = ? AND expires > ?",
+        [key, now],
+    ).fetchone()
+    if row is None:
+        return None
+
+    cache.execute("UPDATE response SET accessed = ? WHERE key = ?", [now, key])
+    return CachedResponse(*row)
+
+
+def _store(
+    cache: sqlite3.Connection, key: str, response: CachedResponse, ttl: int
+) -> None:
+    now = time.time()
+    cache.execute(
+        "INSERT OR REPLACE INTO response VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            key,
+            response.status_code,
+            response.text,
+            len(response.text),
+            now + ttl,
+            now,
+        ],
+    )
+    _count("stores")
+    evict(cache)
+
+
+# drops expired responses, then the least recently used until under the limit
+def evict(cache: sqlite3.Connection) -> None:
+    evicted = cache.execute(
+        "DELETE FROM response WHERE expires <= ?", [time.time()]
+    ).rowcount
+
+    max_bytes = getattr(settings, "HTTP_CACHE_MAX_BYTES", 50 * 1024 * 1024)
+    (total,) = cache.execute("SELECT coalesce(sum(size), 0) FROM response").fetchone()
+    if total > max_bytes:
+        keys = []
+        for key, size in cache.execute(
+            "SELECT key, size FROM response ORDER BY accessed"
+        ).fetchall():
+            if total <= max_bytes:
+                break
+            keys.append([key])
+            total -= size
+        cache.executemany("DELETE FROM response WHERE key = ?", keys)
+        evicted += len(keys)
+
+    with _stats_lock:
+        stats["evictions"] += evicted
+
+
+def get(
+    url: str, is_miss: Callable[[CachedResponse], bool] | None = None
+) -> CachedResponse:
+    cache = _cache()
+    key = _key(url)
+    if cache and (cached := _lookup(cache, key)):
+        _count("hits")
+        return cached
+    _count("misses")
+
+    bucket = bucket_for(url)
+    if getattr(settings, "HTTP_RATE_LIMITS", True):
+        bucket.take()
+    with metrics.timed("http"):
+        response = session_for(url).get(url, timeout=TIMEOUT)
+    result = CachedResponse(response.status_code, response.text)
+    if (retry_after := _retry_after(response)) is not None:
+        bucket.pause(retry_after)
+
+    # rate limits and server errors shouldn't stick around
+    if not cache or (not response.ok and response.status_code not in MISSING_STATUSES):
+        return result
+
+    ttl, miss_ttl = ttls_for(url)
+    if not response.ok or (is_miss and is_miss(result)):
+        ttl = miss_ttl
+
+    _store(cache, key, result, ttl)
+    return result
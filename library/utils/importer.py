@@ -3,32 +3,308 @@ import threading
 from collections.abc import Sequence
 from typing import Any
 
-from library.utils import create
+from django.contrib.auth.models import User
+from django.db import connections, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from library.models import (
+    Author,
+    Book,
+    BookAuthor,
+    EnrichmentJob,
+    ImportJob,
+    LogEntry,
+    ReadState,
+    StatisticsReport,
+)
+from library.utils import create, search_index, smarten
 
 logger = logging.getLogger(__name__)
 
+BATCH_SIZE = 500
+
+
+class Importer:
+    # does what create.book does for each record, but looks up the authors
+    # and existing books for the whole batch up front, writes everything in
+    # bulk inside one transaction, and then brings the derived tables up to
+    # date and queues enrichment once rather than on every save
+    def __init__(self, records: Sequence[dict[str, Any]]) -> None:
+        self.records: list[tuple[dict[str, Any], bool]] = []
+        for record in records:
+            data = dict(record)
+            owned = data.pop("owned", False)
+            if not data.get("authors"):
+                msg = f"{data.get('title')} has no authors"
+                raise ValueError(msg)
+            create.split_series(data)
+            data["authors"] = [(name.strip(), role) for name, role in data["authors"]]
+            self.records.append((data, owned))
+
+        self.new_books: list[Book] = []
+        self.changed_books: dict[int, Book] = {}
+        self.changed_fields: set[str] = set()
+        self.refresh_goodreads: set[int] = set()
+
+    def run(self) -> list[tuple[Book, bool]]:
+        with transaction.atomic(), StatisticsReport.objects.deferred():
+            matches = self._find_books()
+
+            # like create.book, first authors are only looked up for new books
+            names = set()
+            for index, ((data, _), match) in enumerate(
+                zip(self.records, matches, strict=True)
+            ):
+                if match == index:
+                    names.add(data["authors"][0][0])
+                names |= {name for name, _ in data["authors"][1:]}
+            authors = Author.objects.get_or_create_many_by_single_name(names)
+            for author, created in authors.values():
+                logger.info("%s %s", "created" if created else "updated", author)
+
+            books = self._update_books(matches, authors)
+            self._save_books()
+            self._add_authors(books, authors)
+            self._update_derived()
+
+        for book, created in books:
+            logger.info("%s %s", "created" if created else "updated", book)
+        return books
+
+    def _find_books(self) -> list[Book | int]:
+        # each record's existing book, or the index of the first record for
+        # the same new book
+        titles = {
+            title.lower()
+            for data, _ in self.records
+            for title in (data["title"], smarten(data["title"]))
+        }
+        candidates = [
+            (book.title.lower(), book)
+            for book in Book.objects.annotate(lower_title=Lower("title"))
+            .filter(lower_title__in=titles)
+            .select_related("first_author")
+            .order_by("id")
+        ]
+
+        matches: list[Book | int] = []
+        new: dict[int, tuple[str, str]] = {}
+        for index, (data, _) in enumerate(self.records):
+            name = data["authors"][0][0]
+            titles = {data["title"].lower(), smarten(data["title"]).lower()}
+            surname = name.rsplit(" ", 1)[-1].lower()
+
+            match: Book | int | None = next(
+                (
+                    book
+                    for title, book in candidates
+                    if title in titles
+                    and book.first_author
+                    and book.first_author.surname.lower().endswith(surname)
+                ),
+                None,
+            )
+            if match is None:
+                match = next(
+                    (
+                        other
+                        for other, (title, other_surname) in new.items()
+                        if title in titles and other_surname.endswith(surname)
+                    ),
+                    index,
+                )
+            if match == index:
+                new[index] = (
+                    smarten(data["title"]).lower(),
+                    Author.normalise_name(name)["surname"].lower(),
+                )
+            matches.append(match)
+        return matches
+
+    def _update_books(
+        self, matches: list[Book | int], authors: dict[str, tuple[Author, bool]]
+    ) -> list[tuple[Book, bool]]:
+        owner = None
+        new_books: dict[int, Book] = {}
+
+        books = []
+        for index, ((data, owned), match) in enumerate(
+            zip(self.records, matches, strict=True)
+        ):
+            created = match == index
+            if isinstance(match, Book):
+                book = match
+            elif created:
+                name, role = data["authors"][0]
+                book = new_books[index] = Book(first_author=authors[name][0])
+                if role:
+                    book.first_author_role = role
+                self.new_books.append(book)
+            else:
+                book = new_books[match]
+
+            old_isbn, old_asin = book.isbn, book.asin
+            changed = self._update(book, data)
+            if owned:
+                owner = owner or User.objects.get(username="ben")
+                book.owned_by = owner
+                book.acquired_date = timezone.now()
+                book.was_borrowed = False
+                book.borrowed_from = ""
+                changed |= {
+                    "owned_by",
+                    "acquired_date",
+                    "was_borrowed",
+                    "borrowed_from",
+                }
+            book.normalise()
+
+            if book.pk and changed:
+                self.changed_books[book.pk] = book
+                self.changed_fields |= changed
+                if (book.isbn or book.asin) and (book.isbn, book.asin) != (
+                    old_isbn,
+                    old_asin,
+                ):
+                    self.refresh_goodreads.add(book.pk)
+            books.append((book, created))
+        return books
+
+    def _update(self, book: Book, data: dict[str, Any]) -> set[str]:
+        # Book.update without the save: fills in fields which are still empty
+        changed = set()
+        for key, value in data.items():
+            if key in ("id", "authors") or not hasattr(book, key):
+                continue
+            if not getattr(book, key):
+                if value != getattr(book, key):
+                    changed.add(key)
+                setattr(book, key, value)
+        return changed
+
+    def _save_books(self) -> None:
+        for book in self.new_books:
+            book.effective_owner_id = book.owned_by_id
+        Book.assign_slugs(self.new_books)
+        Book.objects.bulk_create(self.new_books, batch_size=BATCH_SIZE)
+        for book in self.new_books:
+            if not book.slug:
+                book.slug = str(book.pk)
+        Book.objects.bulk_update(
+            [book for book in self.new_books if book.slug == str(book.pk)], ["slug"]
+        )
+
+        now = timezone.now()
+        for book in self.changed_books.values():
+            book.modified_date = now
+        Book.objects.bulk_update(
+            self.changed_books.values(),
+            [
+                *{"title", "subtitle", "series", "publisher", "image_url"},
+                *self.changed_fields,
+                "rating",
+                "modified_date",
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+    def _add_authors(
+        self,
+        books: list[tuple[Book, bool]],
+        authors: dict[str, tuple[Author, bool]],
+    ) -> None:
+        linked = set(
+            BookAuthor.objects.filter(
+                book__in=[book for book, created in books if not created]
+            ).values_list("book", "author")
+        )
+
+        authorships = []
+        for (book, _), (data, _) in zip(books, self.records, strict=True):
+            for order, (name, role) in enumerate(data["authors"][1:], start=1):
+                author = authors[name][0]
+                if author.pk == book.first_author_id or (book.pk, author.pk) in linked:
+                    continue
+                linked.add((book.pk, author.pk))
+                authorships.append(
+                    BookAuthor(book=book, author=author, role=role, order=order)
+                )
+                self.changed_books.setdefault(book.pk, book)
+        BookAuthor.objects.bulk_create(authorships, batch_size=BATCH_SIZE)
+        if authorships:
+            Book.objects.clear_series_index()
+
+    def _update_derived(self) -> None:
+        new_ids = {book.pk for book in self.new_books}
+        changed = [
+            book for book in self.changed_books.values() if book.pk not in new_ids
+        ]
+
+        ReadState.objects.bulk_create(
+            [ReadState(book_id=book_id) for book_id in new_ids],
+            batch_size=BATCH_SIZE,
+        )
+
+        # what Book.save would have passed on to other editions
+        for book in Book.objects.filter(
+            id__in=[book.pk for book in changed], alternate_editions__isnull=False
+        ).distinct():
+            book.save_other_editions()
+        for want_to_read in (True, False):
+            Book.objects.filter(
+                parent_edition__in=[
+                    book.pk for book in changed if book.want_to_read == want_to_read
+                ]
+            ).update(want_to_read=want_to_read)
+        Book.objects.filter(
+            id__in=[book.pk for book in changed]
+        ).update_effective_owners()
+
+        search_index.index_books(
+            Book.objects.filter(Q(id__in=new_ids) | Q(id__in=list(self.changed_books)))
+            .select_related("first_author")
+            .prefetch_related("additional_authors", "tags")
+        )
+        if self.new_books or self.changed_fields & {"series", "private"}:
+            Book.objects.clear_series_index()
+        Book.objects.clear_publisher_index()
+        StatisticsReport.objects.mark_dirty(
+            LogEntry.objects.filter(
+                book__in=[book.pk for book in changed], end_date__isnull=False
+            )
+            .values_list("end_date__year", flat=True)
+            .distinct()
+        )
+
+        enrich = [
+            book
+            for book in [*self.new_books, *changed]
+            if book.pk not in self.refresh_goodreads and book.needs_enrichment
+        ]
+        EnrichmentJob.objects.enqueue_many(enrich)
+        EnrichmentJob.objects.enqueue_many(
+            [book for book in changed if book.pk in self.refresh_goodreads],
+            refresh_goodreads=True,
+        )
+
 
-def _process_record(record: dict[str, Any]) -> None:
-    owned = record.get("owned", False)
-    if "owned" in record:
-        del record["owned"]
-    book, created, authors = create.book(record, owned=owned)
-    if created:
-        logger.info("created %s", book)
-    else:
-        logger.info("updated %s", book)
-    for author, created in authors:
-        if created:
-            logger.info("created %s", author)
-        else:
-            logger.info("updated %s", author)
+def import_records(records: Sequence[dict[str, Any]]) -> list[tuple[Book, bool]]:
+    return Importer(records).run()
 
 
-def _process_in_thread(records: Sequence[dict[str, Any]]) -> None:
-    for record in records:
-        _process_record(record)
+def run_job(job: ImportJob) -> None:
+    try:
+        job.run()
+    finally:
+        connections.close_all()
 
 
-def process(records: Sequence[dict[str, Any]]) -> None:
-    thread = threading.Thread(target=_process_in_thread, args=[records])
+# saves the records as an ImportJob and imports them in the background; if
+# the process stops first, resume_imports finishes the job
+def process(records: Sequence[dict[str, Any]]) -> ImportJob:
+    job = ImportJob.objects.submit(records, status=ImportJob.Status.RUNNING)
+    thread = threading.Thread(target=run_job, args=[job])
     thread.start()
+    return job
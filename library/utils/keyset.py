@@ -0,0 +1,310 @@
+import base64
+import binascii
+import datetime
+import hashlib
+import json
+import math
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, models
+from django.db.models import F, Q
+from django.db.models.expressions import OrderBy
+from django.http import Http404, HttpRequest
+from django.views.generic.list import MultipleObjectMixin
+
+COUNT_TIMEOUT = 5 * 60
+
+# request parameters holding the cursor; either being present, even empty,
+# switches a view into keyset pagination
+AFTER = "after"
+BEFORE = "before"
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class Key:
+    # one column of the sort order, annotated onto the queryset as `name`
+    def __init__(
+        self,
+        name: str,
+        expression: Any,
+        descending: bool,  # noqa: FBT001
+        nulls_first: bool,  # noqa: FBT001
+    ) -> None:
+        self.name = name
+        self.expression = expression
+        self.descending = descending
+        self.nulls_first = nulls_first
+
+    def order_by(self, reverse: bool = False) -> OrderBy:  # noqa: FBT001, FBT002
+        nulls_first = self.nulls_first != reverse
+        column = F(self.name)
+        if self.descending != reverse:
+            return (
+                column.desc(nulls_first=True)
+                if nulls_first
+                else column.desc(nulls_last=True)
+            )
+        return (
+            column.asc(nulls_first=True) if nulls_first else column.asc(nulls_last=True)
+        )
+
+    def beyond(
+        self, value: Any, reverse: bool = False  # noqa: FBT001, FBT002
+    ) -> Q | None:
+        # rows which come strictly after `value` in this column's order
+        nulls_first = self.nulls_first != reverse
+        if value is None:
+            return Q(**{f"{self.name}__isnull": False}) if nulls_first else None
+
+        lookup = "lt" if self.descending != reverse else "gt"
+        q = Q(**{f"{self.name}__{lookup}": value})
+        if not nulls_first:
+            q |= Q(**{f"{self.name}__isnull": True})
+        return q
+
+    def equal(self, value: Any) -> Q:
+        if value is None:
+            return Q(**{f"{self.name}__isnull": True})
+        return Q(**{self.name: value})
+
+
+def keys_for(queryset: models.QuerySet[Any]) -> list[Key]:
+    query = queryset.query
+    ordering = list(query.order_by) or (
+        list(queryset.model._meta.ordering)  # noqa: SLF001
+        if query.default_ordering
+        else []
+    )
+
+    pk_name = queryset.model._meta.pk.name  # noqa: SLF001
+    keys: list[Key] = []
+    for item in [*ordering, pk_name]:
+        nulls_first = None
+        if isinstance(item, str):
+            if item == "?":
+                msg = "random ordering can't be paginated by keyset"
+                raise ValueError(msg)
+            descending = item.startswith("-")
+            expression: Any = F(item.lstrip("-"))
+        elif isinstance(item, OrderBy):
+            descending = item.descending
+            expression = item.expression
+            if item.nulls_first or item.nulls_last:
+                nulls_first = bool(item.nulls_first)
+        else:
+            descending = False
+            expression = item
+
+        if nulls_first is None:
+            # where the database puts nulls when not told otherwise
+            nulls_first = connection.features.nulls_order_largest == descending
+        keys.append(Key(f"keyset_{len(keys)}", expression, descending, nulls_first))
+    return keys
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    # the default encoder rounds times to milliseconds, which would skip or
+    # repeat rows on either side of the cursor
+    def default(self, o: Any) -> Any:
+        if isinstance(o, datetime.datetime | datetime.time):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values: list[Any], number: int) -> str:
+    data = json.dumps({"k": values, "p": number}, cls=CursorEncoder)
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, key_count: int) -> tuple[list[Any], int]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        values, number = data["k"], int(data["p"])
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as error:
+        raise InvalidCursorError(cursor) from error
+
+    if not isinstance(values, list) or len(values) != key_count or number < 1:
+        raise InvalidCursorError(cursor)
+    return values, number
+
+
+class KeysetPage(Sequence[Any]):
+    is_keyset = True
+
+    def __init__(
+        self,
+        object_list: list[Any],
+        number: int,
+        paginator: "KeysetPaginator",
+        *,
+        has_next: bool,
+        has_previous: bool,
+    ) -> None:
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self) -> str:
+        return f"<Keyset page {self.number}>"
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        return self.object_list[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.object_list)
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self._has_next or self._has_previous
+
+    def _cursor(self, row: Any, number: int) -> str:
+        return encode_cursor(
+            [getattr(row, key.name) for key in self.paginator.keys], number
+        )
+
+    @property
+    def next_cursor(self) -> str | None:
+        if not self._has_next:
+            return None
+        return self._cursor(self.object_list[-1], self.number + 1)
+
+    @property
+    def previous_cursor(self) -> str | None:
+        if not self._has_previous:
+            return None
+        return self._cursor(self.object_list[0], max(self.number - 1, 1))
+
+
+class KeysetPaginator:
+    # pages through a queryset by filtering on the sort key of the last row
+    # seen, so deep pages cost the same as the first; there's no offset to
+    # jump to, so the page count is only a guide
+    def __init__(
+        self,
+        queryset: models.QuerySet[Any],
+        per_page: int,
+        count: int | None = None,
+    ) -> None:
+        self.keys = keys_for(queryset)
+        self.queryset = queryset.annotate(
+            **{key.name: key.expression for key in self.keys}
+        )
+        self.per_page = per_page
+        self._count = count
+
+    @property
+    def count(self) -> int:
+        if self._count is None:
+            self._count = cached_count(self.queryset)
+        return self._count
+
+    @property
+    def num_pages(self) -> int:
+        return max(math.ceil(self.count / self.per_page), 1)
+
+    def _seek(self, values: list[Any], reverse: bool) -> Q:  # noqa: FBT001
+        # (a, b, c) > (x, y, z), spelled out so each column keeps its own
+        # direction and null placement
+        q = Q(pk__in=[])
+        equal = Q()
+        for key, value in zip(self.keys, values, strict=True):
+            if (beyond := key.beyond(value, reverse)) is not None:
+                q |= equal & beyond
+            equal &= key.equal(value)
+        return q
+
+    def page(self, after: str | None = None, before: str | None = None) -> KeysetPage:
+        reverse = bool(before)
+        cursor = before or after
+        rows = self.queryset.order_by(*[key.order_by(reverse) for key in self.keys])
+
+        number = 1
+        if cursor:
+            values, number = decode_cursor(cursor, len(self.keys))
+            rows = rows.filter(self._seek(values, reverse))
+
+        object_list = list(rows[: self.per_page + 1])
+        more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+
+        if reverse:
+            object_list.reverse()
+            return KeysetPage(
+                object_list, number, self, has_next=True, has_previous=more
+            )
+        return KeysetPage(
+            object_list, number, self, has_next=more, has_previous=bool(cursor)
+        )
+
+
+def cached_count(queryset: models.QuerySet[Any]) -> int:
+    key = hashlib.sha256(str(queryset.query).encode("utf-8")).hexdigest()
+    return int(
+        cache.get_or_set(f"keyset-count:{key}", queryset.count, COUNT_TIMEOUT) or 0
+    )
+
+
+class KeysetPaginationMixin(MultipleObjectMixin[Any]):
+    # pages by keyset when the view asks for it or the request carries a
+    # cursor, and by page number otherwise
+    keyset_pagination = False
+    keyset_page_size = 100
+
+    kwargs: dict[str, Any]
+    request: HttpRequest
+
+    def use_keyset(self) -> bool:
+        return bool(
+            self.kwargs.get("keyset_pagination", self.keyset_pagination)
+            or AFTER in self.request.GET
+            or BEFORE in self.request.GET
+        )
+
+    def get_keyset_count(self, _queryset: Any) -> int | None:
+        return None
+
+    def get_paginate_by(self, queryset: Any) -> int | None:
+        paginate_by = super().get_paginate_by(queryset)
+        if self.use_keyset():
+            return paginate_by or self.keyset_page_size
+        return paginate_by
+
+    def paginate_queryset(self, queryset: Any, page_size: int) -> Any:
+        if not self.use_keyset():
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(
+            queryset, page_size, self.get_keyset_count(queryset)
+        )
+        try:
+            page = paginator.page(
+                after=self.request.GET.get(AFTER), before=self.request.GET.get(BEFORE)
+            )
+        except InvalidCursorError as error:
+            msg = "Invalid cursor"
+            raise Http404(msg) from error
+        return (paginator, page, page.object_list, page.has_other_pages())
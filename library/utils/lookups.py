@@ -0,0 +1,35 @@
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from django.db import connections
+
+WORKERS = 4
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+
+def _in_worker(func: Callable[[Item], Result]) -> Callable[[Item], Result]:
+    def run(item: Item) -> Result:
+        try:
+            return func(item)
+        finally:
+            # Django opens a connection per thread, which nothing else closes
+            connections.close_all()
+
+    return run
+
+
+# runs func over items on a bounded pool of threads, returning the results in
+# order; func may read from the database but should leave writing to the
+# caller, so that writes stay on one thread
+def map_concurrently(
+    func: Callable[[Item], Result], items: Iterable[Item], workers: int = WORKERS
+) -> list[Result]:
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(_in_worker(func), items))
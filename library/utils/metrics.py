@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+RECENT_SAMPLES = 200
+
+# kept in memory, so each worker process only has its own requests; the
+# "request" log lines the middleware writes cover them all
+recent: deque[dict[str, Any]] = deque(maxlen=RECENT_SAMPLES)
+_local = threading.local()
+
+
+class RequestMetrics:
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.times = {"sql": 0.0, "template": 0.0, "http": 0.0}
+        self.http_requests = 0
+
+    def sample(self) -> dict[str, Any]:
+        return {
+            "queries": self.queries,
+            "http_requests": self.http_requests,
+            **{
+                f"{kind}_ms": round(spent * 1000, 2)
+                for kind, spent in self.times.items()
+            },
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 2),
+        }
+
+
+def current() -> RequestMetrics | None:
+    return getattr(_local, "metrics", None)
+
+
+def start() -> RequestMetrics:
+    _local.metrics = RequestMetrics()
+    return _local.metrics
+
+
+def finish(**details: Any) -> dict[str, Any]:
+    metrics = current()
+    _local.metrics = None
+    sample = {**details, **(metrics.sample() if metrics else {})}
+    recent.append(sample)
+    return sample
+
+
+# adds the time spent in the block to the current request, if there is one
+@contextmanager
+def timed(kind: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics := current():
+            metrics.times[kind] += time.perf_counter() - started
+            if kind == "sql":
+                metrics.queries += 1
+            elif kind == "http":
+                metrics.http_requests += 1
@@ -0,0 +1,133 @@
+import re
+from collections.abc import Iterable
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from django.db import connection
+
+if TYPE_CHECKING:
+    from library.models import Book  # pragma: no cover
+
+TABLE = "library_book_search"
+
+# bm25 weights, in the same order as the columns below
+COLUMNS = {
+    "title": 10.0,
+    "subtitle": 4.0,
+    "edition_title": 8.0,
+    "series": 4.0,
+    "authors": 6.0,
+    "tags": 1.0,
+}
+
+
+@cache
+def fts5_supported() -> bool:
+    if connection.vendor != "sqlite":
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return "ENABLE_FTS5" in {row[0] for row in cursor.fetchall()}
+
+
+_known_tables: set[str] = set()
+
+
+def is_available() -> bool:
+    if connection.settings_dict["NAME"] in _known_tables:
+        return True
+    if fts5_supported() and TABLE in connection.introspection.table_names():
+        _known_tables.add(connection.settings_dict["NAME"])
+        return True
+    return False
+
+
+# the table is created by migration 0083; this is for databases built
+# without migrations, like the test database
+def create_table() -> None:
+    if not fts5_supported() or TABLE in connection.introspection.table_names():
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE {TABLE} USING fts5"
+            f"({', '.join(COLUMNS)}, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+
+
+def _row_for_book(book: "Book") -> list[int | str]:
+    authors = [book.first_author] if book.first_author else []
+    authors += list(book.additional_authors.all())
+
+    return [
+        book.pk,
+        book.title,
+        book.subtitle,
+        f"{book.edition_title} {book.edition_subtitle}".strip(),
+        book.series,
+        " ".join(
+            f"{author.forenames} {author.preferred_forenames} {author.surname}"
+            for author in authors
+        ),
+        " ".join(tag.name for tag in book.tags.all()),
+    ]
+
+
+def index_books(books: Iterable["Book"]) -> None:
+    if not is_available():
+        return
+
+    rows = [_row_for_book(book) for book in books]
+    if not rows:
+        return
+
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {TABLE} WHERE rowid = %s",  # noqa: S608
+            [row[0:1] for row in rows],
+        )
+        cursor.executemany(
+            f"INSERT INTO {TABLE} (rowid, {', '.join(COLUMNS)}) "  # noqa: S608
+            f"VALUES ({', '.join(['%s'] * (len(COLUMNS) + 1))})",
+            rows,
+        )
+
+
+def remove_book(book_id: int) -> None:
+    if not is_available():
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE rowid = %s", [book_id])  # noqa: S608
+
+
+def rebuild(books: Iterable["Book"]) -> None:
+    if not is_available():
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE}")  # noqa: S608
+    index_books(books)
+
+
+def build_query(pattern: str) -> str:
+    terms = re.findall(r"\w+", pattern.lower())
+    return " AND ".join(f'"{term}"*' for term in terms)
+
+
+# the arguments to QuerySet.extra() which join books to their index entries
+# matching `pattern`, most relevant first; entries left behind by books
+# which no longer exist join to nothing
+def match(pattern: str, book_table: str) -> dict[str, Any] | None:
+    if not (query := build_query(pattern)):
+        return None
+
+    weights = ", ".join(str(weight) for weight in COLUMNS.values())
+    return {
+        "tables": [TABLE],
+        "where": [f"{TABLE}.rowid = {book_table}.id", f"{TABLE} MATCH %s"],
+        "params": [query],
+        "select": {"search_rank": f"bm25({TABLE}, {weights})"},
+        "order_by": ["search_rank"],
+    }
@@ -0,0 +1,286 @@
+import random
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+import faker
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from library.models import (
+    Author,
+    AuthorNameToken,
+    Book,
+    BookAuthor,
+    LogEntry,
+    ReadingList,
+    ReadingListEntry,
+    ReadState,
+    StatisticsReport,
+    Tag,
+    TagClosure,
+    TagCooccurrence,
+)
+from library.utils import search_index
+
+BATCH_SIZE = 1000
+YEARS_OF_READING = 30
+
+GENDERS = [
+    (Author.Gender.MALE, 45),
+    (Author.Gender.FEMALE, 45),
+    (Author.Gender.NONBINARY, 3),
+    (Author.Gender.ORGANIZATION, 2),
+    (Author.Gender.UNKNOWN, 5),
+]
+FORMATS = [
+    (Book.Format.PAPERBACK, 50),
+    (Book.Format.HARDBACK, 20),
+    (Book.Format.EBOOK, 25),
+    (Book.Format.WEB, 2),
+    (Book.Format.UNKNOWN, 3),
+]
+
+
+class Generator:
+    # builds a plausible library of the given size with bulk inserts, then
+    # brings the derived tables (closures, read states, reports, search) up to
+    # date once at the end rather than via per-row signals
+    def __init__(self, book_count: int, seed: int = 0) -> None:
+        self.book_count = book_count
+        self.random = random.Random(seed)
+        self.fake = faker.Faker()
+        self.fake.seed_instance(seed)
+        self.today = timezone.now().date()
+
+    def generate(self) -> dict[str, int]:
+        with transaction.atomic(), StatisticsReport.objects.deferred():
+            owners = [
+                User.objects.get_or_create(username=username)[0]
+                for username in ["ben", "sara"]
+            ]
+            authors = self._authors()
+            tags = self._tags()
+            books = self._books(authors, owners)
+            self._editions(books)
+            self._additional_authors(books, authors)
+            self._book_tags(books, tags)
+            entries = self._log_entries(books)
+            lists = self._reading_lists(books)
+
+            TagClosure.objects.refresh([tag.name for tag in tags])
+            TagCooccurrence.objects.rebuild()
+            Tag.objects.clear_cloud()
+            Book.objects.clear_series_index()
+            Book.objects.clear_publisher_index()
+            Book.objects.filter(
+                id__in=[book.pk for book in books]
+            ).update_effective_owners()
+            ReadState.objects.rebuild()
+            search_index.index_books(
+                Book.objects.filter(id__in=[book.pk for book in books])
+                .select_related("first_author")
+                .prefetch_related("additional_authors", "tags")
+            )
+            StatisticsReport.objects.mark_dirty(
+                {entry.end_date.year for entry in entries if entry.end_date}
+            )
+        StatisticsReport.objects.regenerate_dirty()
+
+        return {
+            "authors": len(authors),
+            "tags": len(tags),
+            "books": len(books),
+            "log_entries": len(entries),
+            "reading_lists": len(lists),
+        }
+
+    def _weighted(self, choices: list[tuple[Any, int]]) -> Any:
+        values, weights = zip(*choices, strict=True)
+        return self.random.choices(values, weights)[0]
+
+    def _date(self, years_ago: int) -> date:
+        return self.today - timedelta(days=self.random.randint(0, years_ago * 365))
+
+    def _authors(self) -> list[Author]:
+        authors = [
+            Author(
+                surname=self.fake.last_name(),
+                forenames=self.fake.first_name(),
+                gender=self._weighted(GENDERS),
+                poc=self.random.random() < 0.2,
+                primary_language=self.random.choice(["en"] * 8 + ["fr", "de"]),
+            )
+            for _ in range(max(self.book_count // 3, 1))
+        ]
+        for index, author in enumerate(authors):
+            author.slug = f"{slugify(str(author))[:40]}-{index}"
+            author.update_name_keys()
+        authors = Author.objects.bulk_create(authors, batch_size=BATCH_SIZE)
+        AuthorNameToken.objects.refresh(authors)
+
+        # a few authors also write under another name
+        shuffled = self.random.sample(authors, len(authors))
+        pseudonyms, primaries = (
+            shuffled[: len(authors) // 20],
+            shuffled[len(authors) // 20 :],
+        )
+        for author in pseudonyms:
+            author.primary_identity = self.random.choice(primaries)
+        Author.objects.bulk_update(
+            pseudonyms, ["primary_identity"], batch_size=BATCH_SIZE
+        )
+        return authors
+
+    def _tags(self) -> list[Tag]:
+        roots = [Tag.objects.get(name) for name in ["fiction", "non-fiction"]]
+        names = {self.fake.word().lower() for _ in range(20 + self.book_count // 50)}
+        names -= set(Tag.objects.values_list("name", flat=True))
+        new_tags = Tag.objects.bulk_create([Tag(name=name) for name in sorted(names)])
+
+        # each tag hangs off a root or an earlier tag, so the tree gets deep
+        tags = roots + new_tags
+        Tag.parents.through.objects.bulk_create(
+            [
+                Tag.parents.through(
+                    from_tag_id=tag.name,
+                    to_tag_id=self.random.choice(tags[: max(index, 2)]).name,
+                )
+                for index, tag in enumerate(new_tags, start=2)
+                if self.random.random() < 0.7
+            ]
+        )
+        return tags
+
+    def _books(self, authors: list[Author], owners: list[User]) -> list[Book]:
+        series = [self.fake.catch_phrase() for _ in range(self.book_count // 20 + 1)]
+        publishers = [self.fake.company() for _ in range(self.book_count // 30 + 1)]
+
+        books = []
+        for index in range(self.book_count):
+            title = self.fake.sentence(nb_words=self.random.randint(1, 6)).rstrip(".")
+            owner = self.random.random()
+            book = Book(
+                title=title,
+                subtitle=self.fake.sentence() if self.random.random() < 0.2 else "",
+                slug=f"{slugify(title)[:40]}-{index}",
+                first_author=self.random.choice(authors),
+                first_published=self.random.randint(1850, self.today.year),
+                edition_format=self._weighted(FORMATS),
+                page_count=self.random.randint(80, 900),
+                publisher=self.random.choice(publishers),
+                isbn=self.fake.isbn13(separator=""),
+                owned_by=owners[0]
+                if owner < 0.55
+                else owners[1]
+                if owner < 0.6
+                else None,
+                was_borrowed=0.6 <= owner < 0.65,
+                want_to_read=self.random.random() < 0.8,
+                rating=self.random.randint(0, 10) / 2,
+                review=self.fake.paragraph() if self.random.random() < 0.1 else "",
+                private=self.random.random() < 0.02,
+            )
+            if book.owned_by:
+                # owned books need a format
+                book.edition_format = book.edition_format or Book.Format.PAPERBACK
+                book.acquired_date = self._date(YEARS_OF_READING)
+            if self.random.random() < 0.15:
+                book.series = self.random.choice(series)
+                book.series_order = self.random.randint(1, 12)
+            books.append(book)
+        return Book.objects.bulk_create(books, batch_size=BATCH_SIZE)
+
+    def _editions(self, books: list[Book]) -> None:
+        # later books are sometimes other editions of earlier ones, which may
+        # themselves be editions, giving chains a few deep
+        subeditions = []
+        for index, book in enumerate(books[1:], start=1):
+            if self.random.random() < 0.1:
+                parent = books[self.random.randrange(index)]
+                book.parent_edition = parent
+                book.title = parent.title
+                book.first_author = parent.first_author
+                subeditions.append(book)
+        Book.objects.bulk_update(
+            subeditions,
+            ["parent_edition", "title", "first_author"],
+            batch_size=BATCH_SIZE,
+        )
+
+    def _additional_authors(self, books: list[Book], authors: list[Author]) -> None:
+        rows = []
+        for book in books:
+            if self.random.random() >= 0.15:
+                continue
+            others = self.random.sample(authors, min(len(authors), 3))
+            for order, author in enumerate(others[: self.random.randint(1, 3)]):
+                if author.pk != book.first_author_id:
+                    rows.append(
+                        BookAuthor(
+                            book=book,
+                            author=author,
+                            order=order + 1,
+                            role=self.random.choice(["", "", "editor", "translator"]),
+                        )
+                    )
+        BookAuthor.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+    def _book_tags(self, books: list[Book], tags: list[Tag]) -> None:
+        through = Book.tags.through
+        rows = []
+        for book in books:
+            genre = tags[0] if self.random.random() < 0.6 else tags[1]
+            extra = self.random.sample(tags[2:], min(len(tags) - 2, 3))
+            rows += [
+                through(book_id=book.pk, tag_id=tag.name)
+                for tag in {genre, *extra[: self.random.randint(0, 3)]}
+            ]
+        through.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+    def _log_entries(self, books: list[Book]) -> list[LogEntry]:
+        entries = []
+        for book in books:
+            if self.random.random() >= 0.7:
+                continue
+            for _ in range(1 if self.random.random() < 0.9 else 2):
+                start = timezone.make_aware(
+                    datetime.combine(self._date(YEARS_OF_READING), time(12))
+                )
+                end = start + timedelta(days=self.random.randint(1, 60))
+                entries.append(
+                    LogEntry(
+                        book=book,
+                        start_date=start,
+                        end_date=end if end < timezone.now() else None,
+                        progress_date=min(end, timezone.now()),
+                        abandoned=self.random.random() < 0.05,
+                    )
+                )
+        return LogEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE)
+
+    def _reading_lists(self, books: list[Book]) -> list[ReadingList]:
+        lists = ReadingList.objects.bulk_create(
+            [
+                ReadingList(title=self.fake.catch_phrase())
+                for _ in range(self.book_count // 200 + 1)
+            ]
+        )
+        ReadingListEntry.objects.bulk_create(
+            [
+                ReadingListEntry(reading_list=reading_list, book=book, order=order)
+                for reading_list in lists
+                for order, book in enumerate(
+                    self.random.sample(
+                        books, min(len(books), self.random.randint(5, 30))
+                    )
+                )
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        return lists
+
+
+def generate(book_count: int, seed: int = 0) -> dict[str, int]:
+    return Generator(book_count, seed).generate()
@@ -2,9 +2,10 @@ import re
 from typing import TYPE_CHECKING
 from urllib.parse import quote_plus
 
-import requests
 from bs4 import BeautifulSoup
 
+from library.utils import http
+
 if TYPE_CHECKING:
     from library.models import Book  # pragma: no cover
 
@@ -29,7 +30,10 @@ def find_page(queries: list[str]) -> str:
     for query in queries:
         search_url = f"https://www.versobooks.com/search?q={quote_plus(query)}"
         search_results_page = BeautifulSoup(
-            requests.get(search_url, timeout=10).text, features="html.parser"
+            http.get(
+                search_url, is_miss=lambda response: "book-card" not in response.text
+            ).text,
+            features="html.parser",
         )
         search_results = search_results_page.find_all(class_="book-card")
         if len(search_results) == 1:
@@ -39,7 +43,7 @@ def find_page(queries: list[str]) -> str:
 
 
 def scrape_image(url: str) -> str:
-    page = BeautifulSoup(requests.get(url, timeout=10).text, features="html.parser")
+    page = BeautifulSoup(http.get(url).text, features="html.parser")
     if images := page.find_all(class_="edition-single--cover-image"):
         return str(images[-1].img["src"])
 
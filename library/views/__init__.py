@@ -6,6 +6,7 @@ from . import (  # noqa: F401
     book,
     importer,
     log_entry,
+    metrics,
     publisher,
     reading_list,
     report,
@@ -8,7 +8,8 @@ from django.urls import reverse_lazy
 from django.views import generic
 
 from library.forms import AuthorForm
-from library.models import Author
+from library.models import Author, AuthorQuerySet
+from library.utils import export
 
 
 class DetailView(generic.DetailView[Author]):
@@ -17,9 +18,13 @@ class DetailView(generic.DetailView[Author]):
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context["page_title"] = str(self.get_object())
-        context["books"] = self.get_object().books.filter(
-            private__in=(
-                [True, False] if self.request.user.is_authenticated else [False]
+        context["books"] = (
+            self.get_object()
+            .books.with_card_data()
+            .filter(
+                private__in=(
+                    [True, False] if self.request.user.is_authenticated else [False]
+                )
             )
         )
         context["books"] = context["books"].filter_by_request(self.request)
@@ -35,7 +40,8 @@ class IndexView(generic.ListView[Author]):
     paginate_by = 100
 
     def get_queryset(self) -> QuerySet[Author]:
-        qs: QuerySet[Author] = super().get_queryset()  # type: ignore[assignment]
+        qs: AuthorQuerySet = super().get_queryset()  # type: ignore[assignment]
+        qs = qs.with_book_summary()
         if gender := self.request.GET.get("gender"):
             if not gender.isnumeric():
                 gender = str(Author.Gender[gender.upper()])
@@ -96,14 +102,16 @@ def export_authors(request: HttpRequest) -> JsonResponse:
     page = int(request.GET.get("page", 1))
     count = 100
     start = (page - 1) * 100
-    authors = Author.objects.all()[start : start + count]
+    authors = Author.objects.annotate(has_books=export.has_books())[
+        start : start + count
+    ]
     result = {
         "page": page,
         "per_page": count,
         "total": Author.objects.count(),
         "total_pages": math.ceil(Author.objects.count() / count),
         "this_page": authors.count(),
-        "authors": [author.to_json() for author in authors if author.books.count()],
+        "authors": [author.to_json() for author in authors if author.has_books],
     }
 
     return JsonResponse(result)
@@ -5,8 +5,15 @@ from typing import Any
 
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.paginator import Paginator
 from django.db.models import F
-from django.http import HttpRequest, HttpResponse, HttpResponseNotFound, JsonResponse
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotFound,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
@@ -20,10 +27,11 @@ from library.forms import (
     ReadingListEntryFormSet,
 )
 from library.models import Book, BookQuerySet, Tag
-from library.utils import oxford_comma
+from library.utils import export, oxford_comma, str2bool
+from library.utils.keyset import KeysetPaginationMixin
 
 
-class IndexView(generic.ListView[Book]):
+class IndexView(KeysetPaginationMixin, generic.ListView[Book]):
     paginate_by = 100
 
     filter_by: dict[str, Any] = {}
@@ -33,13 +41,9 @@ class IndexView(generic.ListView[Book]):
     show_format_filters = False
 
     def get_queryset(self) -> BookQuerySet:
-        books = (
-            Book.objects.select_related("first_author")
-            .prefetch_related("additional_authors", "log_entries")
-            .filter(
-                private__in=(
-                    [True, False] if self.request.user.is_authenticated else [False]
-                )
+        books = Book.objects.with_card_data().filter(
+            private__in=(
+                [True, False] if self.request.user.is_authenticated else [False]
             )
         )
 
@@ -82,7 +86,7 @@ class IndexView(generic.ListView[Book]):
 
         if self.sort_by in field_names:
             if self.sort_by == "read_date":
-                self.sort_by = "log_entries__end_date"
+                books = books.annotate(read_date=F("read_state__last_read_date"))
 
             ordering = Book._meta.ordering or []  # noqa: SLF001
 
@@ -96,19 +100,26 @@ class IndexView(generic.ListView[Book]):
 
         return books
 
+    def get_paginator(self, *args: Any, **kwargs: Any) -> Paginator[Book]:
+        paginator = super().get_paginator(*args, **kwargs)
+        # already counted along with the other facets
+        paginator.count = self.facets["total"]  # type: ignore[misc]
+        return paginator
+
+    def get_keyset_count(self, _queryset: Any) -> int:
+        return int(self.facets["total"])
+
+    def get_facets(self) -> dict[str, Any]:
+        return self.object_list.facet_counts()  # type: ignore[attr-defined,no-any-return]
+
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        self.facets = self.get_facets()
+
         context = super().get_context_data(**kwargs)
         context["formats"] = Book.Format.choices
         context["format"] = self.kwargs.get("format")
-        context["counts"] = {
-            f: self.get_queryset().filter(edition_format=f).count()
-            for f, _ in context["formats"]
-        }
-        context["stats"] = {
-            "total": self.get_queryset().distinct().count(),
-            "owned": self.get_queryset().owned().count(),
-            "read": self.get_queryset().read().count(),
-        }
+        context["counts"] = self.facets["formats"]
+        context["stats"] = {key: self.facets[key] for key in ["total", "owned", "read"]}
 
         if tags := self.request.GET.get("tags"):
             context["tags"] = [
@@ -188,11 +199,25 @@ class PublisherIndexView(IndexView):
         self.publisher = self.kwargs["publisher"].replace("%2f", "/")
         return books.filter(publisher=self.publisher)
 
+    def get_facets(self) -> dict[str, Any]:
+        if (
+            self.filter_by
+            or self.kwargs.get("format")
+            or any(self.request.GET.get(name) for name in BookQuerySet.REQUEST_FILTERS)
+        ):
+            return super().get_facets()
+
+        # the publisher index has already counted every publisher's books
+        publishers = Book.objects.publisher_index(self.request.user.is_authenticated)
+        if self.publisher in publishers:
+            return publishers[self.publisher]
+        return super().get_facets()
+
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context[
             "page_title"
-        ] = f"Books published by {self.publisher} ({self.get_queryset().count()} books)"
+        ] = f"Books published by {self.publisher} ({self.facets['total']} books)"
         return context
 
 
@@ -206,9 +231,7 @@ class TagIndexView(IndexView):
         if len(tags) == 1 and tags[0].endswith("!"):
             tag = get_object_or_404(Tag, name=tags[0][0:-1])
             return tag.books_uniquely_tagged
-        for tag_name in tags:
-            books &= Tag.objects.get(name=tag_name).books_recursive
-        return books
+        return books.tagged(*tags)
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -219,7 +242,7 @@ class TagIndexView(IndexView):
         ]
         context[
             "page_title"
-        ] = f"{self.get_queryset().count()} books tagged {'only ' if '!' in self.kwargs['tag_name'] else ''}{oxford_comma([t.name for t in context['tags']])}"
+        ] = f"{self.facets['total']} books tagged {'only ' if '!' in self.kwargs['tag_name'] else ''}{oxford_comma([t.name for t in context['tags']])}"
         return context
 
 
@@ -434,7 +457,7 @@ def export_books(request: HttpRequest) -> JsonResponse:
     page = int(request.GET.get("page", 1))
     count = 100
     start = (page - 1) * 100
-    books = Book.objects.all()[start : start + count]
+    books = Book.objects.with_export_data()[start : start + count]
     result = {
         "page": page,
         "per_page": count,
@@ -445,3 +468,14 @@ def export_books(request: HttpRequest) -> JsonResponse:
     }
 
     return JsonResponse(result)
+
+
+def export_library(request: HttpRequest) -> StreamingHttpResponse:
+    compress = str2bool(request.GET.get("gzip", "false"))
+    response = StreamingHttpResponse(
+        export.stream(compress),
+        content_type="application/gzip" if compress else "application/x-ndjson",
+    )
+    filename = "library.ndjson.gz" if compress else "library.ndjson"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -5,13 +5,13 @@ import re
 from typing import Any
 
 from django.contrib.auth.decorators import login_required
-from django.http import HttpRequest, HttpResponse
-from django.shortcuts import redirect
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
 from django.utils import timezone
 
-from library.models import Book
-from library.utils import create, flatten, goodreads, importer
+from library.models import Book, ImportJob
+from library.utils import create, flatten, goodreads, importer, lookups
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +67,7 @@ def bulk_import(request: HttpRequest) -> HttpResponse:
             reader = csv.DictReader(
                 lines[1:], fieldnames=[n.lower() for n in lines[0].split(",")]
             )
-            importer.process(
+            job = importer.process(
                 [
                     {
                         "title": entry["title"].strip().split(":")[0],
@@ -107,18 +107,17 @@ def bulk_import(request: HttpRequest) -> HttpResponse:
             )
 
         elif request.POST["input_format"] == "verso":
+            # check the database here, then look up what's new side by side
+            new = [found for line in lines if line and (found := _verso_find(line))]
             records = []
-            for line in lines:
-                if not line:
-                    continue
-                book = _verso_bulk_import(line)
+            for book in lookups.map_concurrently(_verso_lookup, new):
                 if not book:
                     continue
                 book["edition_format"] = Book.Format.EBOOK
                 book["publisher"] = "Verso"
                 book["owned"] = True
                 records.append(book)
-            importer.process(records)
+            job = importer.process(records)
         else:
             records = []
             for line in lines:
@@ -134,7 +133,7 @@ def bulk_import(request: HttpRequest) -> HttpResponse:
                     continue
 
                 records.append({"title": title.strip(), "authors": authors})
-            importer.process(records)
+            job = importer.process(records)
 
         return TemplateResponse(
             request,
@@ -142,6 +141,7 @@ def bulk_import(request: HttpRequest) -> HttpResponse:
             {
                 "page_title": "Import",
                 "data": data,
+                "job": job,
             },
         )
 
@@ -152,12 +152,18 @@ def bulk_import(request: HttpRequest) -> HttpResponse:
     )
 
 
-def _verso_bulk_import(line: str) -> dict[str, Any] | None:
+@login_required
+def import_progress(_request: HttpRequest, pk: int) -> JsonResponse:
+    return JsonResponse(get_object_or_404(ImportJob, pk=pk).progress())
+
+
+# marks the line's book owned if it's already here, otherwise returns its
+# title, authors and isbn to look up
+def _verso_find(line: str) -> tuple[str, list[str], str] | None:
     title, _, isbn = line.rsplit(", ", 2)
     _, title = title.strip().split(" ", 1)
     title, *author_names = re.split(r" (?:Edited )*?by ", title, maxsplit=1)
-    if author_names:
-        authors = flatten(author.split(" and ") for author in author_names)
+    authors = flatten(author.split(" and ") for author in author_names)
 
     try:
         book = Book.objects.get(title__istartswith=title.lower())
@@ -178,7 +184,12 @@ def _verso_bulk_import(line: str) -> dict[str, Any] | None:
         return None  # noqa: TRY300
     except Book.DoesNotExist:
         logger.warning("no book named %s in the database, continuing", title)
+    return (title, authors, isbn)
+
 
+# only makes requests, so runs on a worker thread
+def _verso_lookup(found: tuple[str, list[str], str]) -> dict[str, Any] | None:
+    title, authors, isbn = found
     if goodreads_book := goodreads.find(isbn):
         goodreads_book["isbn"] = isbn
         found_title, *_ = goodreads_book["title"].split(": ", 1)
@@ -10,10 +10,12 @@ from django.utils.feedgenerator import Atom1Feed
 from django.views import generic
 
 from library.models import LogEntry, LogEntryQuerySet
+from library.models.book import authorships_prefetch
 from library.utils import is_authenticated
+from library.utils.keyset import KeysetPaginationMixin
 
 
-class GenericLogView(generic.ListView[LogEntry]):
+class GenericLogView(KeysetPaginationMixin, generic.ListView[LogEntry]):
     context_object_name = "entries"
 
     filter_by: dict[str, Any] = {}
@@ -23,8 +25,7 @@ class GenericLogView(generic.ListView[LogEntry]):
 
     def get_queryset(self) -> LogEntryQuerySet:
         entries = (
-            LogEntry.objects.select_related("book", "book__first_author")
-            .prefetch_related("book__additional_authors", "book__log_entries")
+            LogEntry.objects.with_card_data()
             .filter(
                 book__private__in=(
                     [True, False] if is_authenticated(self.request) else [False]
@@ -61,6 +62,10 @@ class GenericLogView(generic.ListView[LogEntry]):
         context["year"] = self.kwargs.get("year")
         context["verbose"] = "verbose" in self.request.GET
         context["current_year"] = timezone.now().year
+        # later pages and years are loaded as the reader scrolls down
+        context["infinite_scroll"] = (
+            not context["year"] or self.request.GET.get("infinite") == "true"
+        )
         return context
 
 
@@ -76,12 +81,19 @@ class ReadView(GenericLogView):
     filter_by = {"end_date__isnull": False, "abandoned": False}
     page_title = "Read Books"
     single_year = True
+    # infinite scroll loads the rest of a long year a page at a time
+    keyset_pagination = True
 
 
 class MarkdownReadView(ReadView):
     template_name = "logentry_list_markdown.md"
     content_type = "text/plain; charset=utf-8"
     single_year = False
+    keyset_pagination = False
+
+    def get_queryset(self) -> LogEntryQuerySet:
+        # display_details compares each book with its other editions
+        return super().get_queryset().prefetch_related("book__alternate_editions")
 
 
 class XmlReadView(Feed[Any, Any]):
@@ -93,7 +105,9 @@ class XmlReadView(Feed[Any, Any]):
     def get_object(self, request: HttpRequest) -> LogEntryQuerySet:  # type: ignore[override]
         return (
             LogEntry.objects.select_related("book", "book__first_author")
-            .prefetch_related("book__additional_authors", "book__log_entries")
+            .prefetch_related(
+                authorships_prefetch("book__"), "book__log_entries", "book__tags"
+            )
             .filter(
                 book__private__in=(
                     [True, False] if is_authenticated(request) else [False]
@@ -0,0 +1,18 @@
+import os
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpRequest, JsonResponse
+from django.views.decorators.http import require_GET
+
+from library.utils import metrics
+
+
+@require_GET
+@staff_member_required
+def recent_requests(request: HttpRequest) -> JsonResponse:
+    samples = list(metrics.recent)
+    if view := request.GET.get("view"):
+        samples = [sample for sample in samples if sample.get("view") == view]
+
+    # only this worker's requests; see metrics.recent
+    return JsonResponse({"worker": os.getpid(), "requests": samples[::-1]})
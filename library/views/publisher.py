@@ -5,20 +5,10 @@ from library.models import Book
 
 
 def index(request: HttpRequest) -> HttpResponse:
-    publisher_books = Book.objects.exclude(publisher="").filter(
-        private__in=([True, False] if request.user.is_authenticated else [False])
-    )
-
-    counts = {}
-    for book in publisher_books:
-        publisher = book.publisher
-        if publisher not in counts:
-            counts[publisher] = 0
-
-        counts[publisher] += 1
+    publishers = Book.objects.publisher_index(request.user.is_authenticated)
 
     return TemplateResponse(
         request,
         "publisher_list.html",
-        {"publishers": counts, "count": len(counts.keys())},
+        {"publishers": publishers, "count": len(publishers)},
     )
@@ -6,6 +6,7 @@ from django.views import generic
 
 from library.forms import ReadingListForm
 from library.models import ReadingList
+from library.models.book import authorships_prefetch
 
 
 class IndexView(generic.ListView[ReadingList]):
@@ -23,7 +24,14 @@ class DetailView(generic.DetailView[ReadingList]):
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        context.update({"page_title": self.object.title})
+        context.update(
+            {
+                "page_title": self.object.title,
+                "entries": self.object.readinglistentry_set.select_related(
+                    "book__first_author", "book__effective_owner", "book__read_state"
+                ).prefetch_related(authorships_prefetch("book__")),
+            }
+        )
 
         return context
 
@@ -1,15 +1,13 @@
 from collections.abc import Callable
-from itertools import groupby
 from typing import Any
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import F, Q
+from django.db.models import Count, F, Prefetch, Q
 from django.http import HttpRequest, HttpResponse
 from django.template.response import TemplateResponse
 from django.views import generic
 
-from library.models import Author, Book, BookQuerySet, Tag
-from library.utils import flatten
+from library.models import Author, Book, BookQuerySet, Tag, TagCooccurrence
 
 ebook_publishers = {
     "Verso",
@@ -211,7 +209,15 @@ def tags(request: HttpRequest, base_tag: str = "non-fiction") -> HttpResponse:
     if base_tag not in ["fiction", "non-fiction"]:
         excluded_tags |= {"fiction", "non-fiction"}
 
-    toplevel_tags = Tag.objects.exclude(books__isnull=True)
+    # the template groups each tag's books by their tags and names their authors
+    toplevel_tags = Tag.objects.exclude(books__isnull=True).prefetch_related(
+        Prefetch(
+            "books",
+            queryset=Book.objects.select_related("first_author").prefetch_related(
+                "tags"
+            ),
+        )
+    )
 
     results = {tag.name: tag.books.all() for tag in toplevel_tags}
 
@@ -228,20 +234,23 @@ def related_tags(request: HttpRequest, base_tag: str = "non-fiction") -> HttpRes
     if base_tag not in ["fiction", "non-fiction"]:
         excluded_tags |= {"fiction", "non-fiction"}
 
-    toplevel_tags = Tag.objects.exclude(books__isnull=True)
-
-    results = {}
-    for tag in toplevel_tags:
-        tagged_books = tag.books.all()
-        related = sorted(flatten([book.tags.all() for book in tagged_books]))
-        results[tag.name] = {
-            related_tag.name: len(list(books))
-            for related_tag, books in groupby(related)
-        }
-        results[tag.name]["total"] = tagged_books.count()
-        results[tag.name][tag.name] = len(
-            [book for book in tagged_books if book.tags.count() > 2]
+    # each tag with books, how many of them share each other tag, and how
+    # many have more than two tags
+    results: dict[str, dict[str, int]] = TagCooccurrence.objects.matrix()
+    for tag_name, tagged in results.items():
+        tagged["total"] = tagged[tag_name]
+        tagged[tag_name] = 0
+    for tag_name, count in (
+        Book.tags.through.objects.filter(
+            book__in=Book.objects.annotate(tag_count=Count("tags")).filter(
+                tag_count__gt=2
+            )
         )
+        .values("tag")
+        .annotate(count=Count("book"))
+        .values_list("tag", "count")
+    ):
+        results[tag_name][tag_name] = count
 
     return TemplateResponse(
         request,
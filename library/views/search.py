@@ -16,10 +16,16 @@ def basic_search(request: HttpRequest) -> HttpResponse:
             books := Book.objects.filter(Q(isbn=query) | Q(asin=query))
         ) and books.count() == 1:
             return redirect(books[0])
-        books = Book.objects.search(query).filter(
-            private__in=([True, False] if request.user.is_authenticated else [False])
+        books = (
+            Book.objects.search(query)
+            .filter(
+                private__in=(
+                    [True, False] if request.user.is_authenticated else [False]
+                )
+            )
+            .with_card_data()
         )
-        authors = Author.objects.search(query)
+        authors = Author.objects.search(query).with_book_summary()
 
     return TemplateResponse(
         request,
@@ -43,15 +43,11 @@ def stats_index(request: HttpRequest) -> HttpResponse:
         "4": "non-binary people",
     }
 
-    years = [
-        0,
-        *list(
-            StatisticsReport.objects.exclude(year=0)
-            .order_by("year")
-            .reverse()
-            .values_list("year", flat=True)
-        ),
-    ]
+    # all time first, then newest first; the worker may not have built any yet
+    years = sorted(
+        StatisticsReport.objects.values_list("year", flat=True),
+        key=lambda year: (year != 0, -year),
+    )
     reports = [_get_stats_object(year, current_year) for year in years]
 
     return render(